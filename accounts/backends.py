@@ -3,7 +3,24 @@ from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import User
 
 
-class EmailAuthenticationBackend(ModelBackend):
+class SubscriberProfileMixin:
+    """
+    Carrega o ``UserProfile`` na mesma consulta do usuário da sessão.
+
+    O ``AuthenticationMiddleware`` obtém ``request.user`` por ``get_user`` do
+    backend usado no login; com o perfil já carregado, as decisões de paywall
+    (``user.userprofile.is_subscriber``) não custam consultas extras.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = User._default_manager.select_related('userprofile').get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class EmailAuthenticationBackend(SubscriberProfileMixin, ModelBackend):
     """
     Custom authentication backend that allows users to log in with email only.
     """
@@ -25,3 +42,7 @@ class EmailAuthenticationBackend(ModelBackend):
             return user
         
         return None
+
+
+class UsernameAuthenticationBackend(SubscriberProfileMixin, ModelBackend):
+    """Login padrão do Django (nome de usuário), com o perfil carregado junto."""
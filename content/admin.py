@@ -9,6 +9,7 @@ class VideoShortAdmin(admin.ModelAdmin):
     list_filter = ('is_featured', 'created_at')
     search_fields = ('title', 'description')
     list_editable = ('order',)
+    list_select_related = ('thumbnail_image',)
     ordering = ('order', '-created_at')
     
     fieldsets = (
@@ -0,0 +1,135 @@
+"""
+Corpo dos artigos pré-renderizado.
+
+Renderizar ``content_blocks`` bloco a bloco (richtext, imagens, embeds) é a
+parte mais cara da página do artigo. Ao publicar, o corpo completo (visto por
+assinantes e em artigos gratuitos) e a prévia do paywall são renderizados uma
+vez e guardados em ``ArticlePage`` junto com a revisão de origem. A página
+usa o HTML guardado enquanto ele corresponder à revisão publicada; caso
+contrário (prévias do admin, artigos ainda não processados) renderiza na hora.
+
+A prévia é extraída só dos primeiros blocos (``PAYWALL_PREVIEW_BLOCKS``) e
+limitada a ``PAYWALL_PREVIEW_WORDS`` palavras no total; o corpo completo nunca
+é percorrido para montá-la. Leitores sem assinatura de artigos premium não
+carregam as colunas do corpo (ver ``ArticleListingMixin.route``).
+
+O comando ``render_article_bodies`` processa o acervo existente.
+"""
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+from django.utils.safestring import mark_safe
+from django.utils.text import Truncator
+from wagtail.rich_text import expand_db_html
+
+
+BODY_TEMPLATE = 'content/partials/article_body.html'
+PREVIEW_TEMPLATE = 'content/partials/article_preview.html'
+
+
+# Blocos do corpo com imagem do Wagtail: tipo -> chave da imagem no valor (None: o próprio valor)
+BODY_IMAGE_BLOCKS = {'image': None, 'image_with_caption': 'image', 'image_url': 'image'}
+
+
+def body_image_ids(page):
+    """Ids das imagens usadas no corpo de ``page``, sem converter os blocos."""
+    image_ids = []
+    for raw in page.content_blocks.raw_data if page.content_blocks else ():
+        if raw['type'] not in BODY_IMAGE_BLOCKS:
+            continue
+        key = BODY_IMAGE_BLOCKS[raw['type']]
+        value = raw['value'] if key is None else (raw['value'] or {}).get(key)
+        if value:
+            image_ids.append(value)
+    return list(dict.fromkeys(image_ids))
+
+
+def body_gif_urls(page):
+    """URLs dos blocos ``gif`` do corpo de ``page``, sem converter os blocos."""
+    urls = [
+        (raw['value'] or {}).get('gif_url')
+        for raw in (page.content_blocks.raw_data if page.content_blocks else ())
+        if raw['type'] == 'gif'
+    ]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+def body_video_urls(page):
+    """URLs dos blocos ``video`` (embeds) do corpo de ``page``, sem converter os blocos."""
+    urls = [
+        raw['value']
+        for raw in (page.content_blocks.raw_data if page.content_blocks else ())
+        if raw['type'] == 'video'
+    ]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+def render_article_body(page):
+    return render_to_string(BODY_TEMPLATE, {'page': page})
+
+
+def _truncate(html, words):
+    """Corta ``html`` em ``words`` palavras; devolve o trecho e as palavras usadas."""
+    truncated = Truncator(html).words(words, html=True)
+    return mark_safe(truncated), len(strip_tags(truncated).split())
+
+
+def extract_preview(page, blocks=None, words=None):
+    """
+    Trechos da prévia do paywall.
+
+    Considera apenas os ``blocks`` primeiros blocos de ``content_blocks`` (só
+    os parágrafos entram na prévia) ou, em artigos legados, o início de
+    ``body``, até somar ``words`` palavras.
+
+    Returns:
+        dict: ``paragraphs`` (lista de HTML) e ``legacy_preview``
+    """
+    if blocks is None:
+        blocks = getattr(settings, 'PAYWALL_PREVIEW_BLOCKS', 2)
+    if words is None:
+        words = getattr(settings, 'PAYWALL_PREVIEW_WORDS', 60)
+
+    paragraphs = []
+    legacy_preview = ''
+    if page.content_blocks:
+        # raw_data evita converter os demais blocos do artigo
+        raw_data = page.content_blocks.raw_data
+        for index in range(min(blocks, len(raw_data))):
+            raw = raw_data[index]
+            if words <= 0:
+                break
+            if raw['type'] != 'paragraph':
+                continue
+            html, used = _truncate(expand_db_html(raw['value']), words)
+            paragraphs.append(html)
+            words -= used
+    elif page.body:
+        legacy_preview, _ = _truncate(expand_db_html(page.body), words)
+
+    return {'paragraphs': paragraphs, 'legacy_preview': legacy_preview}
+
+
+def render_article_preview(page):
+    return render_to_string(PREVIEW_TEMPLATE, extract_preview(page))
+
+
+def store_rendered_body(page):
+    """
+    Renderiza e guarda o corpo e a prévia da revisão publicada de ``page``.
+
+    Grava com ``update`` para não disparar sinais nem criar revisões.
+    """
+    from content.models import ArticlePage
+
+    rendered = {
+        'rendered_body': render_article_body(page),
+        'rendered_preview': render_article_preview(page),
+        'rendered_revision_id': page.live_revision_id,
+        'rendered_at': timezone.now(),
+    }
+    ArticlePage.objects.filter(pk=page.pk).update(**rendered)
+    for name, value in rendered.items():
+        setattr(page, name, value)
@@ -0,0 +1,430 @@
+"""
+Benchmarks de renderização das páginas do portal.
+
+``build_synthetic_archive`` monta uma árvore Wagtail sintética e isolada:
+uma HomePage servida pelo host ``BENCHMARK_HOSTNAME``, uma SectionPage para
+cada seção de ``ArticlePage.SECTION_CHOICES``, uma VideosPage e de 10 mil a
+500 mil artigos com tags, imagens e corpo em StreamField. Os artigos são
+gravados em lote (caminhos da árvore calculados aqui), sem ``add_child``.
+
+``run_benchmarks`` mede latência, número de consultas e pico de memória de
+cada cenário com o cliente de testes do Django, e devolve um dicionário
+pronto para ser salvo em JSON e comparado entre commits com
+``compare_results``.
+"""
+
+import io
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+import uuid
+from datetime import timedelta
+
+import django
+import wagtail
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.images import ImageFile
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+BENCHMARK_HOSTNAME = 'benchmark.localhost'
+BENCHMARK_SLUG = 'benchmark-archive'
+BENCHMARK_SUBSCRIBER = 'benchmark-subscriber'
+# Prefixo dos links dos shorts: com o índice de 6 dígitos, ids válidos de 11 caracteres
+BENCHMARK_VIDEO_URL = 'https://www.youtube.com/shorts/bench'
+
+# Formato do arquivo de resultados; mude ao alterar a estrutura do JSON
+RESULTS_VERSION = 1
+
+WORDS = (
+    'análise mercado governo clima energia tecnologia acordo crise eleição '
+    'inflação juros exportação conflito diplomacia inovação dados rede '
+    'política reforma investimento petróleo chuva seca tratado cúpula'
+).split()
+
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _stream_body(rng, paragraphs):
+    """Corpo em StreamField com parágrafos, títulos, citação e lista."""
+    body = []
+    for index in range(paragraphs):
+        if index and index % 4 == 0:
+            body.append({'type': 'heading', 'value': _sentence(rng, 5), 'id': str(uuid.uuid4())})
+        body.append({
+            'type': 'paragraph',
+            'value': f'<p>{" ".join(_sentence(rng) for _ in range(5))}</p>',
+            'id': str(uuid.uuid4()),
+        })
+    body.append({
+        'type': 'quote',
+        'value': {'text': _sentence(rng), 'author': rng.choice(WORDS).title()},
+        'id': str(uuid.uuid4()),
+    })
+    body.append({
+        'type': 'list',
+        'value': [{'type': 'item', 'value': _sentence(rng, 4), 'id': str(uuid.uuid4())} for _ in range(3)],
+        'id': str(uuid.uuid4()),
+    })
+    return body
+
+
+def _image_file(rng, index, size=(1200, 800)):
+    from PIL import Image as PILImage
+
+    color = tuple(rng.randrange(256) for _ in range(3))
+    buffer = io.BytesIO()
+    PILImage.new('RGB', size, color).save(buffer, format='JPEG', quality=80)
+    return ImageFile(buffer, name=f'benchmark-{index}.jpg')
+
+
+def get_benchmark_home():
+    from content.models import HomePage
+
+    return HomePage.objects.filter(slug=BENCHMARK_SLUG, depth=2).first()
+
+
+def delete_synthetic_archive():
+    """Remove a árvore sintética, o site, as mídias e o assinante de benchmark."""
+    from django.contrib.auth.models import User
+    from wagtail.images import get_image_model
+    from wagtail.models import Site
+
+    from content.models import VideoShort
+
+    home = get_benchmark_home()
+    if home is not None:
+        Site.objects.filter(root_page=home).delete()
+        home.delete()
+    VideoShort.objects.filter(video_url__startswith=BENCHMARK_VIDEO_URL).delete()
+    for image in get_image_model().objects.filter(file__startswith='original_images/benchmark-'):
+        image.delete()
+    User.objects.filter(username=BENCHMARK_SUBSCRIBER).delete()
+
+
+def _add_section_children(section, articles, content_type, now):
+    """
+    Cria as linhas de ``Page`` dos artigos de uma seção em lote.
+
+    Returns:
+        list: Páginas criadas, na mesma ordem de ``articles``
+    """
+    from wagtail.models import Page
+
+    pages = []
+    for step, article in enumerate(articles, start=section.numchild + 1):
+        pages.append(Page(
+            title=article['title'],
+            draft_title=article['title'],
+            slug=article['slug'],
+            content_type=content_type,
+            path=Page._get_path(section.path, section.depth + 1, step),
+            depth=section.depth + 1,
+            numchild=0,
+            url_path=f'{section.url_path}{article["slug"]}/',
+            locale_id=section.locale_id,
+            live=True,
+            has_unpublished_changes=False,
+            first_published_at=now,
+            last_published_at=now,
+        ))
+    Page.objects.bulk_create(pages)
+    section.numchild += len(pages)
+    Page.objects.filter(pk=section.pk).update(numchild=section.numchild)
+    return pages
+
+
+def build_synthetic_archive(articles=10000, images=50, tags=200, videos=30,
+                            paragraphs=12, premium_ratio=0.3, seed=0,
+                            batch_size=1000, stdout=None):
+    """
+    Monta a árvore sintética, substituindo uma existente.
+
+    Returns:
+        HomePage: Raiz da árvore sintética
+    """
+    from django.contrib.auth.models import User
+    from taggit.models import Tag
+    from wagtail.images import get_image_model
+    from wagtail.models import Page, Site
+
+    from content.models import ArticlePage, ArticlePageTag, HomePage, SectionPage, VideoShort, VideosPage
+    from content.renditions import ARTICLE_IMAGE_SPECS, generate_renditions
+
+    def log(message):
+        if stdout is not None:
+            stdout.write(message)
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    delete_synthetic_archive()
+
+    home = HomePage(title='Benchmark', slug=BENCHMARK_SLUG)
+    Page.get_first_root_node().add_child(instance=home)
+    Site.objects.create(hostname=BENCHMARK_HOSTNAME, port=80, root_page=home, site_name='Benchmark')
+
+    sections = {}
+    for key, title in ArticlePage.SECTION_CHOICES:
+        section = SectionPage(title=title, slug=f'{key}-benchmark', section_key=key)
+        # section_key é único: seções reais do site não podem ser duplicadas
+        if SectionPage.objects.filter(section_key=key).exists():
+            log(f'Seção "{key}" já existe fora do benchmark; artigos dela ficam na home')
+            sections[key] = home
+            continue
+        home.add_child(instance=section)
+        sections[key] = section
+    home.add_child(instance=VideosPage(title='Vídeos', slug='videos'))
+
+    Image = get_image_model()
+    image_ids = [
+        Image.objects.create(title=f'Benchmark {index}', file=_image_file(rng, index)).pk
+        for index in range(images)
+    ]
+    generate_renditions(image_ids, ARTICLE_IMAGE_SPECS)
+    log(f'{len(image_ids)} imagens com renditions')
+
+    Tag.objects.bulk_create(
+        [Tag(name=f'benchmark-{index}', slug=f'benchmark-{index}') for index in range(tags)],
+        ignore_conflicts=True,
+    )
+    tag_ids = list(Tag.objects.filter(slug__startswith='benchmark-').values_list('pk', flat=True))
+
+    shorts = [
+        VideoShort(
+            title=_sentence(rng, 4)[:100],
+            video_url=f'{BENCHMARK_VIDEO_URL}{index:06d}',
+            thumbnail_image_id=rng.choice(image_ids) if image_ids else None,
+            is_featured=index < 6,
+            order=index,
+        )
+        for index in range(videos)
+    ]
+    # bulk_create não chama save(): preenche os campos derivados do link
+    for short in shorts:
+        short.refresh_video_metadata()
+    VideoShort.objects.bulk_create(shorts)
+
+    content_type = ContentType.objects.get_for_model(ArticlePage)
+    section_keys = [key for key, _ in ArticlePage.SECTION_CHOICES]
+    created = 0
+    while created < articles:
+        batch = []
+        for index in range(created, min(created + batch_size, articles)):
+            batch.append({
+                'title': _sentence(rng, 6)[:250],
+                'slug': f'artigo-{index}',
+                'section': section_keys[index % len(section_keys)],
+                # Artigo 0 é o mais recente; um a cada 500 é destaque
+                'publication_date': now - timedelta(minutes=index * 7),
+                'is_featured_highlight': index % 500 == 0,
+                'is_premium': rng.random() < premium_ratio,
+            })
+
+        with transaction.atomic():
+            for key in section_keys:
+                rows = [article for article in batch if article['section'] == key]
+                if not rows:
+                    continue
+                pages = _add_section_children(sections[key], rows, content_type, now)
+                tagged = []
+                for page, article in zip(pages, rows):
+                    ArticlePage(
+                        page_ptr_id=page.pk,
+                        introduction=f'<p>{_sentence(rng, 20)}</p>',
+                        content_blocks=_stream_body(rng, paragraphs),
+                        featured_image_id=rng.choice(image_ids) if image_ids else None,
+                        section=article['section'],
+                        publication_date=article['publication_date'],
+                        is_featured_highlight=article['is_featured_highlight'],
+                        is_premium=article['is_premium'],
+                    ).save_base(raw=True, force_insert=True)
+                    tagged.extend(
+                        ArticlePageTag(content_object_id=page.pk, tag_id=tag_id)
+                        for tag_id in rng.sample(tag_ids, min(3, len(tag_ids)))
+                    )
+                ArticlePageTag.objects.bulk_create(tagged)
+
+        created += len(batch)
+        log(f'{created}/{articles} artigos')
+
+    subscriber = User.objects.create_user(BENCHMARK_SUBSCRIBER)
+    subscriber.userprofile.is_subscriber = True
+    subscriber.userprofile.save()
+
+    return home
+
+
+def get_scenarios(home):
+    """
+    Cenários medidos: (nome, caminho, usa assinante?).
+
+    O artigo medido é o premium mais recente, para que assinante e anônimo
+    vejam versões diferentes (conteúdo completo e paywall). A página do artigo
+    é a mesma casca cacheada para todos; o conteúdo completo do assinante vem
+    do fragmento ``article_reader_fragment``, medido à parte.
+    """
+    from django.urls import reverse
+
+    from content.models import ArticlePage, SectionPage, VideosPage
+
+    def path(page):
+        return page.url_path[len(home.url_path) - 1:]
+
+    section = SectionPage.objects.child_of(home).order_by('path').first()
+    article = (
+        ArticlePage.objects.descendant_of(home).live()
+        .filter(is_premium=True).order_by('-publication_date').first()
+        or ArticlePage.objects.descendant_of(home).live().order_by('-publication_date').first()
+    )
+    videos = VideosPage.objects.child_of(home).first()
+
+    scenarios = [('home', '/', False)]
+    if section is not None:
+        scenarios.append(('section', path(section), False))
+    if article is not None:
+        scenarios.append(('article_anonymous', path(article), False))
+        scenarios.append(('article_subscriber', path(article), True))
+        scenarios.append((
+            'article_reader_subscriber', reverse('article_reader_fragment', args=[article.pk]), True,
+        ))
+    if videos is not None:
+        scenarios.append(('videos', path(videos), False))
+    return scenarios
+
+
+def _summary(values):
+    ordered = sorted(values)
+    return {
+        'min': round(ordered[0], 3),
+        'median': round(statistics.median(ordered), 3),
+        'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        'max': round(ordered[-1], 3),
+        'mean': round(statistics.fmean(ordered), 3),
+    }
+
+
+def measure(client, path, iterations=20, warmup=2):
+    """
+    Mede um caminho: latência e consultas de cada requisição e, em uma
+    requisição extra com tracemalloc, o pico de memória.
+    """
+    for _ in range(warmup):
+        client.get(path)
+
+    latencies = []
+    queries = []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured))
+
+    # tracemalloc atrasa a requisição; por isso fica fora da medição de latência
+    tracemalloc.start()
+    try:
+        client.get(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'path': path,
+        'status': response.status_code,
+        'bytes': len(response.content),
+        'latency_ms': _summary(latencies),
+        'queries': _summary(queries),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(iterations=20, warmup=2, page_cache=False, only=None):
+    """
+    Executa os cenários sobre a árvore sintética.
+
+    Args:
+        page_cache: Mantém o cache de páginas anônimas; por padrão ele fica
+            desligado e mede-se a renderização completa
+        only: Nomes de cenários a executar (padrão: todos)
+
+    Returns:
+        dict: ``meta`` (commit, versões, tamanho do acervo) e ``results``
+    """
+    from django.contrib.auth.models import User
+
+    from content.models import ArticlePage
+
+    home = get_benchmark_home()
+    if home is None:
+        raise RuntimeError('Árvore de benchmark inexistente: rode build_benchmark_archive')
+
+    overrides = {'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, BENCHMARK_HOSTNAME]}
+    if not page_cache:
+        overrides['PAGE_CACHE_TIMEOUT'] = 0
+
+    anonymous = Client(HTTP_HOST=BENCHMARK_HOSTNAME)
+    subscriber = Client(HTTP_HOST=BENCHMARK_HOSTNAME)
+    subscriber.force_login(User.objects.get(username=BENCHMARK_SUBSCRIBER))
+
+    results = {}
+    with override_settings(**overrides):
+        for name, path, as_subscriber in get_scenarios(home):
+            if only and name not in only:
+                continue
+            client = subscriber if as_subscriber else anonymous
+            results[name] = measure(client, path, iterations=iterations, warmup=warmup)
+
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'commit': _git_commit(),
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'wagtail': wagtail.__version__,
+            'database': connection.vendor,
+            'articles': ArticlePage.objects.descendant_of(home).count(),
+            'iterations': iterations,
+            'page_cache': page_cache,
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current):
+    """
+    Diferenças por cenário entre dois resultados.
+
+    Returns:
+        list: (cenário, mediana de latência antes/depois, consultas antes/depois)
+    """
+    rows = []
+    for name, result in current['results'].items():
+        before = baseline.get('results', {}).get(name)
+        if before is None:
+            continue
+        rows.append((
+            name,
+            before['latency_ms']['median'], result['latency_ms']['median'],
+            before['queries']['median'], result['queries']['median'],
+        ))
+    return rows
@@ -1,16 +1,18 @@
 """Context processors compartilhados entre os templates do projeto."""
 
-from content.models import HomePage
+from content.navigation import get_home_page
+from content.timesince import request_now
 
 
 def home_page_settings(request):
     """Disponibiliza a primeira HomePage publicada para todos os templates."""
-    try:
-        home_page = HomePage.objects.live().first()
-        return {
-            'home_page': home_page,
-        }
-    except (HomePage.DoesNotExist, AttributeError):
-        return {
-            'home_page': None,
-        }
+    return {
+        'home_page': get_home_page(request),
+    }
+
+
+def brasilia_now(request):
+    """Disponibiliza o "agora" de Brasília congelado para a requisição."""
+    return {
+        'brasilia_now': request_now(request),
+    }
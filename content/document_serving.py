@@ -0,0 +1,165 @@
+"""
+Entrega dos documentos do Wagtail (PDFs dos artigos) sem prender workers.
+
+A view ``wagtaildocs_serve`` lia o arquivo em Python e o enviava pelo worker
+do Gunicorn até o fim do download, sem suporte a ``Range`` (leitores de PDF e
+downloads retomados pediam o arquivo inteiro de novo). Agora:
+
+- este módulo é o ``SENDFILE_BACKEND`` da view do Wagtail. Com
+  ``DOCUMENT_SENDFILE_HEADER = 'X-Accel-Redirect'`` (nginx) ou
+  ``'X-Sendfile'`` (Apache/lighttpd), a resposta só indica o arquivo e o
+  servidor da frente faz a transferência, com ``Range`` inclusive. Sem proxy,
+  devolve um ``FileResponse`` do arquivo aberto, que o Gunicorn envia com
+  ``os.sendfile`` (zero-copy) via ``wsgi.file_wrapper``;
+- ``serve_document`` envolve a view do Wagtail (restrições de coleção, hooks,
+  ETag por ``file_hash``) e atende ``Range``/``If-Range`` de um intervalo
+  com ``206 Partial Content``, limitando o envio ao trecho pedido;
+- ``If-Modified-Since`` responde ``304`` sem abrir o arquivo.
+
+Para o nginx, ``DOCUMENT_SENDFILE_URL`` aponta para uma ``location internal``
+com ``alias`` para o ``MEDIA_ROOT``.
+"""
+
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date
+from wagtail.utils.sendfile_streaming_backend import was_modified_since
+
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    """O intervalo pedido começa depois do fim do arquivo."""
+
+
+class FileRange:
+    """
+    Arquivo aberto limitado a ``length`` bytes a partir de ``start``.
+
+    Expõe ``fileno()``: o servidor WSGI envia o trecho com ``os.sendfile`` a
+    partir da posição atual, até o ``Content-Length`` da resposta.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def sendfile_url(filename):
+    """URL interna do nginx para ``filename`` (caminho dentro do ``MEDIA_ROOT``)."""
+    relative = os.path.relpath(filename, settings.MEDIA_ROOT).replace(os.sep, '/')
+    return getattr(settings, 'DOCUMENT_SENDFILE_URL', '/protected-media/').rstrip('/') + '/' + relative
+
+
+def sendfile(request, filename, **kwargs):
+    """Backend de ``wagtail.utils.sendfile``: delega ao proxy ou devolve o arquivo aberto."""
+    mtime = os.stat(filename).st_mtime
+    if not was_modified_since(request.headers.get('if-modified-since'), int(mtime)):
+        return HttpResponseNotModified()
+
+    header = getattr(settings, 'DOCUMENT_SENDFILE_HEADER', '')
+    if header == 'X-Accel-Redirect':
+        response = HttpResponse()
+        response[header] = sendfile_url(filename)
+    elif header == 'X-Sendfile':
+        response = HttpResponse()
+        response[header] = filename
+    else:
+        response = FileResponse(open(filename, 'rb'))
+    response['Last-Modified'] = http_date(mtime)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def parse_range(header, size):
+    """
+    Intervalo ``(início, fim)`` (inclusivo) de um cabeçalho ``Range`` de um trecho.
+
+    Returns:
+        tuple | None: None para cabeçalhos inválidos ou com vários trechos,
+        que recebem o arquivo inteiro
+
+    Raises:
+        RangeNotSatisfiable: Se o intervalo não tiver bytes no arquivo
+    """
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        suffix = int(last)
+        if not suffix or not size:
+            raise RangeNotSatisfiable(header)
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def _range_applies(request, response):
+    """``If-Range`` ausente ou igual ao ETag/Last-Modified atuais."""
+    if_range = request.headers.get('if-range')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        # Só ETags fortes valem para If-Range
+        return not if_range.startswith('W/') and if_range == response.get('ETag')
+    return if_range == response.get('Last-Modified')
+
+
+def partial_response(request, response):
+    """
+    Reduz ao trecho pedido em ``Range`` a resposta de documento com o arquivo aberto.
+
+    Respostas delegadas ao proxy, 304 e pedidos sem ``Range`` voltam sem mudança.
+    """
+    file = getattr(response, 'file_to_stream', None)
+    range_header = request.headers.get('range')
+    if (
+        request.method != 'GET' or response.status_code != 200 or not range_header
+        or file is None or not hasattr(file, 'fileno') or not _range_applies(request, response)
+    ):
+        return response
+
+    size = os.fstat(file.fileno()).st_size
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        file.close()
+        unsatisfiable = HttpResponse(status=416)
+        unsatisfiable['Content-Range'] = f'bytes */{size}'
+        return unsatisfiable
+    if byte_range is None:
+        return response
+
+    start, end = byte_range
+    partial = FileResponse(FileRange(file, start, end - start + 1), status=206)
+    for header, value in response.items():
+        partial[header] = value
+    partial['Content-Length'] = end - start + 1
+    partial['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return partial
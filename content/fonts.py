@@ -0,0 +1,204 @@
+"""
+Fontes que cada página realmente usa, servidas do próprio site.
+
+O ``base.html`` carregava do Google Fonts as sete famílias de
+``FONT_CHOICES`` em vários pesos em todas as páginas, num CSS de terceiros
+que bloqueava a primeira pintura. Agora a página informa o que exibe:
+
+- fontes fixas do ``custom.css`` e as da ``SiteCustomization``;
+- campos de fonte da própria página (``FONT_FIELDS`` dos modelos) e do
+  artigo em destaque.
+
+Só essas famílias ganham ``@font-face``, apontando para WOFF2 com o
+subconjunto latino gerados por ``manage.py build_fonts`` em ``static/fonts/``.
+As declarações são preguiçosas (o navegador só baixa o peso que algum texto
+usa); ``<link rel="preload">`` fica restrito às faces do topo da página.
+Famílias ainda sem arquivo local (build não rodou, fonte digitada no admin)
+caem num link do Google Fonts restrito a elas.
+"""
+
+import re
+import urllib.request
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import quote_plus
+
+from django.apps import apps
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+
+
+FONTS_STATIC_DIR = 'fonts'
+
+# Famílias auto-hospedadas e pesos gerados (os mesmos do antigo link do Google Fonts)
+WEB_FONTS = {
+    'Roboto': (400, 500, 700),
+    'Playfair Display': (400, 700),
+    'Merriweather': (400, 700),
+    'Montserrat': (400, 500, 700),
+    'Lora': (400, 700),
+    'Open Sans': (400, 600, 700),
+    'PT Serif': (400, 700),
+}
+
+# Fontes do sistema: nada a baixar
+SYSTEM_FONTS = frozenset({'Georgia', 'serif', 'sans-serif'})
+
+# Fontes fixas do custom.css: corpo, títulos, marca, metadados e blocos do artigo
+DEFAULT_BODY_FONT = 'Merriweather'
+DEFAULT_HEADING_FONT = 'Roboto'
+
+BODY_WEIGHT = 400
+HEADING_WEIGHT = 700
+
+GOOGLE_FONTS_CSS_URL = 'https://fonts.googleapis.com/css2'
+
+# O Google Fonts só responde WOFF2 para navegadores que o suportam
+BUILD_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+)
+
+_FACE_RE = re.compile(r'/\*\s*([\w-]+)\s*\*/\s*@font-face\s*\{(.*?)\}', re.S)
+_WEIGHT_RE = re.compile(r'font-weight:\s*(\d+)')
+_WOFF2_SRC_RE = re.compile(r"src:\s*url\(([^)]+)\)\s*format\(['\"]woff2['\"]\)")
+
+FontFace = namedtuple('FontFace', 'family weight url')
+PageFonts = namedtuple('PageFonts', 'faces preload fallback_url')
+
+
+def font_slug(family):
+    return re.sub(r'[^a-z0-9]+', '-', family.lower()).strip('-')
+
+
+def font_path(family, weight):
+    """Caminho estático do WOFF2 de ``family`` no peso ``weight``."""
+    return f'{FONTS_STATIC_DIR}/{font_slug(family)}-{weight}.woff2'
+
+
+@lru_cache(maxsize=None)
+def built_font_paths():
+    """WOFF2 gerados por ``build_fonts`` (procurados uma vez por processo)."""
+    return frozenset(
+        font_path(family, weight)
+        for family, weights in WEB_FONTS.items()
+        for weight in weights
+        if finders.find(font_path(family, weight))
+    )
+
+
+def google_fonts_url(families):
+    """Link do Google Fonts apenas com ``families``."""
+    params = '&'.join(
+        'family={}:wght@{}'.format(
+            quote_plus(family), ';'.join(str(weight) for weight in WEB_FONTS.get(family, (400, 700)))
+        )
+        for family in families
+    )
+    return f'{GOOGLE_FONTS_CSS_URL}?{params}&display=swap'
+
+
+def page_font_uses(site_customization=None, page=None, featured_article=None):
+    """
+    Pares ``(família, peso)`` exibidos no topo da página, sem repetição.
+
+    ``featured_article`` pode ser um ``ArticlePage`` ou um ``ArticleCard``.
+    """
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+
+    body_font = getattr(site_customization, 'body_font', '') or DEFAULT_BODY_FONT
+    heading_font = getattr(site_customization, 'heading_font', '') or DEFAULT_HEADING_FONT
+    uses = [
+        (body_font, BODY_WEIGHT),
+        (heading_font, HEADING_WEIGHT),
+        (DEFAULT_HEADING_FONT, BODY_WEIGHT),
+        (DEFAULT_HEADING_FONT, HEADING_WEIGHT),
+    ]
+    for obj, font_fields in (
+        (page, getattr(page, 'FONT_FIELDS', {})),
+        (featured_article, ArticlePage.FONT_FIELDS),
+    ):
+        if obj is None:
+            continue
+        for field_name, weight in font_fields.items():
+            family = getattr(obj, field_name, '')
+            if family:
+                uses.append((family, weight))
+    return list(dict.fromkeys(uses))
+
+
+def build_page_fonts(uses):
+    """
+    Faces locais, preloads e link de fallback para os pares ``uses``.
+
+    Returns:
+        PageFonts: ``faces`` (todas as faces geradas das famílias usadas),
+        ``preload`` (só as faces de ``uses``) e ``fallback_url`` ('' quando
+        todas as famílias têm arquivo local)
+    """
+    built = built_font_paths()
+    families = [family for family in dict.fromkeys(family for family, _ in uses)
+                if family not in SYSTEM_FONTS]
+
+    faces = []
+    missing = []
+    for family in families:
+        family_faces = [
+            FontFace(family, weight, static(font_path(family, weight)))
+            for weight in WEB_FONTS.get(family, ())
+            if font_path(family, weight) in built
+        ]
+        if family_faces:
+            faces.extend(family_faces)
+        else:
+            missing.append(family)
+
+    wanted = set(uses)
+    preload = [face for face in faces if (face.family, face.weight) in wanted]
+    return PageFonts(faces, preload, google_fonts_url(missing) if missing else '')
+
+
+def fetch_url(url):
+    request = urllib.request.Request(url, headers={'User-Agent': BUILD_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def build_font_files(output_dir, families=None, subset='latin', force=False, fetch=None):
+    """
+    Baixa os WOFF2 do subconjunto ``subset`` das ``families`` para ``output_dir``.
+
+    O Google Fonts já entrega cada família fatiada por escrita (``latin``,
+    ``latin-ext``...); o subconjunto latino cobre o português.
+
+    Returns:
+        tuple: (arquivos gravados, arquivos que já existiam)
+    """
+    fetch = fetch or fetch_url
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    skipped = []
+    for family in families or WEB_FONTS:
+        weights = WEB_FONTS[family]
+        targets = {weight: output_dir / Path(font_path(family, weight)).name for weight in weights}
+        if not force and all(target.exists() for target in targets.values()):
+            skipped.extend(targets.values())
+            continue
+
+        css = fetch(google_fonts_url([family])).decode()
+        for block_subset, block in _FACE_RE.findall(css):
+            weight = _WEIGHT_RE.search(block)
+            src = _WOFF2_SRC_RE.search(block)
+            if block_subset != subset or not weight or not src:
+                continue
+            target = targets.get(int(weight.group(1)))
+            if target is None:
+                continue
+            target.write_bytes(fetch(src.group(1).strip('\'"')))
+            written.append(target)
+
+    built_font_paths.cache_clear()
+    return written, skipped
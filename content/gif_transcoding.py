@@ -0,0 +1,302 @@
+"""
+GIFs do corpo dos artigos convertidos para formatos de vídeo.
+
+Os blocos ``gif`` exibiam o GIF original, em geral de um serviço externo:
+arquivos de vários megabytes, decodificados quadro a quadro pelo navegador.
+Cada URL de GIF passa a ser baixada uma única vez e convertida com
+ferramentas locais (``TranscodedGif`` guarda o resultado):
+
+- WebP animado, com o Pillow;
+- MP4 (H.264, sem áudio), com o ``ffmpeg`` em ``GIF_FFMPEG_BINARY``, quando
+  ele estiver instalado.
+
+Cada formato só é guardado se ficar menor que o GIF. O ``gif_block.html``
+serve o MP4 num ``<video>`` mudo em loop ou o WebP num ``<picture>``, com o
+GIF original como fallback; enquanto não há conversão, segue o GIF.
+
+A conversão nunca roda na requisição: ao publicar um artigo com GIFs ainda não
+convertidos, a tarefa ``convert_article_gifs`` é enfileirada depois do commit
+e executada pelo ``manage.py db_worker``; o corpo guardado é renderizado de
+novo no fim. O comando ``transcode_gifs`` processa o acervo em processos
+separados e tenta de novo, sem esperar, as falhas e os registros que ficaram
+pendentes (tarefa interrompida no meio). O download usa o fetcher de
+``content.remote_images`` (``REMOTE_IMAGE_FETCHER`` e o mesmo limite de
+tamanho); fora do comando, falhas só são tentadas de novo depois de
+``REMOTE_IMAGE_RETRY_AFTER`` segundos.
+"""
+
+import io
+import logging
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, connections
+from django.db.models import Q
+from django.utils import timezone
+from django_tasks import task
+
+from content.remote_images import RemoteImageError, get_fetcher, url_hash
+
+
+logger = logging.getLogger(__name__)
+
+
+class GifTranscodeError(Exception):
+    """Não foi possível converter um GIF."""
+
+
+def encode_webp(data):
+    """
+    Converte os bytes de um GIF animado em WebP animado.
+
+    Returns:
+        tuple: (bytes do WebP, largura, altura)
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as gif:
+            if gif.format != 'GIF':
+                raise GifTranscodeError(f'Arquivo não é GIF: {gif.format}')
+            output = io.BytesIO()
+            gif.save(
+                output, 'WEBP',
+                save_all=True,
+                loop=gif.info.get('loop', 0),
+                quality=getattr(settings, 'GIF_WEBP_QUALITY', 75),
+                method=4,
+            )
+            return output.getvalue(), gif.width, gif.height
+    except GifTranscodeError:
+        raise
+    except Exception as exc:
+        raise GifTranscodeError('GIF inválido') from exc
+
+
+def ffmpeg_binary():
+    """Caminho do ``ffmpeg``, ou None se não estiver instalado."""
+    return shutil.which(getattr(settings, 'GIF_FFMPEG_BINARY', 'ffmpeg'))
+
+
+def encode_mp4(data):
+    """
+    Converte os bytes de um GIF em MP4 (H.264, yuv420p, dimensões pares).
+
+    Returns:
+        bytes | None: None se o ``ffmpeg`` não estiver disponível
+    """
+    binary = ffmpeg_binary()
+    if binary is None:
+        return None
+    with tempfile.TemporaryDirectory() as workdir:
+        source = Path(workdir) / 'source.gif'
+        target = Path(workdir) / 'output.mp4'
+        source.write_bytes(data)
+        command = [
+            binary, '-nostdin', '-loglevel', 'error', '-y', '-i', str(source),
+            '-an', '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', '28',
+            '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2', '-movflags', '+faststart',
+            str(target),
+        ]
+        try:
+            subprocess.run(
+                command, check=True, capture_output=True,
+                timeout=getattr(settings, 'GIF_TRANSCODE_TIMEOUT', 120),
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+            raise GifTranscodeError('ffmpeg falhou') from exc
+        return target.read_bytes()
+
+
+def is_settled(transcoded, retry_failed=False):
+    """
+    Já convertido, ou falhou há menos de ``REMOTE_IMAGE_RETRY_AFTER`` segundos.
+
+    Com ``retry_failed``, só a conversão concluída conta.
+    """
+    if transcoded.attempted_at is None:
+        return False
+    if not transcoded.last_error:
+        return True
+    if retry_failed:
+        return False
+    retry_after = timedelta(seconds=getattr(settings, 'REMOTE_IMAGE_RETRY_AFTER', 3600))
+    return timezone.now() - transcoded.attempted_at < retry_after
+
+
+def transcode_gif(url, fetcher=None, retry_failed=False):
+    """
+    Garante as versões WebP/MP4 do GIF em ``url``.
+
+    Com ``retry_failed``, uma falha recente é tentada de novo sem esperar
+    ``REMOTE_IMAGE_RETRY_AFTER``.
+
+    Returns:
+        TranscodedGif: com ``webp``/``mp4`` preenchidos quando a conversão
+        rendeu arquivos menores que o GIF
+    """
+    TranscodedGif = apps.get_model('content', 'TranscodedGif')
+
+    source_hash = url_hash(url)
+    try:
+        transcoded, _ = TranscodedGif.objects.get_or_create(
+            source_hash=source_hash, defaults={'source_url': url}
+        )
+    except IntegrityError:
+        # Outra tarefa criou o registro ao mesmo tempo
+        transcoded = TranscodedGif.objects.get(source_hash=source_hash)
+
+    if is_settled(transcoded, retry_failed):
+        return transcoded
+
+    transcoded.attempted_at = timezone.now()
+    try:
+        data = (fetcher or get_fetcher())(url)
+        webp, transcoded.width, transcoded.height = encode_webp(data)
+        mp4 = encode_mp4(data)
+        name = source_hash[:16]
+        if len(webp) < len(data):
+            transcoded.webp.save(f'{name}.webp', ContentFile(webp), save=False)
+        if mp4 and len(mp4) < len(data):
+            transcoded.mp4.save(f'{name}.mp4', ContentFile(mp4), save=False)
+        transcoded.last_error = ''
+    except (RemoteImageError, GifTranscodeError) as exc:
+        transcoded.last_error = str(exc)[:255]
+        logger.warning("GIF não convertido (%s): %s", url, exc)
+    transcoded.save()
+    return transcoded
+
+
+def _transcode_in_process(url, retry_failed=False):
+    transcoded = transcode_gif(url, retry_failed=retry_failed)
+    return bool(transcoded.webp or transcoded.mp4)
+
+
+def transcode_gifs(urls, workers=None, retry_failed=False):
+    """
+    Converte vários GIFs em paralelo, em processos separados.
+
+    Returns:
+        list: URLs com alguma versão convertida
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    convert = partial(_transcode_in_process, retry_failed=retry_failed)
+    if workers == 1:
+        results = [convert(url) for url in urls]
+    else:
+        # Os processos filhos não podem herdar conexões abertas com o banco
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            results = list(executor.map(convert, urls))
+    return [url for url, converted in zip(urls, results) if converted]
+
+
+def find_transcoded(url):
+    """``TranscodedGif`` com alguma versão pronta para ``url``, sem converter nada."""
+    TranscodedGif = apps.get_model('content', 'TranscodedGif')
+
+    if not url:
+        return None
+    return (
+        TranscodedGif.objects.filter(source_hash=url_hash(url))
+        .exclude(webp='', mp4='')
+        .first()
+    )
+
+
+def pending_gif_urls(urls, retry_failed=False):
+    """
+    URLs de ``urls`` ainda sem conversão concluída (nem falha recente).
+
+    Com ``retry_failed``, as falhas recentes também voltam.
+    """
+    TranscodedGif = apps.get_model('content', 'TranscodedGif')
+
+    if not urls:
+        return []
+    settled_q = Q(last_error='')
+    if not retry_failed:
+        retry_after = timedelta(seconds=getattr(settings, 'REMOTE_IMAGE_RETRY_AFTER', 3600))
+        settled_q |= Q(attempted_at__gte=timezone.now() - retry_after)
+    settled = set(TranscodedGif.objects.filter(
+        settled_q,
+        source_hash__in=[url_hash(url) for url in urls],
+        attempted_at__isnull=False,
+    ).values_list('source_hash', flat=True))
+    return [url for url in urls if url_hash(url) not in settled]
+
+
+def refresh_article_body(article_id):
+    """Renderiza de novo o corpo guardado do artigo publicado e invalida seu cache."""
+    from content.article_body import store_rendered_body
+    from content.page_cache import purge_page
+
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+    article = ArticlePage.objects.live().filter(pk=article_id).first()
+    if article is None:
+        return
+    store_rendered_body(article)
+    purge_page(article)
+
+
+def transcode_article_gifs(article_id, fetcher=None):
+    """
+    Converte os GIFs do corpo do artigo publicado.
+
+    Returns:
+        int: Número de GIFs com alguma versão convertida
+    """
+    from content.article_body import body_gif_urls
+
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+    article = ArticlePage.objects.live().filter(pk=article_id).only('content_blocks').first()
+    if article is None:
+        return 0
+
+    converted = 0
+    for url in pending_gif_urls(body_gif_urls(article)):
+        transcoded = transcode_gif(url, fetcher)
+        if transcoded.webp or transcoded.mp4:
+            converted += 1
+    if converted:
+        refresh_article_body(article_id)
+    return converted
+
+
+def stuck_gif_urls():
+    """URLs de ``TranscodedGif`` sem nenhuma tentativa concluída (tarefa interrompida no meio)."""
+    TranscodedGif = apps.get_model('content', 'TranscodedGif')
+    return list(
+        TranscodedGif.objects.filter(attempted_at__isnull=True)
+        .order_by('pk').values_list('source_url', flat=True)
+    )
+
+
+@task()
+def convert_article_gifs(article_id):
+    """
+    Tarefa: ``transcode_article_gifs`` no ``db_worker``.
+
+    Returns:
+        int: Número de GIFs com alguma versão convertida
+    """
+    return transcode_article_gifs(article_id)
+
+
+def schedule_article_gifs(article):
+    """Enfileira, para depois do commit, a conversão dos GIFs ainda não convertidos do artigo."""
+    from content.article_body import body_gif_urls
+
+    if pending_gif_urls(body_gif_urls(article)):
+        convert_article_gifs.enqueue(article.pk)
@@ -0,0 +1,449 @@
+"""
+Serviço de listagem de artigos compartilhado pelas páginas de listagem.
+
+HomePage, SectionPage e SupportSectionPage dividem seus artigos em três
+grupos: o destaque principal, as notícias "Em Alta" e os artigos regulares.
+Cada grupo é uma consulta limitada que desce o próprio índice na ordem da
+listagem: o destaque pelo índice parcial ``article_featured_pub_idx``
+(LIMIT 1), "Em Alta" pelo índice parcial ``article_trending_until_idx``
+(LIMIT ``TRENDING_LIMIT``) e os regulares pelo índice de publicação (LIMIT
+``REGULAR_LIMIT`` + 1). Nenhuma delas percorre ou ordena a tabela inteira.
+
+Os artigos regulares são paginados por conjunto de chaves (keyset) em
+``(publication_date, id)``: o cursor aponta para o último card entregue e a
+próxima página é uma busca por intervalo no índice, com o mesmo custo da
+primeira independentemente da profundidade no arquivo.
+
+Só os artigos "Em Alta" exibidos saem do grupo regular: o cursor também
+guarda a posição do último card de "Em Alta" e os artigos em alta mais
+antigos que ele (além do limite do grupo) seguem na lista regular, na ordem
+de publicação.
+
+Os artigos são lidos com imagem de destaque, renditions, poster e tags
+carregados em lote, de modo que renderizar uma listagem custa um número
+constante de consultas, independente do número de cards. Só as colunas usadas
+pelos cards (``CARD_FIELDS``) são lidas: o corpo do artigo (``content_blocks``,
+``body`` e o HTML pré-renderizado) nunca sai do banco em uma listagem.
+
+Os templates recebem ``ArticleCard``: uma projeção imutável e compacta do
+artigo, com URL, URLs das imagens, resumo em texto e rótulo da seção já
+calculados, no lugar da instância de ``Page``.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q, prefetch_related_objects
+from django.utils import timezone
+from django_tasks import task
+from django.utils.html import strip_tags
+from django.utils.safestring import mark_safe
+from wagtail.rich_text import expand_db_html
+
+from content.renditions import (
+    CARD_IMAGE_SPECS, FALLBACK_IMAGE_SPEC, POSTER_IMAGE_SPECS, ready_rendition, rendition_prefetch,
+)
+
+
+# Limites padrão de cada grupo por renderização
+TRENDING_LIMIT = 12
+REGULAR_LIMIT = 9
+
+
+# Relações usadas pelos cards, carregadas junto com os artigos
+CARD_SELECT_RELATED = ('featured_image', 'external_image__image', 'highlight_video_poster')
+
+# Colunas lidas pelos cards: URL, textos do card, mídia de destaque e os
+# campos usados para classificar o artigo na listagem
+CARD_FIELDS = (
+    'title', 'slug', 'url_path', 'live', 'locale',
+    'introduction', 'publication_date', 'section', 'title_font', 'is_premium',
+    'is_featured_highlight', 'is_trending', 'trending_until',
+    'featured_image', 'external_image_url', 'external_image',
+    'highlight_video_url', 'highlight_video_mime_type',
+    'highlight_video_poster', 'highlight_video_poster_url',
+)
+
+# Imagens dos cards: atributo do ArticleCard -> spec da rendition
+CARD_IMAGES = (
+    ('thumbnail_url', 'fill-400x250'),
+    ('curated_image_url', 'fill-600x400'),
+    ('hero_image_url', 'fill-900x600'),
+    ('original_image_url', FALLBACK_IMAGE_SPEC),
+)
+
+
+class InvalidCursor(ValueError):
+    """Cursor de paginação malformado ou adulterado."""
+
+
+def encode_cursor(article, trending_boundary=None):
+    """
+    Codifica em texto opaco a posição ``(publication_date, pk)`` de um artigo
+    e, se houver, a do último card de "Em Alta" exibido.
+    """
+    parts = [article.publication_date.isoformat(), str(article.pk)]
+    if trending_boundary is not None:
+        parts += [trending_boundary[0].isoformat(), str(trending_boundary[1])]
+    raw = '|'.join(parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica um cursor gerado por ``encode_cursor``.
+
+    Returns:
+        tuple: (publication_date, pk, limite de "Em Alta" ou None)
+
+    Raises:
+        InvalidCursor: Se o cursor não puder ser interpretado
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        if len(parts) not in (2, 4):
+            raise ValueError(cursor)
+        positions = [
+            (datetime.fromisoformat(date_part), int(pk_part))
+            for date_part, pk_part in zip(parts[::2], parts[1::2])
+        ]
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if any(timezone.is_naive(publication_date) for publication_date, _ in positions):
+        raise InvalidCursor(cursor)
+    (publication_date, pk), *trending_boundary = positions
+    return publication_date, pk, trending_boundary[0] if trending_boundary else None
+
+
+def currently_trending_q(now=None):
+    """Predicado SQL equivalente a ``ArticlePage.is_currently_trending()``."""
+    now = now or timezone.now()
+    return Q(is_trending=True) & (
+        Q(trending_until__isnull=True) | Q(trending_until__gte=now)
+    )
+
+
+def expire_trending(now=None):
+    """
+    Desmarca "Em Alta" dos artigos cuja janela já terminou.
+
+    Roda periodicamente pela tarefa ``sweep_trending`` (ou pelo comando
+    ``expire_trending``). O predicado de leitura continua conferindo ``trending_until``, então a listagem fica
+    correta entre uma varredura e outra; a varredura mantém pequeno o índice
+    parcial de artigos em alta e invalida o cache das páginas afetadas.
+
+    Returns:
+        int: Número de artigos que saíram de "Em Alta"
+    """
+    from content.models import ArticlePage
+    from content.page_cache import affected_page_ids, purge_pages
+
+    now = now or timezone.now()
+    expired = list(
+        ArticlePage.objects.filter(is_trending=True, trending_until__lt=now)
+    )
+    if not expired:
+        return 0
+
+    ArticlePage.objects.filter(pk__in=[article.pk for article in expired]).update(
+        is_trending=False
+    )
+    page_ids = set()
+    for article in expired:
+        if article.live:
+            page_ids.update(affected_page_ids(article))
+    purge_pages(page_ids)
+    return len(expired)
+
+
+@task()
+def sweep_trending():
+    """
+    Tarefa: ``expire_trending`` no ``db_worker``, que agenda a próxima varredura.
+
+    Returns:
+        int: Número de artigos que saíram de "Em Alta"
+    """
+    try:
+        return expire_trending()
+    finally:
+        schedule_trending_sweep()
+
+
+def schedule_trending_sweep():
+    """
+    Agenda ``sweep_trending`` para daqui a ``TRENDING_SWEEP_INTERVAL`` segundos.
+
+    Não faz nada se já houver uma varredura na fila: chamado a cada deploy
+    (comando ``expire_trending``) e pela própria tarefa, mantém uma única
+    varredura recorrente.
+
+    Returns:
+        bool: Se uma nova varredura foi agendada
+    """
+    from django_tasks.backends.database.models import DBTaskResult
+    from django_tasks.task import ResultStatus
+
+    queued = DBTaskResult.objects.filter(
+        task_path=sweep_trending.module_path, status=ResultStatus.READY
+    )
+    if queued.exists():
+        return False
+    interval = timedelta(seconds=getattr(settings, 'TRENDING_SWEEP_INTERVAL', 300))
+    sweep_trending.using(run_after=timezone.now() + interval).enqueue()
+    return True
+
+
+@dataclass
+class ArticleListing:
+    """Resultado particionado de uma listagem de artigos."""
+
+    featured: object = None
+    trending: list = field(default_factory=list)
+    regular: list = field(default_factory=list)
+    next_cursor: str = ''
+
+
+class ArticleCard:
+    """
+    Dados de um artigo para os cards das listagens, calculados uma vez.
+
+    Imutável e com ``__slots__``: ocupa uma fração da memória de uma
+    instância de ``ArticlePage`` e não carrega nada do banco depois de
+    criado. Use ``ArticleCard.from_article``.
+    """
+
+    __slots__ = (
+        'pk', 'title', 'url', 'introduction_text', 'publication_date',
+        'is_premium', 'section', 'section_label', 'title_font',
+        'external_image_url', 'image_alt', *(name for name, _ in CARD_IMAGES),
+        'highlight_video_url', 'highlight_video_mime_type', 'highlight_video_poster_url',
+        'tags',
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} é imutável')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} é imutável')
+
+    def __repr__(self):
+        return f'<ArticleCard {self.pk}: {self.title}>'
+
+    @property
+    def id(self):
+        return self.pk
+
+    @property
+    def has_image(self):
+        return bool(self.external_image_url or self.thumbnail_url)
+
+    @property
+    def has_highlight_video(self):
+        return bool(self.highlight_video_url)
+
+    @classmethod
+    def from_article(cls, article, request=None):
+        """
+        Monta o card de um ``ArticlePage`` carregado com ``with_card_relations``
+        (ou ``load_card_articles``), sem consultas adicionais.
+        """
+        # A imagem externa tem prioridade, como em ArticlePage.get_image_url;
+        # depois de importada (content.remote_images) é servida como as locais
+        external_image_url = article.external_image_url
+        image = article.get_external_image() if external_image_url else article.featured_image
+        if image is not None:
+            images = {name: ready_rendition(image, spec).url for name, spec in CARD_IMAGES}
+            image_alt = article.title if external_image_url else image.default_alt_text
+            external_image_url = ''
+        else:
+            images = {name: '' for name, _ in CARD_IMAGES}
+            image_alt = article.title
+
+        return cls(
+            pk=article.pk,
+            title=article.title,
+            url=article.get_url(request),
+            # Mesmo resultado de ``introduction|richtext|striptags`` nos templates
+            introduction_text=mark_safe(strip_tags(expand_db_html(article.introduction))),
+            publication_date=article.publication_date,
+            is_premium=article.is_premium,
+            section=article.section,
+            section_label=article.get_section_display(),
+            title_font=article.title_font,
+            external_image_url=external_image_url,
+            image_alt=image_alt,
+            highlight_video_url=article.highlight_video_url,
+            highlight_video_mime_type=article.highlight_video_mime_type,
+            highlight_video_poster_url=(
+                article.get_highlight_video_poster_url() if article.highlight_video_url else None
+            ),
+            tags=tuple(tag.name for tag in article.tags.all()),
+            **images,
+        )
+
+
+def card_prefetch_lookups():
+    """Prefetches dos cards: tags e renditions da imagem de destaque (local ou importada) e do poster."""
+    return (
+        'tags',
+        rendition_prefetch('featured_image', CARD_IMAGE_SPECS),
+        rendition_prefetch('external_image__image', CARD_IMAGE_SPECS),
+        rendition_prefetch('highlight_video_poster', POSTER_IMAGE_SPECS),
+    )
+
+
+def with_card_relations(queryset):
+    """Restringe o QuerySet às colunas dos cards e carrega suas relações em lote."""
+    return (
+        queryset.only(*CARD_FIELDS)
+        .select_related(*CARD_SELECT_RELATED)
+        .prefetch_related(*card_prefetch_lookups())
+    )
+
+
+def load_card_articles(pages, request=None):
+    """
+    Converte páginas escolhidas manualmente em cards prontos para o template.
+
+    Páginas genéricas (``Page``) viram ``ArticlePage`` com uma única consulta e
+    as relações dos cards são carregadas em lote para todos os artigos.
+
+    Returns:
+        list: ``ArticleCard`` no mesmo tamanho e ordem de ``pages``; ``None``
+        para páginas que não existem mais ou não são artigos
+    """
+    from content.models import ArticlePage
+
+    pages = list(pages)
+    generic_ids = [
+        page.pk for page in pages
+        if page is not None and not isinstance(page, ArticlePage)
+    ]
+    if generic_ids:
+        loaded = ArticlePage.objects.only(*CARD_FIELDS).in_bulk(generic_ids)
+        pages = [
+            loaded.get(page.pk) if page is not None and not isinstance(page, ArticlePage) else page
+            for page in pages
+        ]
+
+    prefetch_related_objects(
+        [page for page in pages if page is not None],
+        *CARD_SELECT_RELATED, *card_prefetch_lookups()
+    )
+    return [
+        ArticleCard.from_article(page, request) if page is not None else None
+        for page in pages
+    ]
+
+
+def _featured_pk(queryset):
+    """Subconsulta com o pk do destaque principal (artigo de alto impacto mais recente)."""
+    return (
+        queryset.filter(is_featured_highlight=True)
+        .order_by('-publication_date', '-pk')
+        .values('pk')[:1]
+    )
+
+
+def regular_queryset(queryset, now=None, trending_boundary=None):
+    """
+    Artigos que pertencem ao grupo regular: nem destaque, nem "Em Alta" exibido.
+
+    Com ``trending_boundary`` (posição do último card de "Em Alta"), os
+    artigos em alta mais antigos que ele continuam no grupo regular.
+    """
+    shown_trending = currently_trending_q(now)
+    if trending_boundary is not None:
+        publication_date, pk = trending_boundary
+        shown_trending &= (
+            Q(publication_date__gt=publication_date)
+            | Q(publication_date=publication_date, pk__gte=pk)
+        )
+    return (
+        queryset.exclude(pk__in=_featured_pk(queryset))
+        .exclude(shown_trending)
+        .order_by('-publication_date', '-pk')
+    )
+
+
+def build_article_listing(queryset, trending_limit=TRENDING_LIMIT,
+                          regular_limit=REGULAR_LIMIT, now=None, request=None):
+    """
+    Divide ``queryset`` em destaque, "Em Alta" e regulares, uma consulta limitada por grupo.
+
+    O destaque é o artigo de alto impacto mais recente; os demais artigos de
+    alto impacto continuam participando dos outros grupos normalmente. Os
+    artigos em alta além de ``trending_limit`` entram no grupo regular.
+
+    Args:
+        queryset: QuerySet de ``ArticlePage`` já filtrado (ex.: ``live()``)
+        trending_limit: Máximo de artigos "Em Alta"
+        regular_limit: Tamanho da primeira página de artigos regulares
+        now: Instante de referência para o cálculo de "Em Alta"
+        request: Requisição usada para montar as URLs dos cards
+
+    Returns:
+        ArticleListing: Grupos de ``ArticleCard`` ordenados por data de
+        publicação (mais recente primeiro) e o cursor da próxima página de
+        regulares, se houver
+    """
+    base = queryset.only(*CARD_FIELDS).select_related(*CARD_SELECT_RELATED)
+
+    # Três consultas limitadas, cada uma descendo o próprio índice na ordem da listagem
+    featured = list(
+        base.filter(is_featured_highlight=True).order_by('-publication_date', '-pk')[:1]
+    )
+    trending = base.filter(currently_trending_q(now))
+    if featured:
+        trending = trending.exclude(pk=featured[0].pk)
+    trending = list(trending.order_by('-publication_date', '-pk')[:trending_limit])
+    trending_boundary = (trending[-1].publication_date, trending[-1].pk) if trending else None
+    # Um artigo a mais para saber se existe próxima página
+    regular = list(regular_queryset(base, now, trending_boundary)[:regular_limit + 1])
+
+    # Tags e renditions dos três grupos em lote
+    prefetch_related_objects(featured + trending + regular, *card_prefetch_lookups())
+
+    listing = ArticleListing(
+        featured=ArticleCard.from_article(featured[0], request) if featured else None,
+        trending=[ArticleCard.from_article(article, request) for article in trending],
+        regular=[ArticleCard.from_article(article, request) for article in regular],
+    )
+    if len(listing.regular) > regular_limit:
+        del listing.regular[regular_limit:]
+        listing.next_cursor = encode_cursor(listing.regular[-1], trending_boundary)
+    return listing
+
+
+def build_article_page(queryset, cursor, page_size=REGULAR_LIMIT, now=None, request=None):
+    """
+    Retorna a página de artigos regulares seguinte ao ``cursor``.
+
+    Returns:
+        tuple: (lista de ``ArticleCard``, cursor da próxima página ou '')
+
+    Raises:
+        InvalidCursor: Se o cursor for inválido
+    """
+    publication_date, pk, trending_boundary = decode_cursor(cursor)
+    articles = [
+        ArticleCard.from_article(article, request)
+        for article in with_card_relations(regular_queryset(queryset, now, trending_boundary)).filter(
+            Q(publication_date__lt=publication_date)
+            | Q(publication_date=publication_date, pk__lt=pk)
+        )[:page_size + 1]
+    ]
+    next_cursor = ''
+    if len(articles) > page_size:
+        del articles[page_size:]
+        next_cursor = encode_cursor(articles[-1], trending_boundary)
+    return articles, next_cursor
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from content.benchmarks import BENCHMARK_HOSTNAME, build_synthetic_archive
+
+
+class Command(BaseCommand):
+    help = 'Monta o acervo sintético usado pelos benchmarks (substitui um existente)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=10000, help='Número de artigos')
+        parser.add_argument('--images', type=int, default=50, help='Imagens compartilhadas pelos artigos')
+        parser.add_argument('--tags', type=int, default=200, help='Tags distintas')
+        parser.add_argument('--videos', type=int, default=30, help='Vídeos curtos')
+        parser.add_argument('--paragraphs', type=int, default=12, help='Parágrafos por artigo')
+        parser.add_argument('--seed', type=int, default=0, help='Semente do gerador aleatório')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Artigos gravados por transação')
+
+    def handle(self, *args, **options):
+        home = build_synthetic_archive(
+            articles=options['articles'],
+            images=options['images'],
+            tags=options['tags'],
+            videos=options['videos'],
+            paragraphs=options['paragraphs'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            stdout=self.stdout,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Acervo sintético pronto em http://{BENCHMARK_HOSTNAME}{home.url_path}'
+        ))
@@ -0,0 +1,54 @@
+import urllib.error
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from content.fonts import FONTS_STATIC_DIR, WEB_FONTS, build_font_files
+
+
+class Command(BaseCommand):
+    help = (
+        'Gera em static/fonts/ os WOFF2 (subconjunto latino) das fontes do site; '
+        'rode antes do collectstatic'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'families',
+            nargs='*',
+            help=f'Famílias a gerar (padrão: todas — {", ".join(WEB_FONTS)})',
+        )
+        parser.add_argument(
+            '--output-dir',
+            default=str(settings.BASE_DIR / 'static' / FONTS_STATIC_DIR),
+            help='Diretório de saída',
+        )
+        parser.add_argument(
+            '--subset',
+            default='latin',
+            help='Subconjunto de caracteres do Google Fonts (latin, latin-ext...)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Baixa de novo famílias que já têm todos os arquivos',
+        )
+
+    def handle(self, *args, **options):
+        unknown = [family for family in options['families'] if family not in WEB_FONTS]
+        if unknown:
+            raise CommandError(f'Fontes desconhecidas: {", ".join(unknown)}')
+
+        try:
+            written, skipped = build_font_files(
+                options['output_dir'],
+                families=options['families'] or None,
+                subset=options['subset'],
+                force=options['force'],
+            )
+        except (urllib.error.URLError, OSError) as exc:
+            raise CommandError(f'Falha ao baixar as fontes: {exc}') from exc
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {len(written)} arquivos de fonte gerados ({len(skipped)} já existiam)'
+        ))
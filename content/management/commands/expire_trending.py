@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from content.listings import expire_trending, schedule_trending_sweep
+
+
+class Command(BaseCommand):
+    help = (
+        'Remove de "Em Alta" os artigos com janela expirada e agenda a varredura recorrente '
+        'no db_worker (rode a cada deploy)'
+    )
+
+    def handle(self, *args, **options):
+        expired = expire_trending()
+        self.stdout.write(self.style.SUCCESS(f'✅ {expired} artigos saíram de "Em Alta"'))
+        if schedule_trending_sweep():
+            self.stdout.write(self.style.SUCCESS('✅ Varredura recorrente agendada'))
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import F
+
+from content.gif_transcoding import refresh_article_body
+from content.models import ArticlePage, VideoShort
+from content.remote_images import (
+    article_video_posters, attach_article_image, attach_video_poster, attach_video_thumbnail,
+    pending_remote_urls,
+)
+
+
+def _attach_in_thread(task, object_id):
+    try:
+        return task(object_id, retry_failed=True)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        'Baixa e guarda localmente as imagens externas dos artigos, os pôsteres dos vídeos do corpo '
+        'e os thumbnails remotos dos vídeos ainda sem cópia local, tentando de novo os downloads que falharam'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Downloads simultâneos (1 roda sem threads extras)',
+        )
+
+    def handle(self, *args, **options):
+        # Sem cópia ou com a cópia de uma URL antiga (tarefa que falhou ou nunca rodou)
+        article_ids = list(
+            ArticlePage.objects.live().exclude(external_image_url='')
+            .exclude(external_image__source_url=F('external_image_url'))
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        video_ids = []
+        for video in VideoShort.objects.select_related('remote_thumbnail').order_by('pk'):
+            source_url = video.get_remote_thumbnail_source()
+            if source_url and (
+                video.remote_thumbnail is None or video.remote_thumbnail.source_url != source_url
+            ):
+                video_ids.append(video.pk)
+        article_posters = {}
+        for article in ArticlePage.objects.live().only('content_blocks').iterator(chunk_size=200):
+            posters = article_video_posters(article)
+            if posters:
+                article_posters[article.pk] = posters
+        poster_urls = pending_remote_urls(list(dict.fromkeys(
+            url for posters in article_posters.values() for url in posters
+        )))
+        tasks = (
+            [(attach_article_image, pk) for pk in article_ids]
+            + [(attach_video_thumbnail, pk) for pk in video_ids]
+            + [(attach_video_poster, url) for url in poster_urls]
+        )
+
+        if options['workers'] == 1:
+            results = [task(object_id, retry_failed=True) for task, object_id in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                results = list(executor.map(lambda item: _attach_in_thread(*item), tasks))
+
+        attached = sum(1 for remote in results if remote is not None)
+
+        # Corpo guardado e cache dos artigos que ganharam algum pôster local
+        new_posters = {
+            remote.source_url for (task, _), remote in zip(tasks, results)
+            if task is attach_video_poster and remote is not None
+        }
+        for article_id, posters in article_posters.items():
+            if new_posters.intersection(posters):
+                refresh_article_body(article_id)
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {attached} de {len(tasks)} imagens remotas pendentes disponíveis localmente'
+        ))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from content.models import VideoShort
+
+
+class Command(BaseCommand):
+    help = 'Recalcula a plataforma, o id e as URLs de incorporação e thumbnail dos vídeos curtos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Vídeos lidos e gravados por vez',
+        )
+
+    def handle(self, *args, **options):
+        fields = VideoShort.VIDEO_METADATA_FIELDS
+        batch_size = options['batch_size']
+        changed = []
+        total = 0
+
+        for video in VideoShort.objects.order_by('pk').iterator(chunk_size=batch_size):
+            total += 1
+            before = [getattr(video, name) for name in fields]
+            video.refresh_video_metadata()
+            if [getattr(video, name) for name in fields] != before:
+                changed.append(video)
+
+        VideoShort.objects.bulk_update(changed, fields, batch_size=batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {len(changed)} vídeos atualizados ({total - len(changed)} já estavam atualizados)'
+        ))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from content.article_body import store_rendered_body
+from content.models import ArticlePage
+
+
+class Command(BaseCommand):
+    help = 'Pré-renderiza o corpo e a prévia do paywall dos artigos publicados'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Renderiza de novo também os artigos já atualizados (ex.: após mudar os templates)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Artigos lidos do banco por vez',
+        )
+
+    def handle(self, *args, **options):
+        rendered = skipped = 0
+        articles = ArticlePage.objects.live().order_by('pk')
+        for article in articles.iterator(chunk_size=options['batch_size']):
+            if not options['all'] and article.has_current_rendered_body():
+                skipped += 1
+                continue
+            store_rendered_body(article)
+            rendered += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {rendered} artigos renderizados ({skipped} já estavam atualizados)'
+        ))
@@ -0,0 +1,55 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.benchmarks import compare_results, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Mede latência, consultas e memória das páginas do acervo sintético'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Requisições medidas por cenário')
+        parser.add_argument('--warmup', type=int, default=2, help='Requisições descartadas por cenário')
+        parser.add_argument(
+            '--page-cache', action='store_true',
+            help='Mantém o cache de páginas anônimas (padrão: mede a renderização completa)',
+        )
+        parser.add_argument('--only', nargs='+', help='Cenários a executar (home, section, ...)')
+        parser.add_argument('--output', help='Arquivo JSON de resultados (padrão: saída padrão)')
+        parser.add_argument('--compare', help='JSON de uma execução anterior para comparar')
+
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                page_cache=options['page_cache'],
+                only=options['only'],
+            )
+        except RuntimeError as error:
+            raise CommandError(str(error))
+
+        payload = json.dumps(results, indent=2, ensure_ascii=False)
+        if not options['output']:
+            self.stdout.write(payload)
+        else:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                output.write(payload + '\n')
+
+            for name, result in results['results'].items():
+                self.stdout.write(
+                    f'{name}: {result["latency_ms"]["median"]} ms, '
+                    f'{result["queries"]["median"]} consultas, {result["peak_memory_kb"]} KB'
+                )
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)
+            for name, before_ms, after_ms, before_queries, after_queries in compare_results(baseline, results):
+                self.stdout.write(
+                    f'{name}: {before_ms} → {after_ms} ms, {before_queries} → {after_queries} consultas'
+                )
+
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f'✅ Resultados salvos em {options["output"]}'))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from content.article_body import body_gif_urls
+from content.gif_transcoding import (
+    pending_gif_urls, refresh_article_body, stuck_gif_urls, transcode_gifs,
+)
+from content.models import ArticlePage
+
+
+class Command(BaseCommand):
+    help = (
+        'Converte os GIFs do corpo dos artigos publicados para WebP animado e MP4, '
+        'tentando de novo as falhas e as conversões que ficaram pendentes'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Número de processos (padrão: número de CPUs; 1 roda sem processos extras)',
+        )
+
+    def handle(self, *args, **options):
+        article_urls = {}
+        for article in ArticlePage.objects.live().only('content_blocks').iterator(chunk_size=200):
+            urls = body_gif_urls(article)
+            if urls:
+                article_urls[article.pk] = urls
+
+        # GIFs dos artigos e registros pendentes; as falhas recentes também voltam
+        candidates = [url for article_gifs in article_urls.values() for url in article_gifs]
+        candidates += stuck_gif_urls()
+        urls = pending_gif_urls(list(dict.fromkeys(candidates)), retry_failed=True)
+        converted = set(transcode_gifs(urls, workers=options['workers'], retry_failed=True))
+
+        # Corpo guardado e cache dos artigos que ganharam alguma conversão
+        refreshed = 0
+        for article_id, article_gifs in article_urls.items():
+            if converted.intersection(article_gifs):
+                refresh_article_body(article_id)
+                refreshed += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {len(converted)} de {len(urls)} GIFs convertidos ({refreshed} artigos atualizados)'
+        ))
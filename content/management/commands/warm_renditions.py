@@ -0,0 +1,60 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from content.article_body import body_image_ids
+from content.models import ArticlePage
+from content.renditions import PAGE_IMAGE_SPECS, RESPONSIVE_IMAGE_SPECS, warm_renditions
+
+
+class Command(BaseCommand):
+    help = 'Gera antecipadamente as renditions usadas pelas páginas publicadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Número de processos (padrão: número de CPUs; 1 roda sem processos extras)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Imagens processadas por tarefa',
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for label, fields in PAGE_IMAGE_SPECS.items():
+            model = apps.get_model(label)
+            for field_name, specs in fields.items():
+                image_ids = (
+                    model.objects.live()
+                    .exclude(**{f'{field_name}__isnull': True})
+                    .order_by()
+                    .values_list(f'{field_name}_id', flat=True)
+                    .distinct()
+                )
+                processed = warm_renditions(
+                    image_ids, specs,
+                    workers=options['workers'],
+                    batch_size=options['batch_size'],
+                )
+                self.stdout.write(
+                    f'{model.__name__}.{field_name}: {processed} imagens ({", ".join(specs)})'
+                )
+                total += processed
+
+        # Imagens do corpo dos artigos (srcset); rode render_article_bodies --all depois
+        image_ids = set()
+        for article in ArticlePage.objects.live().only('content_blocks').iterator(chunk_size=200):
+            image_ids.update(body_image_ids(article))
+        processed = warm_renditions(
+            sorted(image_ids), RESPONSIVE_IMAGE_SPECS,
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(f'ArticlePage.content_blocks: {processed} imagens (srcset responsivo)')
+        total += processed
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Renditions prontas para {total} imagens'))
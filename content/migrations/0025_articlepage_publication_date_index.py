@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0024_homepage_video_section_position_and_more"),
+    ]
+
+    operations = [
+        # Artigos mais recentes (tópicos da navegação e listagens): ORDER BY publication_date DESC, id DESC
+        migrations.AddIndex(
+            model_name="articlepage",
+            index=models.Index(
+                fields=["-publication_date", "-page_ptr"],
+                name="article_publication_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0025_articlepage_publication_date_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="articlepage",
+            index=models.Index(
+                condition=models.Q(("is_trending", True)),
+                fields=["trending_until"],
+                name="article_trending_until_idx",
+            ),
+        ),
+    ]
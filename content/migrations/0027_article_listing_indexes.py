@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:36
+
+from django.db import migrations, models
+
+
+class PostgreSQLRunSQL(migrations.RunSQL):
+    """``RunSQL`` executado só no PostgreSQL; nos outros bancos não faz nada."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+# Índice fora do estado dos modelos: fica na tabela wagtailcore_page, de outro
+# app, então makemigrations não o conhece e nenhum modelo o declara; só esta
+# migração o cria e remove (sqlmigrate mostra o SQL quando roda no PostgreSQL).
+# No PostgreSQL, ``path LIKE '0001...%'`` (descendant_of) só usa índice com
+# varchar_pattern_ops; o índice único do Wagtail usa a collation padrão.
+# No SQLite o LIKE não usa índices de qualquer forma, então nada é criado.
+LIVE_PATH_INDEX = 'content_live_page_path_idx'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0026_articlepage_trending_index"),
+        ("wagtailcore", "0095_groupsitepermission"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="articlepage",
+            index=models.Index(
+                fields=["section", "-publication_date", "-page_ptr"],
+                name="article_section_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="articlepage",
+            index=models.Index(
+                condition=models.Q(("is_featured_highlight", True)),
+                fields=["-publication_date", "-page_ptr"],
+                name="article_featured_pub_idx",
+            ),
+        ),
+        PostgreSQLRunSQL(
+            sql=(
+                f'CREATE INDEX IF NOT EXISTS {LIVE_PATH_INDEX} '
+                'ON wagtailcore_page (path varchar_pattern_ops) WHERE live'
+            ),
+            reverse_sql=f'DROP INDEX IF EXISTS {LIVE_PATH_INDEX}',
+        ),
+    ]
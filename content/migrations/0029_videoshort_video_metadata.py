@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:59
+
+from django.db import migrations, models
+
+
+def fill_video_metadata(apps, schema_editor):
+    from content.video_providers import video_metadata
+
+    VideoShort = apps.get_model('content', 'VideoShort')
+    videos = list(VideoShort.objects.all())
+    for video in videos:
+        metadata = video_metadata(video.video_url, video.video_source_type, video.cdn_video_url)
+        for name, value in metadata.items():
+            setattr(video, name, value)
+    VideoShort.objects.bulk_update(
+        videos, ['video_provider', 'video_id', 'embed_url', 'auto_thumbnail_url'], batch_size=200
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0028_articlepage_rendered_body'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videoshort',
+            name='auto_thumbnail_url',
+            field=models.URLField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='videoshort',
+            name='embed_url',
+            field=models.URLField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='videoshort',
+            name='video_id',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='videoshort',
+            name='video_provider',
+            field=models.CharField(blank=True, editable=False, max_length=20),
+        ),
+        migrations.RunPython(fill_video_metadata, migrations.RunPython.noop),
+    ]
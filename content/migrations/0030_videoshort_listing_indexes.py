@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0029_videoshort_video_metadata'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='videoshort',
+            index=models.Index(fields=['order', '-created_at', '-id'], name='videoshort_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videoshort',
+            index=models.Index(
+                condition=models.Q(('is_featured', True)),
+                fields=['order', '-created_at', '-id'],
+                name='videoshort_featured_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0030_videoshort_listing_indexes'),
+        ('wagtailimages', '0027_image_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RemoteImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_url', models.URLField(max_length=2000, verbose_name='URL de origem')),
+                ('source_hash', models.CharField(editable=False, max_length=64, unique=True)),
+                ('attempted_at', models.DateTimeField(blank=True, null=True, verbose_name='Última tentativa')),
+                ('last_error', models.CharField(blank=True, max_length=255, verbose_name='Último erro')),
+                ('image', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='wagtailimages.image', verbose_name='Cópia local')),
+            ],
+            options={
+                'verbose_name': 'Imagem Remota',
+                'verbose_name_plural': 'Imagens Remotas',
+            },
+        ),
+        migrations.AddField(
+            model_name='articlepage',
+            name='external_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='content.remoteimage'),
+        ),
+        migrations.AddField(
+            model_name='videoshort',
+            name='remote_thumbnail',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='content.remoteimage'),
+        ),
+    ]
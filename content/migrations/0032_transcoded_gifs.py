@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0031_remote_images'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscodedGif',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_url', models.URLField(max_length=2000, verbose_name='URL do GIF')),
+                ('source_hash', models.CharField(editable=False, max_length=64, unique=True)),
+                ('webp', models.FileField(blank=True, upload_to='gifs', verbose_name='WebP animado')),
+                ('mp4', models.FileField(blank=True, upload_to='gifs', verbose_name='Vídeo MP4')),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('attempted_at', models.DateTimeField(blank=True, null=True, verbose_name='Última tentativa')),
+                ('last_error', models.CharField(blank=True, max_length=255, verbose_name='Último erro')),
+            ],
+            options={
+                'verbose_name': 'GIF Convertido',
+                'verbose_name_plural': 'GIFs Convertidos',
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0032_transcoded_gifs'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='articlepage',
+            name='article_trending_until_idx',
+        ),
+        migrations.AddIndex(
+            model_name='articlepage',
+            index=models.Index(condition=models.Q(('is_trending', True)), fields=['-publication_date', '-page_ptr', 'trending_until'], name='article_trending_until_idx'),
+        ),
+    ]
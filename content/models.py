@@ -16,7 +16,10 @@ Security Notes:
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from wagtail.models import Page
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Page, PageViewRestriction
+from wagtail.signals import page_published, page_unpublished, post_page_move
 from wagtail.fields import RichTextField, StreamField
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel, FieldRowPanel
 from wagtail.snippets.models import register_snippet
@@ -300,7 +303,117 @@ class HomeCuratedSectionBlock(blocks.StructBlock):
         template = "content/blocks/home_curated_section.html"
 
 
-class HomePage(Page):
+class ArticleListingMixin:
+    """
+    Comportamento comum às páginas que listam artigos.
+
+    Por padrão a página lista os artigos publicados abaixo dela
+    (``get_listing_queryset``; SectionPage filtra pela seção); a divisão em destaque, "Em Alta" e regulares é feita por
+    ``content.listings.build_article_listing`` com uma consulta limitada por grupo. As
+    páginas seguintes de artigos regulares ("carregar mais") são servidas pela
+    view ``content.views.article_listing_fragment`` com paginação por cursor.
+    """
+
+    # Template parcial com os cards de artigos regulares desta página
+    listing_cards_template = 'content/partials/section_article_cards.html'
+
+    def get_listing_queryset(self):
+        """Artigos publicados abaixo desta página."""
+        return ArticlePage.objects.descendant_of(self).live()
+
+    def route(self, request, path_components):
+        """
+        Roteamento padrão do Wagtail, mas artigos filhos são carregados sem as
+        colunas de corpo que o shell não exibe (ver
+        ``ArticlePage.get_unread_body_fields``).
+        """
+        from django.db.models import OuterRef, Subquery
+        from django.http import Http404
+
+        if not path_components:
+            return super().route(request, path_components)
+
+        # is_premium vem na mesma consulta da página genérica
+        premium = ArticlePage.objects.filter(pk=OuterRef('pk')).values('is_premium')
+        try:
+            subpage = self.get_children().annotate(article_is_premium=Subquery(premium)).get(
+                slug=path_components[0]
+            )
+        except Page.DoesNotExist:
+            raise Http404
+
+        if subpage.specific_class is ArticlePage:
+            specific = ArticlePage.objects.defer(
+                *ArticlePage.get_unread_body_fields(subpage.article_is_premium)
+            ).get(pk=subpage.pk)
+        else:
+            specific = subpage.specific
+        specific._cached_parent_obj = self
+        return specific.route(request, path_components[1:])
+
+    def get_listing_page_size(self, site_customization=None):
+        """Número de artigos regulares por página, configurável no admin."""
+        from content.listings import REGULAR_LIMIT
+
+        if site_customization and site_customization.articles_per_page > 0:
+            return site_customization.articles_per_page
+        return REGULAR_LIMIT
+
+    def is_premium_subscriber(self, request):
+        """Indica se o usuário da requisição é assinante premium."""
+        from content.page_cache import paywall_state
+        return paywall_state(request) == 'subscriber'
+
+    def get_listing_context(self, request, site_customization=None):
+        """
+        Monta as chaves de listagem compartilhadas pelos templates.
+
+        Returns:
+            dict: featured_article, trending_articles, articles, next_cursor
+            e is_premium_subscriber
+        """
+        from content.listings import build_article_listing
+
+        listing = build_article_listing(
+            self.get_listing_queryset(),
+            regular_limit=self.get_listing_page_size(site_customization),
+            request=request,
+        )
+
+        # TODOS os artigos aparecem nas listagens (incluindo premium)
+        # O controle de acesso ao conteúdo completo é feito no template do artigo
+        return {
+            'featured_article': listing.featured,
+            'trending_articles': listing.trending,
+            'articles': listing.regular,
+            'next_cursor': listing.next_cursor,
+            'is_premium_subscriber': self.is_premium_subscriber(request),
+        }
+
+    def get_listing_page_context(self, request, cursor, site_customization=None):
+        """
+        Contexto da página de artigos regulares seguinte ao ``cursor``.
+
+        Raises:
+            content.listings.InvalidCursor: Se o cursor for inválido
+        """
+        from content.listings import build_article_page
+
+        articles, next_cursor = build_article_page(
+            self.get_listing_queryset(),
+            cursor,
+            page_size=self.get_listing_page_size(site_customization),
+            request=request,
+        )
+        return {
+            'page': self,
+            'articles': articles,
+            'next_cursor': next_cursor,
+            'is_premium_subscriber': self.is_premium_subscriber(request),
+        }
+
+
+class HomePage(ArticleListingMixin, Page):
     """Página inicial do site com configurações customizáveis"""
     
     body = RichTextField(blank=True, verbose_name="Corpo da Página")
@@ -542,6 +655,25 @@ class HomePage(Page):
                 'footer_tagline': 'A frase do rodapé deve ter pelo menos 10 caracteres.'
             })
 
+    listing_cards_template = 'content/partials/home_article_cards.html'
+
+    def prepare_curated_sections(self, request=None):
+        """
+        Troca os artigos de cada seção curada por cards prontos para o template.
+
+        Todos os artigos de todas as seções são carregados juntos, então o
+        custo não cresce com o número de seções ou de artigos escolhidos.
+        """
+        from content.listings import load_card_articles
+
+        sections = [block.value for block in self.curated_sections]
+        loaded = iter(load_card_articles(
+            (article for value in sections for article in value['articles']), request
+        ))
+        for value in sections:
+            articles = [next(loaded) for _ in value['articles']]
+            value['articles'] = [article for article in articles if article is not None]
+
     def get_context(self, request, *args, **kwargs):
         """
         Adiciona dados customizados ao contexto da página inicial.
@@ -551,57 +683,16 @@ class HomePage(Page):
         """
         context = super().get_context(request, *args, **kwargs)
 
-        # Busca todos os artigos descendentes
-        all_articles = ArticlePage.objects.descendant_of(self).live()
-        
-        # 1. DESTAQUE PRINCIPAL (fixo manualmente)
-        featured_highlight = all_articles.filter(is_featured_highlight=True).order_by('-publication_date').first()
-        context['featured_article'] = featured_highlight
-        
-        # Exclude featured article from other listings
-        remaining_articles = all_articles.exclude(id=featured_highlight.id) if featured_highlight else all_articles
-        
-        # 2. NOTÍCIAS "EM ALTA" (automáticas ou manuais)
-        # Filter articles that are currently trending
-        trending_articles = []
-        for article in remaining_articles:
-            if article.is_currently_trending():
-                trending_articles.append(article)
-        
-        # Sort trending by publication date (most recent first)
-        trending_articles = sorted(trending_articles, key=lambda x: x.publication_date, reverse=True)
-        context['trending_articles'] = trending_articles
-        
-        # Get IDs of articles already shown
-        shown_ids = [featured_highlight.id] if featured_highlight else []
-        shown_ids.extend([a.id for a in trending_articles])
-        
-        # 3. ARTIGOS REGULARES E PREMIUM (todos visíveis nas listagens)
-        regular_articles = remaining_articles.exclude(id__in=shown_ids)
-        
-        # Check if user is authenticated and is a premium subscriber
-        user = request.user
-        is_premium_subscriber = (
-            user.is_authenticated and 
-            hasattr(user, 'userprofile') and
-            user.userprofile.is_subscriber
-        )
-        
-        # TODOS os artigos aparecem nas listagens (incluindo premium)
-        # O controle de acesso ao conteúdo completo é feito no template do artigo
-        
-        context['articles'] = regular_articles.order_by('-publication_date')
-        context['is_premium_subscriber'] = is_premium_subscriber
-        
-        # Busca vídeos curtos destacados respeitando prioridade
-        featured_videos_qs = VideoShort.objects.filter(is_featured=True).order_by('order', '-created_at')
-        context['featured_videos'] = featured_videos_qs[:6]
+        from content.navigation import get_site_customization
+
+        # Busca customizações do site (uma vez por requisição, cacheada)
+        site_customization = get_site_customization(request)
+
+        context.update(self.get_listing_context(request, site_customization))
         
-        # Busca customizações do site
-        try:
-            site_customization = SiteCustomization.objects.first()
-        except SiteCustomization.DoesNotExist:
-            site_customization = None
+        # Vídeos curtos destacados (cacheados, ver content.videos)
+        from content.videos import get_featured_videos
+        context['featured_videos'] = get_featured_videos()
 
         context['site_customization'] = site_customization
         context['show_video_shorts'] = (
@@ -610,6 +701,9 @@ class HomePage(Page):
             and (site_customization.show_video_section if site_customization else True)
         )
         
+        # Artigos das seções curadas com as relações dos cards carregadas em lote
+        self.prepare_curated_sections(request)
+        
         # Adiciona a home_page ao contexto para uso no footer
         context['home_page'] = self
         
@@ -661,6 +755,9 @@ class ArticlePage(Page):
         verbose_name="Fonte do Título",
         help_text="Escolha a fonte para o título deste artigo"
     )
+
+    # Campos de fonte e o peso em que aparecem (ver content.fonts)
+    FONT_FIELDS = {'title_font': 700}
     
     introduction = RichTextField(
         max_length=500, 
@@ -691,6 +788,9 @@ class ArticlePage(Page):
         verbose_name="Em Alta Até",
         help_text="Data/hora até quando o artigo permanecerá em alta (automático para novos artigos)"
     )
+
+    # Janela automática de "Em Alta" para artigos novos
+    AUTO_TRENDING_HOURS = 3
     
     # Section field
     section = models.CharField(
@@ -716,6 +816,15 @@ class ArticlePage(Page):
         verbose_name="URL de Imagem Externa",
         help_text="Use uma URL de imagem externa para economizar espaço. Se preenchido, será usado ao invés da imagem local."
     )
+    # Cópia local da imagem externa, ligada ao publicar (content.remote_images)
+    external_image = models.ForeignKey(
+        'content.RemoteImage',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+    )
     
     highlight_video_url = models.URLField(
         blank=True,
@@ -837,6 +946,25 @@ class ArticlePage(Page):
     
     # Tags para categorização
     tags = ClusterTaggableManager(through=ArticlePageTag, blank=True)
+
+    # Corpo pré-renderizado na publicação (ver content.article_body)
+    rendered_body = models.TextField(blank=True, editable=False)
+    rendered_preview = models.TextField(blank=True, editable=False)
+    rendered_revision = models.ForeignKey(
+        'wagtailcore.Revision',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+    )
+    rendered_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Cache de renderização: não vai para revisões nem para cópias
+    RENDERED_BODY_FIELDS = ('rendered_body', 'rendered_preview', 'rendered_revision', 'rendered_at')
+    # Derivados da URL externa ao publicar: idem
+    REMOTE_IMAGE_FIELDS = ('external_image',)
+    exclude_fields_in_copy = [*RENDERED_BODY_FIELDS, *REMOTE_IMAGE_FIELDS]
     
     # Define what pages can be parents of ArticlePage
     parent_page_types = ['content.HomePage', 'content.SectionPage', 'content.SupportSectionPage']
@@ -873,22 +1001,35 @@ class ArticlePage(Page):
     ]
     
     def get_image_url(self):
-        """Retorna a URL da imagem, priorizando a externa"""
+        """Retorna a URL da imagem, priorizando a externa (local: rendition de 1200px)"""
+        from content.renditions import FALLBACK_IMAGE_SPEC, ready_rendition
+
         if self.external_image_url:
             return self.external_image_url
         elif self.featured_image:
-            return self.featured_image.file.url
+            return ready_rendition(self.featured_image, FALLBACK_IMAGE_SPEC).url
         return None
 
+    def get_external_image(self):
+        """Cópia local da imagem externa, quando já importada; senão None."""
+        if not self.external_image_url or not self.external_image_id:
+            return None
+        remote = self.external_image
+        if remote.source_url != self.external_image_url:
+            return None
+        return remote.image
+
     def has_highlight_video(self):
         """Retorna True quando um vídeo customizado de destaque foi configurado."""
         return bool(self.highlight_video_url)
 
     def get_highlight_video_poster_url(self):
         """Obtém a melhor imagem de poster disponível para o vídeo de destaque."""
+        from content.renditions import POSTER_IMAGE_SPEC, ready_rendition
+
         if self.highlight_video_poster:
             try:
-                return self.highlight_video_poster.file.url
+                return ready_rendition(self.highlight_video_poster, POSTER_IMAGE_SPEC).url
             except Exception:
                 pass
         if self.highlight_video_poster_url:
@@ -906,22 +1047,20 @@ class ArticlePage(Page):
     def save(self, *args, **kwargs):
         """Override save to automatically set trending for new articles"""
         from datetime import timedelta
-        
-        # Check if this is a new article being published
-        is_new = self.pk is None
-        
-        # Call parent save first
-        super().save(*args, **kwargs)
-        
-        # If it's a new article, automatically set it as trending for 3 hours
-        if is_new and self.live:
+
+        # New live articles are trending for AUTO_TRENDING_HOURS, set in the same write
+        if self.pk is None and self.live:
             self.is_trending = True
-            self.trending_until = timezone.now() + timedelta(hours=3)
-            # Save again to update trending fields
-            super().save(update_fields=['is_trending', 'trending_until'])
+            self.trending_until = timezone.now() + timedelta(hours=self.AUTO_TRENDING_HOURS)
+
+        super().save(*args, **kwargs)
     
     def is_currently_trending(self):
-        """Check if article is currently trending (considers both manual and automatic trending)"""
+        """
+        Check if article is currently trending (considers both manual and automatic trending)
+
+        Listings use the SQL equivalent, ``content.listings.currently_trending_q``.
+        """
         if not self.is_trending:
             return False
         
@@ -930,6 +1069,48 @@ class ArticlePage(Page):
             return False
         
         return True
+
+    @staticmethod
+    def get_unread_body_fields(is_premium):
+        """
+        Colunas de corpo que o shell do artigo não lê.
+
+        O shell é o mesmo para qualquer leitor (ver ``content.page_cache``):
+        artigos premium mostram só a prévia do paywall e não carregam o corpo
+        (nem o StreamField); os gratuitos não carregam a prévia. O corpo para
+        assinantes vem de ``content.views.article_reader_fragment``.
+        """
+        if is_premium:
+            return ('content_blocks', 'body', 'rendered_body')
+        return ('content_blocks', 'body', 'rendered_preview')
+
+    def serializable_data(self):
+        data = super().serializable_data()
+        for name in (*self.RENDERED_BODY_FIELDS, *self.REMOTE_IMAGE_FIELDS):
+            data.pop(name, None)
+        return data
+
+    def has_current_rendered_body(self):
+        """Indica se o HTML guardado corresponde à revisão publicada."""
+        return self.rendered_at is not None and self.rendered_revision_id == self.live_revision_id
+
+    def get_rendered_body(self):
+        """Corpo completo do artigo (assinantes e artigos gratuitos)."""
+        from django.utils.safestring import mark_safe
+        from content.article_body import render_article_body
+
+        if self.has_current_rendered_body():
+            return mark_safe(self.rendered_body)
+        return render_article_body(self)
+
+    def get_rendered_preview(self):
+        """Prévia exibida sob o paywall."""
+        from django.utils.safestring import mark_safe
+        from content.article_body import render_article_preview
+
+        if self.has_current_rendered_body():
+            return mark_safe(self.rendered_preview)
+        return render_article_preview(self)
     
     def get_context(self, request, *args, **kwargs):
         """
@@ -938,18 +1119,87 @@ class ArticlePage(Page):
         Returns:
             dict: Context with is_subscriber flag
         """
+        from content.page_cache import paywall_state
+
         context = super().get_context(request, *args, **kwargs)
         
-        # Safely check if user is a subscriber
-        user = request.user
-        context['is_subscriber'] = (
-            user.is_authenticated and 
-            hasattr(user, 'userprofile') and
-            user.userprofile.is_subscriber
-        )
+        # O perfil vem com o usuário da sessão (accounts.backends). Ao servir o
+        # shell o usuário é sempre anônimo (ver content.page_cache.serve_shell)
+        context['is_subscriber'] = paywall_state(request) == 'subscriber'
         
         return context
 
+    class Meta:
+        indexes = [
+            # Listagens e paginação por cursor: ORDER BY publication_date DESC, id DESC
+            models.Index(
+                fields=['-publication_date', '-page_ptr'],
+                name='article_publication_idx',
+            ),
+            # SectionPage: WHERE section = ? ORDER BY publication_date DESC, id DESC
+            models.Index(
+                fields=['section', '-publication_date', '-page_ptr'],
+                name='article_section_pub_idx',
+            ),
+            # Destaque principal: o artigo de alto impacto mais recente
+            models.Index(
+                fields=['-publication_date', '-page_ptr'],
+                name='article_featured_pub_idx',
+                condition=models.Q(is_featured_highlight=True),
+            ),
+            # Índice parcial: só artigos "Em Alta", que a varredura expire_trending mantém poucos.
+            # Na ordem da listagem, com trending_until para filtrar a janela no próprio índice
+            models.Index(
+                fields=['-publication_date', '-page_ptr', 'trending_until'],
+                name='article_trending_until_idx',
+                condition=models.Q(is_trending=True),
+            ),
+        ]
+
+
+class RemoteImage(models.Model):
+    """Cópia local de uma imagem hospedada fora do site (ver content.remote_images)."""
+
+    source_url = models.URLField(max_length=2000, verbose_name="URL de origem")
+    source_hash = models.CharField(max_length=64, unique=True, editable=False)
+    image = models.ForeignKey(
+        'wagtailimages.Image',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name="Cópia local",
+    )
+    attempted_at = models.DateTimeField(null=True, blank=True, verbose_name="Última tentativa")
+    last_error = models.CharField(max_length=255, blank=True, verbose_name="Último erro")
+
+    class Meta:
+        verbose_name = "Imagem Remota"
+        verbose_name_plural = "Imagens Remotas"
+
+    def __str__(self):
+        return self.source_url
+
+
+class TranscodedGif(models.Model):
+    """Versões WebP animado e MP4 de um GIF do corpo dos artigos (ver content.gif_transcoding)."""
+
+    source_url = models.URLField(max_length=2000, verbose_name="URL do GIF")
+    source_hash = models.CharField(max_length=64, unique=True, editable=False)
+    webp = models.FileField(upload_to='gifs', blank=True, verbose_name="WebP animado")
+    mp4 = models.FileField(upload_to='gifs', blank=True, verbose_name="Vídeo MP4")
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    attempted_at = models.DateTimeField(null=True, blank=True, verbose_name="Última tentativa")
+    last_error = models.CharField(max_length=255, blank=True, verbose_name="Último erro")
+
+    class Meta:
+        verbose_name = "GIF Convertido"
+        verbose_name_plural = "GIFs Convertidos"
+
+    def __str__(self):
+        return self.source_url
+
 
 @register_snippet
 class VideoShort(models.Model):
@@ -1033,6 +1283,24 @@ class VideoShort(models.Model):
     )
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+
+    # Derivados do link ao salvar (content.video_providers)
+    video_provider = models.CharField(max_length=20, blank=True, editable=False)
+    video_id = models.CharField(max_length=64, blank=True, editable=False)
+    embed_url = models.URLField(blank=True, editable=False)
+    auto_thumbnail_url = models.URLField(blank=True, editable=False)
+
+    VIDEO_METADATA_FIELDS = ('video_provider', 'video_id', 'embed_url', 'auto_thumbnail_url')
+
+    # Cópia local do thumbnail remoto (content.remote_images)
+    remote_thumbnail = models.ForeignKey(
+        'content.RemoteImage',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+    )
     
     panels = [
         FieldPanel('title'),
@@ -1054,16 +1322,27 @@ class VideoShort(models.Model):
         verbose_name = "Vídeo Curto"
         verbose_name_plural = "Vídeos Curtos"
         ordering = ['order', '-created_at']
+        indexes = [
+            # Grade da VideosPage e paginação por cursor (content.videos)
+            models.Index(fields=['order', '-created_at', '-id'], name='videoshort_order_idx'),
+            # Faixa de destaque da home
+            models.Index(
+                fields=['order', '-created_at', '-id'],
+                name='videoshort_featured_idx',
+                condition=models.Q(is_featured=True),
+            ),
+        ]
     
     def __str__(self):
         return self.title
     
-    PLACEHOLDER_THUMBNAIL = 'https://via.placeholder.com/400x700/E3120B/FFFFFF?text=Video'
+    # Arquivo estático servido pelo próprio site
+    PLACEHOLDER_THUMBNAIL = 'images/video-placeholder.svg'
 
     def get_thumbnail_url(self):
         """Retorna a URL do thumbnail, priorizando fontes automáticas quando possível."""
         if self.thumbnail_url:
-            return self.thumbnail_url
+            return self._get_local_thumbnail_url(self.thumbnail_url) or self.thumbnail_url
 
         if self.thumbnail_image:
             try:
@@ -1074,63 +1353,54 @@ class VideoShort(models.Model):
 
         auto_thumbnail = self._get_auto_thumbnail_from_source()
         if auto_thumbnail:
-            return auto_thumbnail
+            return self._get_local_thumbnail_url(auto_thumbnail) or auto_thumbnail
 
-        return self.PLACEHOLDER_THUMBNAIL
+        from django.templatetags.static import static
+        return static(self.PLACEHOLDER_THUMBNAIL)
 
-    def _get_auto_thumbnail_from_source(self):
-        """Gera automaticamente um thumbnail a partir de plataformas conhecidas."""
-        if not self.video_url:
+    def get_remote_thumbnail_source(self):
+        """URL externa usada como thumbnail, se houver (ver ``get_thumbnail_url``)."""
+        if self.thumbnail_url:
+            return self.thumbnail_url
+        if self.thumbnail_image_id:
             return ''
+        return self._get_auto_thumbnail_from_source()
 
-        url = self.video_url.strip()
-        if not url:
+    def _get_local_thumbnail_url(self, source_url):
+        """Rendition da cópia local de ``source_url``, quando já importada."""
+        if not self.remote_thumbnail_id:
             return ''
-
-        try:
-            from urllib.parse import urlparse, parse_qs
-            parsed = urlparse(url)
-        except Exception:
+        remote = self.remote_thumbnail
+        if remote.source_url != source_url or not remote.image_id:
             return ''
+        from content.remote_images import VIDEO_THUMBNAIL_SPEC
+        from content.renditions import ready_rendition
+        return ready_rendition(remote.image, VIDEO_THUMBNAIL_SPEC).url
 
-        netloc = parsed.netloc.lower().lstrip('www.')
-        path = parsed.path.rstrip('/')
-
-        def clean_segment(segment):
-            return segment.split('?')[0]
-
-        # YouTube standard links (watch, share, embed, shorts)
-        if 'youtube.com' in netloc or 'youtube-nocookie.com' in netloc:
-            if path == '/watch':
-                video_id = parse_qs(parsed.query).get('v', [''])[0]
-            else:
-                segments = [s for s in path.split('/') if s]
-                video_id = ''
-                if segments:
-                    if segments[0] in {'embed', 'shorts', 'live'} and len(segments) > 1:
-                        video_id = clean_segment(segments[1])
-                    else:
-                        video_id = clean_segment(segments[-1])
-
-            if video_id:
-                return f'https://img.youtube.com/vi/{video_id}/hqdefault.jpg'
-
-        if 'youtu.be' in netloc:
-            video_id = clean_segment(path.lstrip('/'))
-            if video_id:
-                return f'https://img.youtube.com/vi/{video_id}/hqdefault.jpg'
-
-        if 'vimeo.com' in netloc:
-            segments = [s for s in path.split('/') if s]
-            if segments:
-                video_id = clean_segment(segments[-1])
-                if video_id.isdigit():
-                    return f'https://vumbnail.com/{video_id}.jpg'
-
-        return ''
+    def _get_auto_thumbnail_from_source(self):
+        """Thumbnail da plataforma, reconhecido ao salvar (ver ``refresh_video_metadata``)."""
+        if self._state.adding:
+            self.refresh_video_metadata()
+        return self.auto_thumbnail_url
+
+    def refresh_video_metadata(self):
+        """Recalcula a plataforma, o id e as URLs derivadas do link do vídeo."""
+        from content.video_providers import video_metadata
+
+        metadata = video_metadata(self.video_url, self.video_source_type, self.cdn_video_url)
+        for name, value in metadata.items():
+            setattr(self, name, value)
+
+    def save(self, *args, **kwargs):
+        self.refresh_video_metadata()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *self.VIDEO_METADATA_FIELDS}
+        super().save(*args, **kwargs)
 
     def clean(self):
         from django.core.exceptions import ValidationError
+        from content.video_providers import is_provider_url, parse_video_url
 
         super().clean()
 
@@ -1144,6 +1414,14 @@ class VideoShort(models.Model):
                 'video_url': 'Informe a URL da plataforma quando o tipo for Plataforma.'
             })
 
+        if (
+            self.video_url and is_provider_url(self.video_url)
+            and parse_video_url(self.video_url) is None
+        ):
+            raise ValidationError({
+                'video_url': 'O link não contém um id de vídeo válido para a plataforma.'
+            })
+
         if self.video_source_type == 'cdn':
             errors = {}
             if not self.cdn_video_url:
@@ -1163,52 +1441,13 @@ class VideoShort(models.Model):
         return self.cdn_mime_type if self.uses_cdn() else ''
 
     def get_embed_url(self):
-        """Converte links conhecidos em URLs incorporáveis."""
-        if self.uses_cdn() or not self.video_url:
-            return ''
-
-        url = self.video_url
+        """Converte links conhecidos em URLs incorporáveis (calculada ao salvar)."""
+        if self._state.adding:
+            self.refresh_video_metadata()
+        return self.embed_url
 
-        from urllib.parse import urlparse, parse_qs
 
-        parsed = urlparse(url)
-        netloc = parsed.netloc.lower().lstrip('www.')
-        path = parsed.path.rstrip('/')
-
-        def clean_segment(segment):
-            return segment.split('?')[0]
-
-        if 'youtube.com' in netloc or 'youtube-nocookie.com' in netloc:
-            if path == '/watch':
-                video_id = parse_qs(parsed.query).get('v', [''])[0]
-            else:
-                segments = [s for s in path.split('/') if s]
-                video_id = ''
-                if segments:
-                    if segments[0] in {'embed', 'shorts', 'live'} and len(segments) > 1:
-                        video_id = clean_segment(segments[1])
-                    else:
-                        video_id = clean_segment(segments[-1])
-
-            if video_id:
-                return f'https://www.youtube.com/embed/{video_id}'
-
-        if 'youtu.be' in netloc:
-            video_id = clean_segment(path.lstrip('/'))
-            if video_id:
-                return f'https://www.youtube.com/embed/{video_id}'
-
-        if 'vimeo.com' in netloc:
-            segments = [s for s in path.split('/') if s]
-            if segments:
-                video_id = clean_segment(segments[-1])
-                if video_id.isdigit():
-                    return f'https://player.vimeo.com/video/{video_id}'
-
-        return url
-
-
-class SectionPage(Page):
+class SectionPage(ArticleListingMixin, Page):
     """Página de seção para listar artigos de uma categoria específica"""
     section_key = models.CharField(
         max_length=50,
@@ -1269,6 +1508,9 @@ class SectionPage(Page):
         verbose_name="Fonte do Subtítulo",
         help_text="Escolha a fonte para o subtítulo/introdução da seção"
     )
+
+    # Campos de fonte e o peso em que aparecem (ver content.fonts)
+    FONT_FIELDS = {'title_font': 700, 'subtitle_font': 400}
     
     subtitle_size = models.CharField(
         max_length=20,
@@ -1295,58 +1537,21 @@ class SectionPage(Page):
     parent_page_types = ['content.HomePage']
     subpage_types = ['content.ArticlePage']
     
+    def get_listing_queryset(self):
+        """Artigos publicados cuja seção corresponde a esta página."""
+        return ArticlePage.objects.filter(section=self.section_key).live()
+    
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
         
-        # Get all articles in this section
-        all_articles = ArticlePage.objects.filter(
-            section=self.section_key
-        ).live()
-        
-        # 1. DESTAQUE PRINCIPAL (fixo manualmente)
-        featured_highlight = all_articles.filter(is_featured_highlight=True).order_by('-publication_date').first()
-        context['featured_article'] = featured_highlight
-        
-        # Exclude featured article from other listings
-        remaining_articles = all_articles.exclude(id=featured_highlight.id) if featured_highlight else all_articles
-        
-        # 2. NOTÍCIAS "EM ALTA" (automáticas ou manuais)
-        trending_articles = []
-        for article in remaining_articles:
-            if article.is_currently_trending():
-                trending_articles.append(article)
-        
-        trending_articles = sorted(trending_articles, key=lambda x: x.publication_date, reverse=True)
-        context['trending_articles'] = trending_articles
-        
-        # Get IDs of articles already shown
-        shown_ids = [featured_highlight.id] if featured_highlight else []
-        shown_ids.extend([a.id for a in trending_articles])
-        
-        # 3. ARTIGOS REGULARES E PREMIUM (todos visíveis nas listagens)
-        regular_articles = remaining_articles.exclude(id__in=shown_ids)
-        
-        # Check if user is authenticated and is a premium subscriber
-        user = request.user
-        is_premium_subscriber = (
-            user.is_authenticated and 
-            hasattr(user, 'userprofile') and
-            user.userprofile.is_subscriber
-        )
-        
-        # TODOS os artigos aparecem nas listagens (incluindo premium)
-        # O controle de acesso ao conteúdo completo é feito no template do artigo
+        from content.navigation import get_site_customization
+
+        # Fetch site customizations (once per request, cached)
+        context['site_customization'] = get_site_customization(request)
         
-        context['articles'] = regular_articles.order_by('-publication_date')
-        context['is_premium_subscriber'] = is_premium_subscriber
+        context.update(self.get_listing_context(request, context['site_customization']))
         context['section_name'] = dict(ArticlePage.SECTION_CHOICES).get(self.section_key)
         
-        # Fetch site customizations
-        try:
-            context['site_customization'] = SiteCustomization.objects.first()
-        except:
-            context['site_customization'] = None
-        
         return context
     
     class Meta:
@@ -1373,8 +1578,10 @@ class VideosPage(Page):
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
         
-        # Get all video shorts ordered by priority and date
-        context['videos'] = VideoShort.objects.all()
+        # Primeira página da grade (cacheada); as seguintes vêm de
+        # content.views.video_listing_fragment
+        from content.videos import build_video_page
+        context['videos'], context['next_cursor'] = build_video_page()
         
         return context
     
@@ -1383,7 +1590,7 @@ class VideosPage(Page):
         verbose_name_plural = "Páginas de Vídeos"
 
 
-class SupportSectionPage(Page):
+class SupportSectionPage(ArticleListingMixin, Page):
     """Página de seção de apoio para artigos e guias auxiliares"""
     introduction = models.TextField(
         blank=True,
@@ -1436,6 +1643,9 @@ class SupportSectionPage(Page):
         verbose_name="Fonte do Subtítulo",
         help_text="Escolha a fonte para o subtítulo/introdução da seção"
     )
+
+    # Campos de fonte e o peso em que aparecem (ver content.fonts)
+    FONT_FIELDS = {'title_font': 700, 'subtitle_font': 400}
     
     subtitle_size = models.CharField(
         max_length=20,
@@ -1479,51 +1689,12 @@ class SupportSectionPage(Page):
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
         
-        # Get all articles in this support section
-        all_articles = ArticlePage.objects.descendant_of(self).live()
-        
-        # 1. DESTAQUE PRINCIPAL (fixo manualmente)
-        featured_highlight = all_articles.filter(is_featured_highlight=True).order_by('-publication_date').first()
-        context['featured_article'] = featured_highlight
-        
-        # Exclude featured article from other listings
-        remaining_articles = all_articles.exclude(id=featured_highlight.id) if featured_highlight else all_articles
-        
-        # 2. NOTÍCIAS "EM ALTA" (automáticas ou manuais)
-        trending_articles = []
-        for article in remaining_articles:
-            if article.is_currently_trending():
-                trending_articles.append(article)
-        
-        trending_articles = sorted(trending_articles, key=lambda x: x.publication_date, reverse=True)
-        context['trending_articles'] = trending_articles
-        
-        # Get IDs of articles already shown
-        shown_ids = [featured_highlight.id] if featured_highlight else []
-        shown_ids.extend([a.id for a in trending_articles])
-        
-        # 3. ARTIGOS REGULARES E PREMIUM (todos visíveis nas listagens)
-        regular_articles = remaining_articles.exclude(id__in=shown_ids)
-        
-        # Check if user is authenticated and is a premium subscriber
-        user = request.user
-        is_premium_subscriber = (
-            user.is_authenticated and 
-            hasattr(user, 'userprofile') and
-            user.userprofile.is_subscriber
-        )
-        
-        # TODOS os artigos aparecem nas listagens (incluindo premium)
-        # O controle de acesso ao conteúdo completo é feito no template do artigo
-        
-        context['articles'] = regular_articles.order_by('-publication_date')
-        context['is_premium_subscriber'] = is_premium_subscriber
+        from content.navigation import get_site_customization
+
+        # Fetch site customizations (once per request, cached)
+        context['site_customization'] = get_site_customization(request)
         
-        # Fetch site customizations
-        try:
-            context['site_customization'] = SiteCustomization.objects.first()
-        except:
-            context['site_customization'] = None
+        context.update(self.get_listing_context(request, context['site_customization']))
         
         return context
     
@@ -1712,3 +1883,126 @@ class SiteCustomization(models.Model):
             raise ValidationError({
                 'short_videos_cta_label': 'Informe o texto do link da seção de vídeos ou deixe ambos os campos vazios.'
             })
+
+
+@receiver(page_published)
+def generate_published_page_renditions(sender, instance, **kwargs):
+    """Gera em segundo plano as renditions das imagens da página publicada."""
+    from content.renditions import schedule_page_renditions
+    schedule_page_renditions(instance)
+
+
+@receiver(page_published, sender=ArticlePage)
+def render_published_article_body(sender, instance, **kwargs):
+    """Guarda o corpo e a prévia renderizados da revisão publicada."""
+    from content.article_body import store_rendered_body
+    store_rendered_body(instance)
+
+
+@receiver(page_published, sender=ArticlePage)
+def attach_published_article_image(sender, instance, **kwargs):
+    """Liga (ou importa em segundo plano) a cópia local da imagem externa."""
+    from content.remote_images import schedule_article_image
+    schedule_article_image(instance)
+
+
+@receiver(page_published, sender=ArticlePage)
+def attach_published_article_video_posters(sender, instance, **kwargs):
+    """Importa em segundo plano os pôsteres dos vídeos do corpo."""
+    from content.remote_images import schedule_article_video_posters
+    schedule_article_video_posters(instance)
+
+
+@receiver(page_published, sender=ArticlePage)
+def transcode_published_article_gifs(sender, instance, **kwargs):
+    """Converte em segundo plano os GIFs do corpo para WebP animado/MP4."""
+    from content.gif_transcoding import schedule_article_gifs
+    schedule_article_gifs(instance)
+
+
+@receiver(post_save, sender=VideoShort)
+def attach_video_remote_thumbnail(sender, instance, raw=False, **kwargs):
+    """Liga (ou importa em segundo plano) a cópia local do thumbnail remoto."""
+    if raw:
+        return
+    from content.remote_images import schedule_video_thumbnail
+    schedule_video_thumbnail(instance)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def purge_page_cache_on_publish(sender, instance, **kwargs):
+    """Invalida o cache de página inteira da página e das listagens que a exibem."""
+    from content.page_cache import purge_page
+    purge_page(instance)
+
+
+@receiver(post_page_move)
+def purge_page_cache_on_move(sender, instance, parent_page_before, **kwargs):
+    """Invalida o cache das listagens do local antigo e do novo."""
+    from content.page_cache import purge_page
+    purge_page(instance.specific, previous_parent=parent_page_before)
+
+
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def purge_page_cache_on_view_restriction(sender, instance, **kwargs):
+    """Invalida o shell público da página (e das descendentes) que ganhou ou perdeu restrição."""
+    from content.page_cache import purge_page_tree
+    page = Page.objects.filter(pk=instance.page_id).first()
+    if page is not None:
+        purge_page_tree(page)
+
+
+@receiver(post_save, sender=SiteCustomization)
+@receiver(post_delete, sender=SiteCustomization)
+def invalidate_site_customization_navigation(sender, **kwargs):
+    """Recarrega a customização do site e descarta as páginas cacheadas com a antiga."""
+    from content.navigation import SITE_CUSTOMIZATION, invalidate_navigation
+    from content.page_cache import purge_all_pages
+    invalidate_navigation(SITE_CUSTOMIZATION)
+    purge_all_pages()
+
+
+@receiver(post_save, sender=SupportSectionPage)
+@receiver(post_delete, sender=SupportSectionPage)
+@receiver(page_unpublished, sender=SupportSectionPage)
+def invalidate_support_sections_navigation(sender, **kwargs):
+    """Recarrega o menu de seções de apoio do cabeçalho e descarta as páginas cacheadas."""
+    from content.navigation import SUPPORT_SECTIONS, invalidate_navigation
+    from content.page_cache import purge_all_pages
+    invalidate_navigation(SUPPORT_SECTIONS)
+    purge_all_pages()
+
+
+@receiver(page_published, sender=ArticlePage)
+@receiver(page_unpublished, sender=ArticlePage)
+def invalidate_topics_navigation(sender, **kwargs):
+    """Recarrega a lista de tópicos da navegação."""
+    from content.navigation import TOPICS, invalidate_navigation
+    invalidate_navigation(TOPICS)
+
+
+@receiver(post_save, sender=VideoShort)
+@receiver(post_delete, sender=VideoShort)
+def invalidate_video_listings(sender, **kwargs):
+    """Recarrega a faixa de vídeos da home e a primeira página da grade de vídeos."""
+    from django.db import transaction
+    from content.navigation import FEATURED_VIDEOS, VIDEOS_FIRST_PAGE, invalidate_navigation
+    from content.page_cache import purge_pages
+
+    invalidate_navigation(FEATURED_VIDEOS, VIDEOS_FIRST_PAGE)
+    home_ids = list(HomePage.objects.values_list('pk', flat=True))
+    transaction.on_commit(lambda: purge_pages(home_ids))
+
+
+@receiver(post_save, sender=HomePage)
+@receiver(post_delete, sender=HomePage)
+@receiver(page_published, sender=HomePage)
+@receiver(page_unpublished, sender=HomePage)
+def invalidate_home_page_navigation(sender, **kwargs):
+    """Recarrega a HomePage do context processor (rodapé) e descarta as páginas cacheadas."""
+    from content.navigation import HOME_PAGE, invalidate_navigation
+    from content.page_cache import purge_all_pages
+    invalidate_navigation(HOME_PAGE)
+    purge_all_pages()
@@ -0,0 +1,161 @@
+"""
+Cache dos dados globais do site usados em toda requisição.
+
+Cada grupo de dados (customização do site, home page, seções de apoio,
+tópicos) tem um token de versão no cache compartilhado. O valor fica em dois
+níveis: no cache compartilhado, para todos os processos, e em um dicionário
+local do processo, que evita desserializar o valor a cada requisição. Em
+regime normal o cabeçalho e as páginas custam apenas a leitura dos tokens de
+versão, sem consultas ao banco.
+
+Os mesmos tokens guardam a faixa de vídeos destacados e a primeira página da
+grade de vídeos (ver ``content.videos``).
+
+Os singletons (``get_site_customization`` e ``get_home_page``) ainda são
+guardados no próprio ``request``: cada requisição lê cada um deles no máximo
+uma vez, mesmo quando pedido por views, context processors e tags.
+
+Os tokens precisam de um cache compartilhado entre os processos do servidor
+(em produção, ``CACHE_DIR``). Em memória local do processo, como no
+desenvolvimento, os tokens expiram em ``PROCESS_LOCAL_VERSION_TIMEOUT``
+segundos: uma invalidação feita em outro processo aparece depois desse prazo.
+
+Salvar ``SiteCustomization``, ``HomePage``, ``SupportSectionPage`` ou
+``VideoShort`` e publicar ou despublicar artigos troca o token do grupo correspondente (ver os
+receivers em ``content.models``).
+"""
+
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+NAVIGATION_CACHE_PREFIX = 'navigation'
+NAVIGATION_CACHE_TIMEOUT = 60 * 60
+
+SITE_CUSTOMIZATION = 'site_customization'
+HOME_PAGE = 'home_page'
+SUPPORT_SECTIONS = 'support_sections'
+TOPICS = 'topics'
+FEATURED_VIDEOS = 'featured_videos'
+VIDEOS_FIRST_PAGE = 'videos_first_page'
+
+# Máximo de tópicos exibidos na navegação
+TOPICS_LIMIT = 20
+
+# Validade dos tokens quando o cache é a memória local de cada processo
+PROCESS_LOCAL_VERSION_TIMEOUT = 10
+
+# Cópia local do processo: nome -> (versão, valor)
+_local_cache = {}
+
+
+def get_navigation_cache():
+    return caches[getattr(settings, 'NAVIGATION_CACHE_ALIAS', 'default')]
+
+
+def _version_key(name):
+    return f'{NAVIGATION_CACHE_PREFIX}:version:{name}'
+
+
+def _version_timeout(cache):
+    """Tokens sem validade no cache compartilhado; validade curta na memória do processo."""
+    return PROCESS_LOCAL_VERSION_TIMEOUT if isinstance(cache, LocMemCache) else None
+
+
+def _get_version(cache, name):
+    version = cache.get(_version_key(name))
+    if version is None:
+        cache.add(_version_key(name), uuid.uuid4().hex, _version_timeout(cache))
+        version = cache.get(_version_key(name))
+    return version
+
+
+def get_navigation_data(name, loader):
+    """
+    Valor do grupo ``name``, calculado por ``loader`` apenas quando a versão
+    atual ainda não está em nenhum dos dois níveis de cache.
+    """
+    cache = get_navigation_cache()
+    version = _get_version(cache, name)
+
+    local = _local_cache.get(name)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    value_key = f'{NAVIGATION_CACHE_PREFIX}:{name}:{version}'
+    # O valor vai embrulhado em uma tupla para que None também seja cacheado
+    wrapped = cache.get(value_key)
+    if wrapped is None:
+        wrapped = (loader(),)
+        cache.set(value_key, wrapped, NAVIGATION_CACHE_TIMEOUT)
+
+    _local_cache[name] = (version, wrapped[0])
+    return wrapped[0]
+
+
+def invalidate_navigation(*names):
+    """
+    Troca o token de versão dos grupos informados.
+
+    A troca acontece na hora e de novo depois do commit, para descartar um
+    valor antigo que outro processo tenha recarregado durante a transação.
+    """
+    def bump():
+        cache = get_navigation_cache()
+        cache.set_many(
+            {_version_key(name): uuid.uuid4().hex for name in names}, _version_timeout(cache)
+        )
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def _get_request_scoped(request, name, loader):
+    """``get_navigation_data`` memorizado no ``request`` (quando houver um)."""
+    if request is None:
+        return get_navigation_data(name, loader)
+    loaded = request.__dict__.setdefault('_site_singletons', {})
+    if name not in loaded:
+        loaded[name] = get_navigation_data(name, loader)
+    return loaded[name]
+
+
+def get_site_customization(request=None):
+    """Configuração global do site (``SiteCustomization``), ou None."""
+    return _get_request_scoped(request, SITE_CUSTOMIZATION, load_site_customization)
+
+
+def get_home_page(request=None):
+    """Primeira HomePage publicada, ou None."""
+    return _get_request_scoped(request, HOME_PAGE, load_home_page)
+
+
+def load_site_customization():
+    SiteCustomization = apps.get_model('content', 'SiteCustomization')
+    return SiteCustomization.objects.first()
+
+
+def load_home_page():
+    HomePage = apps.get_model('content', 'HomePage')
+    return HomePage.objects.live().first()
+
+
+def load_support_sections():
+    SupportSectionPage = apps.get_model('content', 'SupportSectionPage')
+    return list(SupportSectionPage.objects.live().order_by('title'))
+
+
+def load_topics(limit=TOPICS_LIMIT):
+    """Os ``limit`` artigos publicados mais recentes, em ordem alfabética."""
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+    recent = (
+        ArticlePage.objects.live()
+        .only('title', 'url_path', 'publication_date')
+        .order_by('-publication_date', '-pk')[:limit]
+    )
+    return sorted(recent, key=lambda article: article.title.lower())
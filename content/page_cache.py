@@ -0,0 +1,275 @@
+"""
+Cache de página inteira para leitores anônimos.
+
+A maior parte do tráfego é de leitores anônimos da home, das seções e dos
+artigos. Para eles a resposta não depende do usuário, então o HTML pronto é
+guardado no cache (``PAGE_CACHE_TIMEOUT`` segundos) e servido sem passar por
+``get_context``, context processors e tags do cabeçalho.
+
+A chave combina a página, a URL completa (com query string) e o estado do
+paywall do leitor. Cada página tem um token de versão no cache: invalidar uma
+página é trocar esse token, o que descarta de uma vez todas as URLs dela. Os
+sinais de publicação, despublicação e movimentação do Wagtail invalidam
+apenas as páginas afetadas (ver ``affected_page_ids``). Mudanças que
+aparecem em todas as páginas (cabeçalho, rodapé e fontes: ``SiteCustomization``,
+``HomePage`` e o menu das seções de apoio) trocam a geração global, que
+também faz parte da chave (``purge_all_pages``).
+
+Artigos são servidos como *shell* (``serve_shell``): o HTML é renderizado
+como para um leitor anônimo, igual para todos, e sai com ``Cache-Control``
+público, ``ETag`` e sem ``Vary: Cookie``, podendo ficar também em CDN/proxy.
+Servir o shell não lê ``request.user`` (a sessão nem é carregada); a parte
+pessoal (conta no cabeçalho e corpo completo para assinantes) vem do
+fragmento ``content.views.article_reader_fragment``.
+"""
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+
+PAGE_CACHE_PREFIX = 'page-cache'
+PAGE_CACHE_HEADER = 'X-Page-Cache'
+
+# Cabeçalhos da resposta original guardados junto com o HTML
+STORED_HEADERS = ('Content-Type', 'Content-Language', 'Link', 'Cache-Control', 'ETag')
+
+# Estado usado na chave do shell dos artigos, o mesmo para qualquer leitor
+SHELL_STATE = 'shell'
+
+
+def get_page_cache():
+    return caches[getattr(settings, 'PAGE_CACHE_ALIAS', 'default')]
+
+
+def get_page_cache_timeout():
+    return getattr(settings, 'PAGE_CACHE_TIMEOUT', 0)
+
+
+def is_cacheable_page(page):
+    """Home, seções e seções de apoio (artigos usam ``serve_shell``)."""
+    from content.models import ArticleListingMixin
+    return isinstance(page, ArticleListingMixin)
+
+
+def is_shell_page(page):
+    """Páginas servidas como shell igual para todos os leitores."""
+    from content.models import ArticlePage
+    return isinstance(page, ArticlePage)
+
+
+def is_cacheable_request(request):
+    return (
+        request.method in ('GET', 'HEAD')
+        and not request.user.is_authenticated
+        and get_page_cache_timeout() > 0
+    )
+
+
+def paywall_state(request):
+    """Estado do paywall do leitor; das listagens, só o estado ``anonymous`` é cacheado."""
+    user = request.user
+    if not user.is_authenticated:
+        return 'anonymous'
+    if hasattr(user, 'userprofile') and user.userprofile.is_subscriber:
+        return 'subscriber'
+    return 'reader'
+
+
+GENERATION_KEY = f'{PAGE_CACHE_PREFIX}:generation'
+
+
+def _version_key(page_id):
+    return f'{PAGE_CACHE_PREFIX}:version:{page_id}'
+
+
+def _get_version(cache, page_id):
+    """Geração global e token da página, numa única ida ao cache."""
+    version_key = _version_key(page_id)
+    tokens = cache.get_many([GENERATION_KEY, version_key])
+    return f"{tokens.get(GENERATION_KEY, '0')}.{tokens.get(version_key, '0')}"
+
+
+def get_cache_key(page, request, version, state=None):
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    state = state or paywall_state(request)
+    return f'{PAGE_CACHE_PREFIX}:{page.pk}:{version}:{state}:{url}'
+
+
+def _is_storable(request, response):
+    """A resposta é igual para qualquer leitor anônimo?"""
+    if response.status_code != 200 or response.cookies or response.streaming:
+        return False
+    # Token CSRF ou sessão alterada tornam o HTML específico do visitante
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return False
+    session = getattr(request, 'session', None)
+    if session is not None and session.modified:
+        return False
+    cache_control = response.get('Cache-Control', '')
+    return not any(
+        directive in cache_control for directive in ('private', 'no-cache', 'no-store')
+    )
+
+
+def _cached_response(cached):
+    content, headers = cached
+    response = HttpResponse(content)
+    for name, value in headers.items():
+        response[name] = value
+    response[PAGE_CACHE_HEADER] = 'HIT'
+    return response
+
+
+def _store(cache, cache_key, response):
+    headers = {
+        name: response[name] for name in STORED_HEADERS if response.has_header(name)
+    }
+    cache.set(cache_key, (response.content, headers), get_page_cache_timeout())
+
+
+def serve_shell(serve, page, request, serve_args, serve_kwargs):
+    """
+    Serve o shell de ``page``: renderizado para um leitor anônimo e marcado
+    como público (``s-maxage`` = ``PAGE_CACHE_TIMEOUT``) com ``ETag``, para o
+    cache local e para caches compartilhados. Requisições condicionais com o
+    mesmo ``ETag`` recebem 304.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return serve(page, request, serve_args, serve_kwargs)
+
+    cache = get_page_cache()
+    timeout = get_page_cache_timeout()
+    cache_key = None
+    if timeout > 0:
+        version = _get_version(cache, page.pk)
+        cache_key = get_cache_key(page, request, version, SHELL_STATE)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            response = _cached_response(cached)
+            return get_conditional_response(request, etag=response['ETag'], response=response)
+
+    if page.get_view_restrictions().exists():
+        # Página restrita não é pública: renderiza para o usuário real, sem cache
+        return serve(page, request, serve_args, serve_kwargs)
+
+    # O shell é o HTML de um leitor anônimo; o usuário real nem é carregado
+    user = request.user
+    request.user = AnonymousUser()
+    try:
+        response = serve(page, request, serve_args, serve_kwargs)
+        if not getattr(response, 'is_rendered', True):
+            response.render()
+    finally:
+        request.user = user
+
+    if not _is_storable(request, response):
+        return response
+
+    response['ETag'] = quote_etag(hashlib.md5(response.content).hexdigest())
+    patch_cache_control(response, public=True, max_age=0, s_maxage=timeout)
+    response[PAGE_CACHE_HEADER] = 'MISS'
+    if cache_key:
+        _store(cache, cache_key, response)
+    return get_conditional_response(request, etag=response['ETag'], response=response)
+
+
+def serve_cached(serve, page, request, serve_args, serve_kwargs):
+    """
+    Serve ``page`` do cache quando possível; caso contrário chama ``serve``
+    e guarda a resposta renderizada.
+    """
+    if is_shell_page(page):
+        return serve_shell(serve, page, request, serve_args, serve_kwargs)
+    if not is_cacheable_request(request) or not is_cacheable_page(page):
+        return serve(page, request, serve_args, serve_kwargs)
+
+    cache = get_page_cache()
+    version = _get_version(cache, page.pk)
+    cache_key = get_cache_key(page, request, version)
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(cached)
+
+    response = serve(page, request, serve_args, serve_kwargs)
+
+    def store(response):
+        if _is_storable(request, response):
+            _store(cache, cache_key, response)
+
+    response[PAGE_CACHE_HEADER] = 'MISS'
+    if getattr(response, 'is_rendered', True):
+        store(response)
+    else:
+        response.add_post_render_callback(store)
+    return response
+
+
+def affected_page_ids(page, previous_parent=None):
+    """
+    Páginas cujo HTML muda quando ``page`` é publicada, despublicada ou movida.
+
+    A própria página, as páginas de listagem acima dela (home e seção de
+    apoio) e, para artigos, a página da seção correspondente. Em uma
+    movimentação, as listagens do local anterior também são incluídas.
+    """
+    from content.models import ArticlePage, HomePage, SectionPage, SupportSectionPage
+    from wagtail.models import Page
+
+    listing_types = (HomePage, SupportSectionPage)
+    page_ids = {page.pk}
+    page_ids.update(
+        Page.objects.ancestor_of(page).type(*listing_types).values_list('pk', flat=True)
+    )
+    if previous_parent is not None:
+        page_ids.update(
+            Page.objects.ancestor_of(previous_parent, inclusive=True)
+            .type(*listing_types).values_list('pk', flat=True)
+        )
+    if isinstance(page, ArticlePage) and page.section:
+        page_ids.update(
+            SectionPage.objects.filter(section_key=page.section).values_list('pk', flat=True)
+        )
+    return page_ids
+
+
+def purge_pages(page_ids):
+    """Invalida todas as URLs cacheadas das páginas informadas."""
+    cache = get_page_cache()
+    cache.set_many(
+        {_version_key(page_id): uuid.uuid4().hex for page_id in page_ids},
+        None,
+    )
+
+
+def purge_all_pages():
+    """Invalida, depois do commit, todas as páginas cacheadas."""
+    transaction.on_commit(
+        lambda: get_page_cache().set(GENERATION_KEY, uuid.uuid4().hex, None)
+    )
+
+
+def purge_page(page, previous_parent=None):
+    """Invalida, depois do commit, as páginas afetadas por uma alteração em ``page``."""
+    page_ids = affected_page_ids(page, previous_parent)
+    transaction.on_commit(lambda: purge_pages(page_ids))
+
+
+def purge_page_tree(page):
+    """
+    Invalida, depois do commit, ``page``, todas as descendentes e as listagens
+    acima dela: uma restrição de acesso vale para a subárvore inteira.
+    """
+    from wagtail.models import Page
+
+    page_ids = affected_page_ids(page.specific)
+    page_ids.update(Page.objects.descendant_of(page).values_list('pk', flat=True))
+    transaction.on_commit(lambda: purge_pages(page_ids))
@@ -0,0 +1,324 @@
+"""
+Cópia local das imagens hospedadas fora do site.
+
+Cards com ``external_image_url``, thumbnails de vídeos (URL externa,
+YouTube, Vimeo) e pôsteres dos vídeos do corpo dos artigos apontavam para servidores de terceiros em toda renderização:
+cada leitor pagava DNS/TLS extras e recebia a imagem no tamanho original.
+
+Agora cada URL externa é baixada uma única vez, vira uma imagem do Wagtail
+(``RemoteImage`` guarda a associação URL -> imagem) e ganha as mesmas
+renditions das imagens locais. Os cards passam a servir a rendition do nosso
+storage; enquanto a cópia não existe (ou se o download falhar), continuam
+usando a URL externa.
+
+- A importação é enfileirada depois do commit, ao publicar um artigo ou salvar
+  um ``VideoShort`` (tarefas ``ingest_article_image``,
+  ``ingest_article_video_posters`` e ``ingest_video_thumbnail``, executadas
+  pelo ``manage.py db_worker``); o
+  comando ``ingest_remote_images`` processa o acervo existente e tenta de novo
+  o que falhou.
+- O download é feito pela função indicada em ``REMOTE_IMAGE_FETCHER``
+  (``fetcher(url) -> bytes``, levantando ``RemoteImageError``); os testes
+  usam um fetcher local.
+- Falhas ficam registradas e só são tentadas de novo depois de
+  ``REMOTE_IMAGE_RETRY_AFTER`` segundos (ou na hora, pelo comando).
+"""
+
+import hashlib
+import io
+import logging
+import urllib.error
+import urllib.request
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.images import ImageFile
+from django.db import IntegrityError
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django_tasks import task
+from wagtail.images import get_image_model
+
+from content.renditions import ARTICLE_IMAGE_SPECS, RESPONSIVE_IMAGE_SPECS, generate_renditions
+
+
+logger = logging.getLogger(__name__)
+
+
+# Thumbnails dos vídeos curtos (cards 9:16)
+VIDEO_THUMBNAIL_SPEC = 'fill-360x640'
+VIDEO_THUMBNAIL_SPECS = (VIDEO_THUMBNAIL_SPEC,)
+
+# Formatos aceitos (nome do Willow -> extensão do arquivo)
+IMAGE_FORMATS = {'jpeg': 'jpg', 'png': 'png', 'gif': 'gif', 'webp': 'webp'}
+
+
+class RemoteImageError(Exception):
+    """Não foi possível baixar ou interpretar uma imagem remota."""
+
+
+def url_hash(url):
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def urllib_fetcher(url):
+    """Fetcher padrão: baixa ``url`` com ``urllib``, com tempo e tamanho limitados."""
+    timeout = getattr(settings, 'REMOTE_IMAGE_TIMEOUT', 10)
+    max_bytes = getattr(settings, 'REMOTE_IMAGE_MAX_BYTES', 10 * 1024 * 1024)
+    request = urllib.request.Request(url, headers={'User-Agent': 'PortalImageFetcher/1.0'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            content_type = response.headers.get('Content-Type', '')
+            if not content_type.startswith('image/'):
+                raise RemoteImageError(f'Conteúdo não é imagem: {content_type or "desconhecido"}')
+            data = response.read(max_bytes + 1)
+    except (urllib.error.URLError, OSError, ValueError) as exc:
+        raise RemoteImageError(str(exc)) from exc
+    if len(data) > max_bytes:
+        raise RemoteImageError(f'Imagem maior que {max_bytes} bytes')
+    return data
+
+
+def get_fetcher():
+    return import_string(
+        getattr(settings, 'REMOTE_IMAGE_FETCHER', 'content.remote_images.urllib_fetcher')
+    )
+
+
+def _create_image(url, data, source_hash):
+    """Grava os bytes baixados como imagem do Wagtail."""
+    from willow.image import Image as WillowImage
+
+    try:
+        format_name = WillowImage.open(io.BytesIO(data)).format_name
+    except Exception as exc:
+        raise RemoteImageError('Arquivo de imagem inválido') from exc
+    if format_name not in IMAGE_FORMATS:
+        raise RemoteImageError(f'Formato não suportado: {format_name}')
+
+    filename = f'remote-{source_hash[:16]}.{IMAGE_FORMATS[format_name]}'
+    image = get_image_model()(title=url[:255], file=ImageFile(io.BytesIO(data), name=filename))
+    image.save()
+    return image
+
+
+def ingest_remote_image(url, specs=ARTICLE_IMAGE_SPECS, fetcher=None, retry_failed=False):
+    """
+    Garante a cópia local de ``url`` com as renditions ``specs``.
+
+    Com ``retry_failed``, uma falha recente é tentada de novo sem esperar
+    ``REMOTE_IMAGE_RETRY_AFTER``.
+
+    Returns:
+        RemoteImage: com ``image`` preenchido, ou vazio se o download falhou
+    """
+    RemoteImage = apps.get_model('content', 'RemoteImage')
+
+    source_hash = url_hash(url)
+    try:
+        remote, _ = RemoteImage.objects.get_or_create(
+            source_hash=source_hash, defaults={'source_url': url}
+        )
+    except IntegrityError:
+        # Outra tarefa criou o registro ao mesmo tempo
+        remote = RemoteImage.objects.get(source_hash=source_hash)
+
+    if not remote.image_id:
+        retry_after = timedelta(seconds=getattr(settings, 'REMOTE_IMAGE_RETRY_AFTER', 3600))
+        recently_failed = (
+            remote.attempted_at and timezone.now() - remote.attempted_at < retry_after
+        )
+        if recently_failed and not retry_failed:
+            return remote
+        remote.attempted_at = timezone.now()
+        try:
+            data = (fetcher or get_fetcher())(url)
+            remote.image = _create_image(url, data, source_hash)
+            remote.last_error = ''
+        except RemoteImageError as exc:
+            logger.warning("Falha ao importar a imagem remota %s: %s", url, exc)
+            remote.last_error = str(exc)[:255]
+        remote.save()
+
+    if remote.image_id:
+        generate_renditions([remote.image_id], specs)
+    return remote
+
+
+def find_ingested(url):
+    """``RemoteImage`` já importado para ``url``, ou None (uma consulta)."""
+    RemoteImage = apps.get_model('content', 'RemoteImage')
+    return (
+        RemoteImage.objects.filter(source_hash=url_hash(url), image__isnull=False)
+        .select_related('image').first()
+    )
+
+
+def pending_remote_urls(urls):
+    """URLs de ``urls`` ainda sem cópia local (uma consulta)."""
+    RemoteImage = apps.get_model('content', 'RemoteImage')
+
+    if not urls:
+        return []
+    ingested = set(RemoteImage.objects.filter(
+        source_hash__in=[url_hash(url) for url in urls], image__isnull=False,
+    ).values_list('source_hash', flat=True))
+    return [url for url in urls if url_hash(url) not in ingested]
+
+
+def article_video_posters(article):
+    """Thumbnails das plataformas para os blocos ``video`` do corpo de ``article``."""
+    from content.article_body import body_video_urls
+    from content.video_providers import parse_video_url
+
+    matches = (parse_video_url(url) for url in body_video_urls(article))
+    return list(dict.fromkeys(match.thumbnail_url for match in matches if match))
+
+
+def attach_article_image(article_id, fetcher=None, retry_failed=False):
+    """Importa a imagem externa do artigo e liga a cópia em ``external_image``."""
+    from content.page_cache import purge_page
+
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+    article = ArticlePage.objects.filter(pk=article_id).only('external_image_url', 'section', 'path').first()
+    if article is None or not article.external_image_url:
+        return None
+
+    remote = ingest_remote_image(
+        article.external_image_url, ARTICLE_IMAGE_SPECS, fetcher, retry_failed
+    )
+    if not remote.image_id:
+        return None
+    # Só liga se a URL não mudou durante o download
+    updated = ArticlePage.objects.filter(
+        pk=article_id, external_image_url=remote.source_url
+    ).update(external_image=remote)
+    if updated:
+        purge_page(article)
+    return remote
+
+
+def attach_video_thumbnail(video_id, fetcher=None, retry_failed=False):
+    """Importa o thumbnail remoto do vídeo e liga a cópia em ``remote_thumbnail``."""
+    from content.navigation import FEATURED_VIDEOS, VIDEOS_FIRST_PAGE, invalidate_navigation
+
+    VideoShort = apps.get_model('content', 'VideoShort')
+    video = VideoShort.objects.filter(pk=video_id).first()
+    source_url = video.get_remote_thumbnail_source() if video else ''
+    if not source_url:
+        return None
+
+    remote = ingest_remote_image(source_url, VIDEO_THUMBNAIL_SPECS, fetcher, retry_failed)
+    if not remote.image_id:
+        return None
+    # update(): não dispara post_save (que agendaria esta mesma tarefa de novo)
+    VideoShort.objects.filter(pk=video_id).update(remote_thumbnail=remote)
+    invalidate_navigation(FEATURED_VIDEOS, VIDEOS_FIRST_PAGE)
+    return remote
+
+
+def attach_video_poster(url, fetcher=None, retry_failed=False):
+    """Importa o pôster de um vídeo do corpo com as renditions do ``<picture>``."""
+    remote = ingest_remote_image(url, RESPONSIVE_IMAGE_SPECS, fetcher, retry_failed)
+    return remote if remote.image_id else None
+
+
+def attach_article_video_posters(article_id, fetcher=None, retry_failed=False):
+    """
+    Importa os pôsteres ainda sem cópia local dos vídeos do corpo do artigo
+    publicado e renderiza de novo o corpo guardado.
+
+    Returns:
+        int: Número de pôsteres importados
+    """
+    from content.gif_transcoding import refresh_article_body
+
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+    article = ArticlePage.objects.live().filter(pk=article_id).only('content_blocks').first()
+    if article is None:
+        return 0
+
+    attached = sum(
+        1 for url in pending_remote_urls(article_video_posters(article))
+        if attach_video_poster(url, fetcher, retry_failed) is not None
+    )
+    if attached:
+        refresh_article_body(article_id)
+    return attached
+
+
+@task()
+def ingest_article_image(article_id):
+    """
+    Tarefa: ``attach_article_image`` no ``db_worker``.
+
+    Returns:
+        int | None: pk do ``RemoteImage`` ligado ao artigo
+    """
+    remote = attach_article_image(article_id)
+    return remote.pk if remote else None
+
+
+@task()
+def ingest_video_thumbnail(video_id):
+    """
+    Tarefa: ``attach_video_thumbnail`` no ``db_worker``.
+
+    Returns:
+        int | None: pk do ``RemoteImage`` ligado ao vídeo
+    """
+    remote = attach_video_thumbnail(video_id)
+    return remote.pk if remote else None
+
+
+@task()
+def ingest_article_video_posters(article_id):
+    """
+    Tarefa: ``attach_article_video_posters`` no ``db_worker``.
+
+    Returns:
+        int: Número de pôsteres importados
+    """
+    return attach_article_video_posters(article_id)
+
+
+def schedule_article_image(article):
+    """
+    Liga a imagem externa de um artigo publicado à sua cópia local.
+
+    Se a URL já foi importada, liga na hora; senão enfileira o download para
+    depois do commit.
+    """
+    ArticlePage = apps.get_model('content', 'ArticlePage')
+
+    url = article.external_image_url
+    remote = find_ingested(url) if url else None
+    if remote is not None or not url:
+        remote_id = remote.pk if remote else None
+        if article.external_image_id != remote_id:
+            ArticlePage.objects.filter(pk=article.pk).update(external_image=remote)
+            article.external_image = remote
+        return
+    ingest_article_image.enqueue(article.pk)
+
+
+def schedule_video_thumbnail(video):
+    """Como ``schedule_article_image``, para o thumbnail remoto de um ``VideoShort``."""
+    VideoShort = apps.get_model('content', 'VideoShort')
+
+    url = video.get_remote_thumbnail_source()
+    remote = find_ingested(url) if url else None
+    if remote is not None or not url:
+        remote_id = remote.pk if remote else None
+        if video.remote_thumbnail_id != remote_id:
+            VideoShort.objects.filter(pk=video.pk).update(remote_thumbnail=remote)
+            video.remote_thumbnail = remote
+        return
+    ingest_video_thumbnail.enqueue(video.pk)
+
+
+def schedule_article_video_posters(article):
+    """Enfileira, para depois do commit, a importação dos pôsteres de vídeo sem cópia local."""
+    if pending_remote_urls(article_video_posters(article)):
+        ingest_article_video_posters.enqueue(article.pk)
@@ -0,0 +1,286 @@
+"""
+Geração e carregamento em lote das renditions de imagens.
+
+As listagens precisam de poucas variações de cada imagem (cards, destaque,
+seções curadas). Em vez de cada ``{% image %}`` procurar ou gerar sua
+rendition isoladamente, as renditions são:
+
+* geradas antes de serem pedidas: ao publicar um artigo (tarefa
+  ``warm_page_renditions``, enfileirada depois do commit e executada pelo
+  ``manage.py db_worker``) e pelo comando ``manage.py warm_renditions``;
+* lidas em lote junto com os artigos, com uma consulta por listagem;
+* servidas pelas tags ``{% ready_rendition %}`` e ``{% responsive_image %}``
+  (``<picture>`` com srcset em AVIF/WebP), que nunca redimensionam a imagem
+  durante a requisição: se a rendition ainda não existe, usam o arquivo
+  original.
+
+Na página do artigo, a imagem de destaque e as imagens do corpo são
+responsivas; depois de gerar as renditions de uma publicação, o corpo
+guardado é renderizado de novo para incluir o srcset.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.db import connections
+from django.db.models import Prefetch
+from django_tasks import task
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+
+
+logger = logging.getLogger(__name__)
+
+
+# srcset das imagens dos artigos (destaque e imagens do corpo): cada largura
+# em AVIF, em WebP e no formato original, que fica como fallback do <img>
+RESPONSIVE_WIDTHS = (480, 800, 1200, 1600)
+RESPONSIVE_FORMATS = ('avif', 'webp')
+RESPONSIVE_MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+
+# Coluna do artigo: até 868px (.modern-article menos o padding)
+ARTICLE_IMAGE_SIZES = '(min-width: 900px) 868px, 100vw'
+
+# <img src> de navegadores sem srcset, destaque das seções e compartilhamento
+FALLBACK_IMAGE_SPEC = 'width-1200'
+
+
+def responsive_specs(widths=RESPONSIVE_WIDTHS, formats=RESPONSIVE_FORMATS):
+    """Specs do srcset: cada largura no formato original e em cada um de ``formats``."""
+    return tuple(
+        f'width-{width}' if image_format is None else f'width-{width}|format-{image_format}'
+        for image_format in (None, *formats)
+        for width in widths
+    )
+
+
+RESPONSIVE_IMAGE_SPECS = responsive_specs()
+
+# Variações usadas pelos cards das listagens
+CARD_IMAGE_SPECS = (
+    'fill-300x200',  # Listagem de tópicos
+    'fill-400x250',  # Cards
+    'fill-600x400',  # Seções curadas da home
+    'fill-900x600',  # Destaque da home
+    FALLBACK_IMAGE_SPEC,  # Destaque das seções
+)
+# Imagem de destaque: cards e página do artigo
+ARTICLE_IMAGE_SPECS = tuple(dict.fromkeys((*CARD_IMAGE_SPECS, *RESPONSIVE_IMAGE_SPECS)))
+HERO_IMAGE_SPECS = ('fill-1600x900',)
+# Poster do vídeo de destaque (o atributo poster não aceita srcset)
+POSTER_IMAGE_SPEC = 'width-1600'
+POSTER_IMAGE_SPECS = (POSTER_IMAGE_SPEC,)
+
+# Imagens de cada tipo de página que têm renditions pré-geradas
+PAGE_IMAGE_SPECS = {
+    'content.ArticlePage': {
+        'featured_image': ARTICLE_IMAGE_SPECS,
+        'highlight_video_poster': POSTER_IMAGE_SPECS,
+    },
+    'content.HomePage': {'hero_background_image': HERO_IMAGE_SPECS},
+}
+
+
+def rendition_prefetch(lookup, specs=ARTICLE_IMAGE_SPECS):
+    """
+    Prefetch das renditions de uma imagem relacionada (ex.: ``'featured_image'``).
+
+    Preenche ``prefetched_renditions``, que o Wagtail consulta antes de ir ao
+    banco, com uma única consulta para todas as imagens da listagem.
+    """
+    rendition_model = get_image_model().get_rendition_model()
+    return Prefetch(
+        f'{lookup}__renditions',
+        queryset=rendition_model.objects.filter(filter_spec__in=specs),
+        to_attr='prefetched_renditions',
+    )
+
+
+class OriginalImage:
+    """Substituto de rendition que aponta para o arquivo original da imagem."""
+
+    def __init__(self, image):
+        self.image = image
+        self.url = image.file.url
+        self.alt = image.default_alt_text
+        self.width = image.width
+        self.height = image.height
+
+
+def ready_rendition(image, spec):
+    """
+    Rendition já gerada de ``image`` para ``spec``, sem nunca gerar uma nova.
+
+    Returns:
+        Rendition existente, ``OriginalImage`` se ela ainda não foi gerada ou
+        ``None`` se não houver imagem
+    """
+    if image is None:
+        return None
+    rendition_model = image.get_rendition_model()
+    try:
+        return image.find_existing_rendition(Filter(spec=spec))
+    except rendition_model.DoesNotExist:
+        logger.info("Rendition %s da imagem %s ainda não gerada", spec, image.pk)
+        return OriginalImage(image)
+
+
+class ResponsiveImage:
+    """
+    Fontes de um ``<picture>`` responsivo montadas só com renditions já geradas.
+
+    ``sources`` traz ``(tipo MIME, srcset)`` dos formatos modernos; ``srcset``,
+    ``url``, ``width`` e ``height`` descrevem o ``<img>`` no formato original.
+    Sem renditions, sobra o ``<img>`` com o arquivo original.
+    """
+
+    def __init__(self, image, widths=RESPONSIVE_WIDTHS, formats=RESPONSIVE_FORMATS):
+        filters = [Filter(spec=spec) for spec in responsive_specs(widths, formats)]
+        by_spec = {
+            rendition_filter.spec: rendition
+            for rendition_filter, rendition in image.find_existing_renditions(*filters).items()
+        }
+
+        self.sources = []
+        for image_format in formats:
+            srcset = self._srcset(by_spec.get(f'width-{width}|format-{image_format}') for width in widths)
+            if srcset:
+                self.sources.append((RESPONSIVE_MIME_TYPES[image_format], srcset))
+
+        fallbacks = [by_spec[f'width-{width}'] for width in widths if f'width-{width}' in by_spec]
+        self.srcset = self._srcset(fallbacks)
+        fallback = by_spec.get(FALLBACK_IMAGE_SPEC) or (fallbacks[-1] if fallbacks else OriginalImage(image))
+        self.url = fallback.url
+        self.width = fallback.width
+        self.height = fallback.height
+        self.alt = image.default_alt_text
+
+    @staticmethod
+    def _srcset(renditions):
+        # Imagens menores que a largura pedida não são ampliadas: larguras repetidas saem
+        urls = {}
+        for rendition in renditions:
+            if rendition is not None:
+                urls.setdefault(rendition.width, rendition.url)
+        return ', '.join(f'{url} {width}w' for width, url in sorted(urls.items()))
+
+
+def responsive_image(image, widths=RESPONSIVE_WIDTHS, formats=RESPONSIVE_FORMATS):
+    """``ResponsiveImage`` de ``image`` (uma consulta), ou ``None`` se não houver imagem."""
+    if image is None:
+        return None
+    return ResponsiveImage(image, widths, formats)
+
+
+def generate_renditions(image_ids, specs=ARTICLE_IMAGE_SPECS):
+    """
+    Gera as renditions que faltam para as imagens informadas.
+
+    Returns:
+        int: Número de imagens processadas
+    """
+    processed = 0
+    for image in get_image_model().objects.filter(pk__in=image_ids):
+        try:
+            image.get_renditions(*specs)
+        except Exception:
+            logger.exception("Falha ao gerar renditions da imagem %s", image.pk)
+            continue
+        processed += 1
+    return processed
+
+
+def _generate_in_worker(image_ids, specs=ARTICLE_IMAGE_SPECS):
+    """``generate_renditions`` para os processos auxiliares."""
+    try:
+        return generate_renditions(image_ids, specs)
+    finally:
+        connections.close_all()
+
+
+def warm_renditions(image_ids, specs=ARTICLE_IMAGE_SPECS, workers=None, batch_size=20):
+    """
+    Gera as renditions de várias imagens em paralelo, em processos separados.
+
+    Returns:
+        int: Número de imagens processadas
+    """
+    image_ids = list(image_ids)
+    batches = [
+        image_ids[start:start + batch_size]
+        for start in range(0, len(image_ids), batch_size)
+    ]
+    if not batches:
+        return 0
+    if workers == 1:
+        return sum(generate_renditions(batch, specs) for batch in batches)
+
+    # Os processos filhos não podem herdar conexões abertas com o banco
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        return sum(executor.map(_generate_in_worker, batches, [specs] * len(batches)))
+
+
+def page_image_jobs(page):
+    """Pares ``(ids de imagens, specs)`` com as renditions usadas pela página."""
+    jobs = [
+        ([getattr(page, f'{field_name}_id')], specs)
+        for field_name, specs in PAGE_IMAGE_SPECS.get(page._meta.label, {}).items()
+        if getattr(page, f'{field_name}_id')
+    ]
+    if page._meta.label == 'content.ArticlePage':
+        from content.article_body import body_image_ids
+
+        image_ids = body_image_ids(page)
+        if image_ids:
+            jobs.append((image_ids, RESPONSIVE_IMAGE_SPECS))
+    return jobs
+
+
+def refresh_page_images(page_id):
+    """
+    Atualiza o HTML montado antes das renditions existirem: o corpo guardado
+    do artigo (srcset das imagens do corpo) e o cache das páginas afetadas.
+    """
+    from wagtail.models import Page
+    from content.article_body import body_image_ids, store_rendered_body
+    from content.page_cache import purge_page
+
+    page = Page.objects.live().filter(pk=page_id).specific().first()
+    if page is None:
+        return
+    if page._meta.label == 'content.ArticlePage' and body_image_ids(page):
+        store_rendered_body(page)
+    purge_page(page)
+
+
+@task()
+def warm_page_renditions(page_id):
+    """
+    Tarefa: gera as renditions da página publicada e atualiza o HTML montado sem elas.
+
+    Falhas ficam registradas no resultado da tarefa, pelo ``db_worker``.
+
+    Returns:
+        int: Número de imagens processadas
+    """
+    from wagtail.models import Page
+
+    page = Page.objects.live().filter(pk=page_id).specific().first()
+    if page is None:
+        return 0
+    processed = sum(
+        generate_renditions(image_ids, specs) for image_ids, specs in page_image_jobs(page)
+    )
+    refresh_page_images(page_id)
+    return processed
+
+
+def schedule_page_renditions(page):
+    """
+    Enfileira, para depois do commit, a geração das renditions de uma página
+    publicada (campos de ``PAGE_IMAGE_SPECS`` e imagens do corpo dos artigos).
+    """
+    if page_image_jobs(page):
+        warm_page_renditions.enqueue(page.pk)
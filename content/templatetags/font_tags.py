@@ -0,0 +1,22 @@
+# content/templatetags/font_tags.py
+
+from django import template
+
+from content.fonts import build_page_fonts, page_font_uses
+
+register = template.Library()
+
+@register.inclusion_tag('content/partials/page_fonts.html', takes_context=True)
+def page_fonts(context):
+    """
+    ``@font-face``/preload só das fontes que a página usa (ver ``content.fonts``).
+
+    Uso no ``<head>`` do ``base.html``, depois de ``get_site_customization``:
+    ``{% page_fonts %}``. Lê ``page`` e ``featured_article`` do contexto.
+    """
+    uses = page_font_uses(
+        site_customization=context.get('global_site_customization'),
+        page=context.get('page'),
+        featured_article=context.get('featured_article'),
+    )
+    return {'fonts': build_page_fonts(uses)}
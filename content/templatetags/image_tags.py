@@ -0,0 +1,52 @@
+# content/templatetags/image_tags.py
+
+from django import template
+
+from content.gif_transcoding import find_transcoded
+from content.renditions import ARTICLE_IMAGE_SIZES
+from content.renditions import ready_rendition as get_ready_rendition
+from content.renditions import responsive_image as get_responsive_image
+
+register = template.Library()
+
+@register.simple_tag()
+def ready_rendition(image, spec):
+    """
+    Rendition pré-gerada da imagem, sem redimensionar durante a requisição.
+
+    Uso: ``{% ready_rendition article.featured_image "fill-400x250" as thumb %}``
+    e depois ``thumb.url`` / ``thumb.alt``. Enquanto a rendition não for
+    gerada (publicação ou ``manage.py warm_renditions``), aponta para o
+    arquivo original.
+    """
+    return get_ready_rendition(image, spec)
+
+
+@register.simple_tag()
+def transcoded_gif(url):
+    """
+    Versões WebP animado/MP4 do GIF em ``url`` (ver ``content.gif_transcoding``).
+
+    Uso: ``{% transcoded_gif value.gif_url as gif %}``; ``None`` enquanto o
+    GIF não for convertido.
+    """
+    return find_transcoded(url)
+
+
+@register.inclusion_tag('content/partials/responsive_image.html')
+def responsive_image(image, sizes=ARTICLE_IMAGE_SIZES, alt=None, css_class='', loading='lazy'):
+    """
+    ``<picture>`` com srcset em AVIF, WebP e no formato original, montado só
+    com renditions pré-geradas (ver ``content.renditions.ResponsiveImage``).
+
+    Uso: ``{% responsive_image page.featured_image css_class="img-fluid" %}``;
+    ``sizes`` padrão: a coluna do artigo.
+    """
+    picture = get_responsive_image(image)
+    return {
+        'picture': picture,
+        'sizes': sizes,
+        'alt': picture.alt if picture is not None and alt is None else alt,
+        'css_class': css_class,
+        'loading': loading,
+    }
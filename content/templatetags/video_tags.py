@@ -0,0 +1,35 @@
+# content/templatetags/video_tags.py
+
+from django import template
+
+from content.remote_images import find_ingested
+from content.renditions import ARTICLE_IMAGE_SIZES
+from content.renditions import responsive_image as get_responsive_image
+from content.video_providers import parse_video_url
+
+register = template.Library()
+
+@register.inclusion_tag('content/partials/video_facade.html')
+def video_facade(value):
+    """
+    Pôster e botão de play no lugar do iframe de um ``EmbedBlock``.
+
+    O ``main.js`` troca a fachada pelo player da plataforma no clique; sem JS,
+    o botão abre o vídeo na plataforma. O pôster vem da cópia local
+    (``content.remote_images``) quando já importada, senão do thumbnail da
+    plataforma. Links de plataformas não registradas em
+    ``content.video_providers`` usam o embed completo.
+
+    Uso: ``{% video_facade block.value %}``
+    """
+    url = getattr(value, 'url', value) or ''
+    match = parse_video_url(url)
+    remote = find_ingested(match.thumbnail_url) if match else None
+    return {
+        'value': value,
+        'url': url,
+        'video': match,
+        'poster': get_responsive_image(remote.image) if remote else None,
+        'sizes': ARTICLE_IMAGE_SIZES,
+        'ratio': '9x16' if '/shorts/' in url else '16x9',
+    }
@@ -0,0 +1,164 @@
+"""
+Tests for the pre-rendered article body.
+
+This test suite ensures:
+1. Publishing stores the full body and the paywall preview for the live revision
+2. The article shell and the reader fragment serve the stored HTML
+3. Revisions don't carry the stored HTML, and a new publish re-renders it
+4. The render_article_bodies command backfills articles without stored HTML
+5. The paywall preview respects its block/word budget, also for legacy bodies
+6. Anonymous readers of premium articles never load the body columns
+"""
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from wagtail.models import Site
+
+from content.article_body import extract_preview
+from content.models import ArticlePage
+from content.test_listings import ArticleListingFixtureMixin
+
+
+def paragraphs(*texts):
+    return [('paragraph', f'<p>{text}</p>') for text in texts]
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=0)
+class RenderedArticleBodyTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test storing and serving the pre-rendered body"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver', root_page=self.home_page, is_default_site=True, site_name='Test Site',
+        )
+        self.article = ArticlePage(
+            title="Premium", slug="premium", introduction="Resumo", is_premium=True,
+            content_blocks=paragraphs("Primeiro parágrafo", "Segundo parágrafo", "Parágrafo exclusivo"),
+        )
+        self.home_page.add_child(instance=self.article)
+        self.article.save_revision().publish()
+        self.article.refresh_from_db()
+
+        self.subscriber = User.objects.create_user(username='assinante', password='senha-segura-123')
+        self.subscriber.userprofile.is_subscriber = True
+        self.subscriber.userprofile.save()
+
+    def reader_body(self):
+        response = self.client.get(reverse('article_reader_fragment', args=[self.article.pk]))
+        return response.json()['slots'].get('article-body', '')
+
+    def test_publish_stores_body_and_preview(self):
+        self.assertTrue(self.article.has_current_rendered_body())
+        self.assertEqual(self.article.rendered_revision_id, self.article.live_revision_id)
+        self.assertIn("Parágrafo exclusivo", self.article.rendered_body)
+        self.assertIn("Primeiro parágrafo", self.article.rendered_preview)
+        self.assertNotIn("Parágrafo exclusivo", self.article.rendered_preview)
+
+    def test_views_serve_stored_html(self):
+        ArticlePage.objects.filter(pk=self.article.pk).update(
+            rendered_body='<p>corpo-guardado</p>', rendered_preview='<p>previa-guardada</p>',
+        )
+
+        anonymous = self.client.get(self.article.url)
+        self.assertContains(anonymous, 'previa-guardada')
+        self.assertNotContains(anonymous, 'corpo-guardado')
+
+        self.client.force_login(self.subscriber)
+        self.assertIn('corpo-guardado', self.reader_body())
+
+    def test_stale_html_is_not_served(self):
+        ArticlePage.objects.filter(pk=self.article.pk).update(
+            rendered_body='<p>corpo-guardado</p>', rendered_revision=None,
+        )
+        self.client.force_login(self.subscriber)
+
+        body = self.reader_body()
+
+        self.assertNotIn('corpo-guardado', body)
+        self.assertIn('Parágrafo exclusivo', body)
+
+    def test_new_publish_rerenders_and_revisions_skip_html(self):
+        self.article.content_blocks = paragraphs("Texto revisado")
+        revision = self.article.save_revision()
+
+        self.assertNotIn('rendered_body', revision.content)
+        self.assertNotIn('rendered_revision', revision.content)
+
+        revision.publish()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rendered_revision_id, revision.pk)
+        self.assertIn("Texto revisado", self.article.rendered_body)
+
+    def test_backfill_command(self):
+        ArticlePage.objects.filter(pk=self.article.pk).update(rendered_body='', rendered_at=None)
+        output = StringIO()
+
+        call_command('render_article_bodies', stdout=output)
+        call_command('render_article_bodies', stdout=output)
+
+        self.article.refresh_from_db()
+        self.assertTrue(self.article.has_current_rendered_body())
+        self.assertIn("Parágrafo exclusivo", self.article.rendered_body)
+        self.assertIn('1 artigos renderizados (0 já estavam atualizados)', output.getvalue())
+        self.assertIn('0 artigos renderizados (1 já estavam atualizados)', output.getvalue())
+
+
+class PaywallPreviewTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the stored paywall preview and the body columns it avoids"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver', root_page=self.home_page, is_default_site=True, site_name='Test Site',
+        )
+
+    def make_article(self, **kwargs):
+        article = ArticlePage(title="Longa", slug="longa", introduction="Resumo", is_premium=True, **kwargs)
+        self.home_page.add_child(instance=article)
+        article.save_revision().publish()
+        article.refresh_from_db()
+        return article
+
+    def test_word_budget_is_shared_between_blocks(self):
+        article = self.make_article(content_blocks=[
+            ('heading', "Título"),
+            *paragraphs("um dois três quatro", "cinco seis sete oito", "nove dez"),
+        ])
+
+        preview = extract_preview(article, blocks=3, words=6)
+
+        self.assertEqual(len(preview['paragraphs']), 2)  # O título conta no orçamento de blocos
+        self.assertIn("um dois três quatro", preview['paragraphs'][0])
+        self.assertIn("cinco seis…", preview['paragraphs'][1])
+        self.assertNotIn("nove", ''.join(preview['paragraphs']))
+
+    @override_settings(PAYWALL_PREVIEW_WORDS=3)
+    def test_legacy_body_preview_is_stored_on_publish(self):
+        article = self.make_article(body='<p>' + ' '.join(['palavra'] * 5000) + '</p>')
+
+        self.assertEqual(article.rendered_preview.count('palavra'), 3)
+        self.assertIn('palavra palavra palavra…</p>', article.rendered_preview)
+
+    def test_anonymous_premium_view_skips_body_columns(self):
+        article = self.make_article(content_blocks=paragraphs("Trecho inicial", "Segundo trecho", "Conteúdo exclusivo"))
+        article_table = ArticlePage._meta.db_table
+
+        with override_settings(PAGE_CACHE_TIMEOUT=0), CaptureQueriesContext(connection) as captured:
+            response = self.client.get(article.url)
+
+        self.assertContains(response, "Trecho inicial")
+        self.assertNotContains(response, "Conteúdo exclusivo")
+        loaded = [query['sql'] for query in captured if f'"{article_table}"."rendered_preview"' in query['sql']]
+        self.assertTrue(loaded)
+        for sql in loaded:
+            self.assertNotIn(f'"{article_table}"."content_blocks"', sql)
+            self.assertNotIn(f'"{article_table}"."rendered_body"', sql)
+        for query in captured:
+            self.assertNotIn(f'"{article_table}"."rendered_body"', query['sql'])
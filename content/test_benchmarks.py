@@ -0,0 +1,82 @@
+"""
+Tests for the benchmark harness.
+
+This test suite ensures:
+1. The synthetic archive builds a valid Wagtail tree with sections, videos (valid provider links) and articles
+2. Every scenario, including the subscriber reader fragment, is served (200) through the benchmark host
+3. Results carry latency, query and memory figures and can be compared
+"""
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from wagtail.models import Page
+
+from content.benchmarks import build_synthetic_archive, compare_results, run_benchmarks
+from content.models import ArticlePage, SectionPage, VideoShort
+
+
+class BenchmarkHarnessTestCase(TestCase):
+    """Test the synthetic archive and the benchmark runner on a tiny archive"""
+
+    def setUp(self):
+        cache.clear()
+        self.home = build_synthetic_archive(
+            articles=25, images=2, tags=5, videos=3, paragraphs=2, batch_size=10,
+        )
+
+    def test_archive_is_a_valid_tree(self):
+        self.assertEqual(SectionPage.objects.child_of(self.home).count(), len(ArticlePage.SECTION_CHOICES))
+        self.assertEqual(ArticlePage.objects.descendant_of(self.home).live().count(), 25)
+        self.assertEqual(VideoShort.objects.count(), 3)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        # Links com ids válidos passam pelo caminho real de embed/thumbnail
+        self.assertEqual(
+            set(VideoShort.objects.values_list('video_provider', flat=True)), {'youtube'}
+        )
+        self.assertFalse(VideoShort.objects.filter(embed_url='').exists())
+
+        article = ArticlePage.objects.get(slug='artigo-7')
+        self.assertEqual(article.get_parent().specific.section_key, article.section)
+        self.assertEqual(article.tags.count(), 3)
+        self.assertTrue(article.content_blocks)
+
+    def test_rebuild_replaces_archive(self):
+        build_synthetic_archive(articles=5, images=1, tags=2, videos=1, paragraphs=1)
+        self.assertEqual(ArticlePage.objects.count(), 5)
+        self.assertEqual(VideoShort.objects.count(), 1)
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(iterations=2, warmup=1)
+
+        self.assertEqual(
+            set(results['results']),
+            {
+                'home', 'section', 'article_anonymous', 'article_subscriber',
+                'article_reader_subscriber', 'videos',
+            },
+        )
+        for name, result in results['results'].items():
+            self.assertEqual(result['status'], 200, name)
+            self.assertGreater(result['latency_ms']['median'], 0)
+            self.assertGreater(result['peak_memory_kb'], 0)
+        self.assertEqual(results['meta']['articles'], 25)
+
+        rows = compare_results(results, results)
+        self.assertEqual(len(rows), 6)
+
+    def test_command_writes_json(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output = os.path.join(directory.name, 'results.json')
+
+        call_command('run_benchmarks', iterations=1, warmup=0, only=['home'], output=output, stdout=StringIO())
+
+        with open(output, encoding='utf-8') as results_file:
+            results = json.load(results_file)
+        self.assertEqual(list(results['results']), ['home'])
@@ -0,0 +1,109 @@
+"""
+Tests for the document serving.
+
+This test suite ensures:
+1. Documents are served from the open file, positioned for sendfile, without a bogus Content-Encoding
+2. Single byte ranges get 206 with the matching slice; bad or multiple ranges get the whole file
+3. Unsatisfiable ranges get 416, and If-Range / If-None-Match are honoured
+4. With a front server configured, the response only carries the X-Accel-Redirect/X-Sendfile header
+"""
+
+import os
+
+from django.core.files.base import ContentFile
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.documents import get_document_model
+
+from content.document_serving import parse_range
+from content.views import serve_document
+
+
+CONTENT = bytes(range(256)) * 4
+
+
+class DocumentServingTestCase(TestCase):
+    """Test serving Wagtail documents"""
+
+    def setUp(self):
+        Document = get_document_model()
+        self.document = Document(title="Relatório", file=ContentFile(CONTENT, name='relatorio.pdf'))
+        self.document._set_document_file_metadata()
+        self.document.save()
+        self.addCleanup(self.document.file.delete, save=False)
+        self.url = self.document.url
+
+    def get(self, **headers):
+        response = self.client.get(self.url, headers=headers)
+        self.addCleanup(response.close)
+        return response
+
+    def test_full_document(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), CONTENT)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Length'], str(len(CONTENT)))
+        self.assertIn('Last-Modified', response)
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_single_range(self):
+        response = self.get(range='bytes=10-19')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(CONTENT)}')
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(response['Content-Disposition'], 'inline; filename="relatorio.pdf"')
+        self.assertEqual(b''.join(response.streaming_content), CONTENT[10:20])
+
+    def test_range_positioned_for_sendfile(self):
+        request = RequestFactory().get(self.url, headers={'range': 'bytes=10-19'})
+        response = serve_document(request, str(self.document.pk), self.document.filename)
+        self.addCleanup(response.close)
+
+        # O servidor WSGI envia a partir da posição do descritor, até o Content-Length
+        self.assertEqual(os.lseek(response.file_to_stream.fileno(), 0, os.SEEK_CUR), 10)
+
+    def test_open_and_suffix_ranges(self):
+        self.assertEqual(b''.join(self.get(range='bytes=1000-').streaming_content), CONTENT[1000:])
+        self.assertEqual(b''.join(self.get(range='bytes=-5').streaming_content), CONTENT[-5:])
+
+    def test_ignored_ranges_serve_whole_file(self):
+        for header in ('bytes=0-1,5-6', 'items=0-1', 'bytes=9-2'):
+            response = self.get(range=header)
+            self.assertEqual(response.status_code, 200, header)
+            self.assertEqual(b''.join(response.streaming_content), CONTENT)
+
+    def test_unsatisfiable_range(self):
+        response = self.get(range='bytes=5000-')
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(CONTENT)}')
+
+    def test_conditional_requests(self):
+        etag = self.get()['ETag']
+
+        self.assertEqual(self.get(if_none_match=etag).status_code, 304)
+        self.assertEqual(self.get(range='bytes=0-9', if_range=etag).status_code, 206)
+        self.assertEqual(self.get(range='bytes=0-9', if_range='"outro"').status_code, 200)
+
+    @override_settings(DOCUMENT_SENDFILE_HEADER='X-Accel-Redirect')
+    def test_nginx_offload(self):
+        response = self.get(range='bytes=10-19')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.document.file.name}')
+        self.assertEqual(response.content, b'')
+
+    @override_settings(DOCUMENT_SENDFILE_HEADER='X-Sendfile')
+    def test_sendfile_offload(self):
+        response = self.get()
+
+        self.assertEqual(response['X-Sendfile'], self.document.file.path)
+        self.assertEqual(response.content, b'')
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('bytes=0-', 10), (0, 9))
+        self.assertEqual(parse_range('bytes=5-50', 10), (5, 9))
+        self.assertEqual(parse_range('bytes=-50', 10), (0, 9))
+        self.assertIsNone(parse_range('bytes=-', 10))
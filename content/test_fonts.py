@@ -0,0 +1,141 @@
+"""
+Tests for the per-page font loading.
+
+This test suite ensures:
+1. A page declares only the fonts it shows (site defaults, customization and its own font fields)
+2. Families without a built WOFF2 fall back to a Google Fonts link with just those families
+3. The build_fonts command stores the latin subset of each weight and skips existing files
+4. Once built, pages preload and declare self-hosted faces with no third-party CSS
+"""
+
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from wagtail.models import Page, Site
+
+from content.fonts import (
+    GOOGLE_FONTS_CSS_URL, build_page_fonts, built_font_paths, page_font_uses,
+)
+from content.models import ArticlePage, HomePage, SiteCustomization
+
+
+fetched_urls = []
+
+
+def fake_fetch(url):
+    """Responde como o Google Fonts: CSS com um bloco por subconjunto e peso."""
+    fetched_urls.append(url)
+    if not url.startswith(GOOGLE_FONTS_CSS_URL):
+        return b'wOF2:' + url.encode()
+    weights = url.split(':wght@')[1].split('&')[0].split(';')
+    return ''.join(
+        f"/* {subset} */\n@font-face {{\n  font-family: 'X';\n  font-weight: {weight};\n"
+        f"  src: url(https://fonts.gstatic.com/{subset}-{weight}.woff2) format('woff2');\n}}\n"
+        for weight in weights
+        for subset in ('cyrillic', 'latin')
+    ).encode()
+
+
+class FontTestMixin:
+
+    def setUp(self):
+        cache.clear()
+        fetched_urls.clear()
+        built_font_paths.cache_clear()
+        self.addCleanup(built_font_paths.cache_clear)
+        self.home_page = HomePage(title="Fonts Home", slug="fonts-home")
+        Page.objects.get(id=1).add_child(instance=self.home_page)
+        Site.objects.create(hostname='testserver', root_page=self.home_page, is_default_site=True)
+        self.article = ArticlePage(
+            title="Elegante", slug="elegante", introduction="Resumo", title_font='Playfair Display',
+        )
+        self.home_page.add_child(instance=self.article)
+
+
+class PageFontsTestCase(FontTestMixin, TestCase):
+    """Test which fonts a page declares"""
+
+    def test_uses_follow_page_and_customization(self):
+        customization = SiteCustomization(heading_font='Montserrat', body_font='Lora')
+
+        uses = page_font_uses(customization, page=self.article)
+
+        self.assertEqual(uses, [
+            ('Lora', 400), ('Montserrat', 700), ('Roboto', 400), ('Roboto', 700),
+            ('Playfair Display', 700),
+        ])
+
+    def test_fallback_link_has_only_used_families(self):
+        self.article.title_font = 'Georgia'
+
+        fonts = build_page_fonts(page_font_uses(page=self.article))
+
+        self.assertEqual(fonts.faces, [])
+        self.assertIn('family=Merriweather:wght@400;700', fonts.fallback_url)
+        self.assertIn('family=Roboto:wght@400;500;700', fonts.fallback_url)
+        for family in ('Playfair', 'Lora', 'Montserrat', 'Open+Sans', 'PT+Serif', 'Georgia'):
+            self.assertNotIn(family, fonts.fallback_url)
+
+    def test_article_renders_only_its_fonts(self):
+        response = self.client.get(self.article.url)
+
+        self.assertContains(response, 'family=Playfair+Display:wght@400;700')
+        self.assertNotContains(response, 'family=Lora')
+
+
+class BuildFontsTestCase(FontTestMixin, TestCase):
+    """Test the build_fonts command and the self-hosted faces"""
+
+    def setUp(self):
+        super().setUp()
+        static_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(static_dir.cleanup)
+        self.static_dir = Path(static_dir.name)
+        self.fonts_dir = self.static_dir / 'fonts'
+
+    def build(self, *families, **options):
+        stdout = StringIO()
+        with mock.patch('content.fonts.fetch_url', side_effect=fake_fetch):
+            call_command('build_fonts', *families, output_dir=str(self.fonts_dir), stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_builds_latin_subset_once(self):
+        output = self.build('Roboto', 'Merriweather')
+
+        self.assertIn('5 arquivos de fonte gerados (0 já existiam)', output)
+        self.assertEqual(
+            (self.fonts_dir / 'roboto-700.woff2').read_bytes(),
+            b'wOF2:https://fonts.gstatic.com/latin-700.woff2',
+        )
+        self.assertFalse(any('cyrillic' in url for url in fetched_urls))
+
+        fetched_urls.clear()
+        self.assertIn('0 arquivos de fonte gerados (5 já existiam)', self.build('Roboto', 'Merriweather'))
+        self.assertEqual(fetched_urls, [])
+
+    def test_unknown_family(self):
+        with self.assertRaises(CommandError):
+            self.build('Comic Sans')
+
+    def test_pages_use_self_hosted_faces(self):
+        self.build()
+
+        with override_settings(STATICFILES_DIRS=[self.static_dir]):
+            built_font_paths.cache_clear()
+            response = self.client.get(self.article.url)
+
+        self.assertNotContains(response, 'fonts.googleapis.com')
+        self.assertContains(response, '/static/fonts/playfair-display-700.woff2', count=2)
+        self.assertContains(
+            response,
+            '<link rel="preload" href="/static/fonts/merriweather-400.woff2" as="font" type="font/woff2" crossorigin>',
+            html=True,
+        )
+        # Pesos declarados, mas não pré-carregados
+        self.assertContains(response, '/static/fonts/roboto-500.woff2', count=1)
+        self.assertNotContains(response, 'lora-400.woff2')
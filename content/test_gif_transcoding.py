@@ -0,0 +1,216 @@
+"""
+Tests for the GIF to animated WebP/MP4 transcoding.
+
+This test suite ensures:
+1. A GIF URL is fetched and converted once; formats larger than the GIF are dropped
+2. Failed downloads and invalid files are recorded and not retried inside the retry window
+3. Publishing queues the conversion for the task worker, only for GIFs without one
+4. The stored article body serves the converted format with the GIF as fallback
+5. The transcode_gifs command backfills published articles and retries failed or stuck rows
+"""
+
+import io
+import random
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django_tasks.backends.database.models import DBTaskResult
+from PIL import Image
+
+from content.gif_transcoding import (
+    find_transcoded, transcode_article_gifs, transcode_gif,
+)
+from content.models import ArticlePage, TranscodedGif
+from content.remote_images import RemoteImageError, url_hash
+from content.test_listings import ArticleListingFixtureMixin
+
+
+fetched_urls = []
+
+
+def make_gif(frames=4, noisy=True):
+    """GIF animado gerado localmente (com ruído, para que o WebP fique menor)."""
+    rng = random.Random(frames)
+    images = []
+    for index in range(frames):
+        image = Image.new('RGB', (48, 32), (index * 60 % 256, 0, 0))
+        if noisy:
+            image.putdata([
+                (rng.randrange(256), rng.randrange(256), index * 60 % 256) for _ in range(48 * 32)
+            ])
+        images.append(image.convert('P'))
+    output = io.BytesIO()
+    images[0].save(output, 'GIF', save_all=True, append_images=images[1:], duration=100, loop=0)
+    return output.getvalue()
+
+
+def gif_fetcher(url):
+    fetched_urls.append(url)
+    if 'parado' in url:
+        return make_gif(frames=2, noisy=False)
+    if 'texto' in url:
+        return b'not a gif'
+    return make_gif()
+
+
+def failing_fetcher(url):
+    fetched_urls.append(url)
+    raise RemoteImageError('HTTP 404')
+
+
+def gif_blocks(*urls):
+    return [('gif', {'gif_url': url, 'caption': '', 'credit': '', 'caption_position': 'text-start'})
+            for url in urls]
+
+
+@override_settings(REMOTE_IMAGE_FETCHER='content.test_gif_transcoding.gif_fetcher')
+@mock.patch('content.gif_transcoding.ffmpeg_binary', return_value=None)
+class TranscodeGifTestCase(TestCase):
+    """Test converting a single GIF"""
+
+    def setUp(self):
+        fetched_urls.clear()
+
+    def test_converted_once(self, ffmpeg_binary):
+        url = 'https://media.example.com/danca.gif'
+
+        transcoded = transcode_gif(url)
+        again = transcode_gif(url)
+
+        self.assertEqual(fetched_urls, [url])
+        self.assertEqual(again.pk, transcoded.pk)
+        self.assertEqual((transcoded.width, transcoded.height), (48, 32))
+        self.assertTrue(transcoded.webp.name.endswith('.webp'))
+        self.assertEqual(transcoded.mp4.name, '')
+        with transcoded.webp.open() as webp, Image.open(webp) as image:
+            self.assertEqual((image.format, image.n_frames), ('WEBP', 4))
+        self.assertEqual(find_transcoded(url).pk, transcoded.pk)
+
+    def test_larger_format_dropped(self, ffmpeg_binary):
+        url = 'https://media.example.com/parado.gif'
+
+        transcoded = transcode_gif(url)
+
+        self.assertEqual((transcoded.webp.name, transcoded.last_error), ('', ''))
+        self.assertIsNone(find_transcoded(url))
+        transcode_gif(url)
+        self.assertEqual(fetched_urls, [url])
+
+    def test_mp4_kept_when_smaller(self, ffmpeg_binary):
+        with mock.patch('content.gif_transcoding.encode_mp4', return_value=b'mp4'):
+            transcoded = transcode_gif('https://media.example.com/danca.gif')
+
+        self.assertTrue(transcoded.mp4.name.endswith('.mp4'))
+
+    @override_settings(REMOTE_IMAGE_FETCHER='content.test_gif_transcoding.failing_fetcher')
+    def test_failure_recorded_and_not_retried_immediately(self, ffmpeg_binary):
+        url = 'https://media.example.com/ausente.gif'
+
+        transcoded = transcode_gif(url)
+        transcode_gif(url)
+
+        self.assertEqual(transcoded.last_error, 'HTTP 404')
+        self.assertEqual(fetched_urls, [url])
+
+        TranscodedGif.objects.update(attempted_at=timezone.now() - timedelta(days=1))
+        transcode_gif(url)
+        self.assertEqual(len(fetched_urls), 2)
+
+    def test_invalid_file(self, ffmpeg_binary):
+        transcoded = transcode_gif('https://media.example.com/texto.gif')
+
+        self.assertEqual(transcoded.last_error, 'GIF inválido')
+
+
+@override_settings(REMOTE_IMAGE_FETCHER='content.test_gif_transcoding.gif_fetcher')
+@mock.patch('content.gif_transcoding.ffmpeg_binary', return_value=None)
+class ArticleGifTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the GIF blocks of published articles"""
+
+    def setUp(self):
+        super().setUp()
+        fetched_urls.clear()
+
+    def publish_article(self, slug, *urls):
+        article = ArticlePage(
+            title=slug.title(), slug=slug, introduction="Resumo", content_blocks=gif_blocks(*urls),
+        )
+        self.home_page.add_child(instance=article)
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save_revision().publish()
+        return article, list(
+            DBTaskResult.objects.filter(
+                task_path='content.gif_transcoding.convert_article_gifs',
+                args_kwargs__args=[article.pk],
+            )
+        )
+
+    def test_publish_queues_pending_gifs(self, ffmpeg_binary):
+        _, queued = self.publish_article('novo', 'https://media.example.com/danca.gif')
+        self.assertEqual(len(queued), 1)
+        self.assertEqual(fetched_urls, [])
+
+        transcode_gif('https://media.example.com/danca.gif')
+        _, queued = self.publish_article('repetido', 'https://media.example.com/danca.gif')
+        self.assertEqual(queued, [])
+
+    def test_stored_body_serves_webp_with_gif_fallback(self, ffmpeg_binary):
+        url = 'https://media.example.com/danca.gif'
+        article, _ = self.publish_article('danca', url)
+        self.assertNotIn('.webp', ArticlePage.objects.get(pk=article.pk).rendered_body)
+
+        self.assertEqual(transcode_article_gifs(article.pk), 1)
+
+        body = ArticlePage.objects.get(pk=article.pk).rendered_body
+        webp_url = TranscodedGif.objects.get().webp.url
+        self.assertInHTML(
+            f'<source srcset="{webp_url}" type="image/webp">', body
+        )
+        self.assertIn(f'src="{url}"', body)
+        self.assertNotIn('<video', body)
+
+    def test_stored_body_serves_mp4(self, ffmpeg_binary):
+        article, _ = self.publish_article('video', 'https://media.example.com/danca.gif')
+
+        with mock.patch('content.gif_transcoding.encode_mp4', return_value=b'mp4'):
+            transcode_article_gifs(article.pk)
+
+        body = ArticlePage.objects.get(pk=article.pk).rendered_body
+        self.assertIn('<video class="img-fluid rounded" autoplay loop muted playsinline', body)
+        self.assertIn(f'src="{TranscodedGif.objects.get().mp4.url}" type="video/mp4"', body)
+
+    def test_command_backfills_articles(self, ffmpeg_binary):
+        self.publish_article('um', 'https://media.example.com/danca.gif', 'https://media.example.com/parado.gif')
+        self.publish_article('dois', 'https://media.example.com/danca.gif')
+        stdout = StringIO()
+
+        call_command('transcode_gifs', workers=1, stdout=stdout)
+
+        self.assertIn('1 de 2 GIFs convertidos (2 artigos atualizados)', stdout.getvalue())
+        self.assertEqual(len(fetched_urls), 2)
+        self.assertIn('.webp', ArticlePage.objects.get(slug='dois').rendered_body)
+
+    def test_command_retries_failed_and_stuck_gifs(self, ffmpeg_binary):
+        with override_settings(REMOTE_IMAGE_FETCHER='content.test_gif_transcoding.failing_fetcher'):
+            article, _ = self.publish_article('falhou', 'https://media.example.com/danca.gif')
+            transcode_article_gifs(article.pk)
+        # Tarefa interrompida no meio: registro criado, nenhuma tentativa concluída
+        TranscodedGif.objects.create(
+            source_url='https://media.example.com/orfao.gif',
+            source_hash=url_hash('https://media.example.com/orfao.gif'),
+        )
+        fetched_urls.clear()
+        stdout = StringIO()
+
+        call_command('transcode_gifs', workers=1, stdout=stdout)
+
+        self.assertEqual(
+            sorted(fetched_urls),
+            ['https://media.example.com/danca.gif', 'https://media.example.com/orfao.gif'],
+        )
+        self.assertIn('2 de 2 GIFs convertidos (1 artigos atualizados)', stdout.getvalue())
+        self.assertFalse(TranscodedGif.objects.filter(attempted_at__isnull=True).exists())
@@ -0,0 +1,84 @@
+"""
+Tests for the article listing indexes.
+
+This test suite ensures, via EXPLAIN, that:
+1. Section listings read content_articlepage through article_section_pub_idx
+2. Home listings walk article_publication_idx in order instead of sorting
+3. The featured lookup uses the partial article_featured_pub_idx
+4. The first-page listing queries (featured, trending, regular) each walk an
+   index, home trending through the partial article_trending_until_idx,
+   without a full scan of wagtailcore_page or a temp B-tree
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from content.listings import _featured_pk, build_article_listing, regular_queryset
+from content.models import ArticlePage
+from content.test_listings import ArticleListingFixtureMixin
+
+
+class ListingIndexTestCase(ArticleListingFixtureMixin, TestCase):
+    """Fail if a hot listing query stops using its index"""
+
+    def setUp(self):
+        super().setUp()
+        for index in range(30):
+            self.add_article(
+                f'story-{index}', index,
+                section='economia' if index % 2 else 'clima',
+                is_featured_highlight=index % 7 == 0,
+                is_trending=index % 5 == 0,
+                trending_until=self.now + timedelta(hours=index % 3 - 1),
+            )
+        if connection.vendor == 'postgresql':
+            # Tabelas pequenas de teste: força o planner a considerar os índices
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+        if connection.vendor == 'sqlite':
+            self.assertNotIn('TEMP B-TREE FOR ORDER BY', plan, plan)
+
+    def assertListingUsesIndexes(self, queryset, index_names):
+        with CaptureQueriesContext(connection) as captured:
+            build_article_listing(queryset)
+        # Destaque, "Em Alta" e regulares; as seguintes são prefetches por pk
+        for query, index_name in zip(captured[:3], index_names):
+            with connection.cursor() as cursor:
+                cursor.execute(f'{connection.ops.explain_query_prefix()} {query["sql"]}')
+                plan = '\n'.join(' '.join(map(str, row)) for row in cursor.fetchall())
+            self.assertIn(index_name, plan, plan)
+            if connection.vendor == 'sqlite':
+                self.assertNotIn('SCAN wagtailcore_page', plan, plan)
+                self.assertNotIn('TEMP B-TREE', plan, plan)
+            else:
+                self.assertNotIn('Seq Scan on wagtailcore_page', plan, plan)
+
+    def test_section_listing_uses_section_index(self):
+        queryset = ArticlePage.objects.filter(section='economia').live()
+        self.assertUsesIndex(regular_queryset(queryset)[:10], 'article_section_pub_idx')
+
+    def test_home_listing_walks_publication_index(self):
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        self.assertUsesIndex(regular_queryset(queryset)[:10], 'article_publication_idx')
+
+    def test_featured_lookup_uses_partial_index(self):
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        self.assertUsesIndex(_featured_pk(queryset), 'article_featured_pub_idx')
+
+    def test_home_first_page_queries_use_indexes(self):
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        self.assertListingUsesIndexes(queryset, (
+            'article_featured_pub_idx', 'article_trending_until_idx', 'article_publication_idx',
+        ))
+
+    def test_section_first_page_queries_use_indexes(self):
+        queryset = ArticlePage.objects.filter(section='economia').live()
+        # Com a seção fixa, o índice da seção já entrega cada grupo na ordem da listagem
+        self.assertListingUsesIndexes(queryset, ('article_section_pub_idx',) * 3)
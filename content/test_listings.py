@@ -0,0 +1,319 @@
+"""
+Tests for the shared article listing service.
+
+This test suite ensures:
+1. Featured, trending and regular articles are split in one bounded query per group
+2. Trending is resolved in SQL, including expired trending windows
+3. Each group is bounded by its limit; trending articles past the limit join the regular stream
+4. Regular articles are paginated with a (publication_date, id) cursor, every live article listed once
+5. Rendering a listing costs a constant number of queries
+6. Listings read only the card columns, never the article body
+7. Cards are immutable, slotted projections with precomputed display values
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Page, Site
+
+from content.listings import (
+    TRENDING_LIMIT,
+    ArticleCard,
+    InvalidCursor,
+    build_article_listing,
+    build_article_page,
+    decode_cursor,
+)
+from content.models import HomePage, ArticlePage, VideosPage
+
+
+class ArticleListingFixtureMixin:
+    """Creates a home page and helpers to add articles with fixed dates"""
+
+    def setUp(self):
+        cache.clear()  # Cache de página e raízes de site não sobrevivem entre testes
+        root_page = Page.objects.get(id=1)
+        self.home_page = HomePage(
+            title="Listing Home",
+            slug="listing-home",
+        )
+        root_page.add_child(instance=self.home_page)
+        self.now = timezone.now()
+
+    def add_article(self, slug, hours_ago, **kwargs):
+        article = ArticlePage(
+            title=slug.replace('-', ' ').title(),
+            slug=slug,
+            introduction="Resumo",
+            publication_date=self.now - timedelta(hours=hours_ago),
+            live=False,  # Draft first to control trending fields
+            **kwargs
+        )
+        self.home_page.add_child(instance=article)
+        ArticlePage.objects.filter(pk=article.pk).update(live=True)
+        return article
+
+
+class ArticleListingTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the featured/trending/regular partition"""
+
+    def test_partition_in_bounded_queries(self):
+        old_featured = self.add_article('old-featured', 10, is_featured_highlight=True)
+        featured = self.add_article('featured', 5, is_featured_highlight=True)
+        trending = self.add_article(
+            'trending', 2, is_trending=True, trending_until=self.now + timedelta(hours=1)
+        )
+        expired = self.add_article(
+            'expired', 1, is_trending=True, trending_until=self.now - timedelta(hours=1)
+        )
+        regular = self.add_article('regular', 3)
+
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        Site.get_site_root_paths()  # URLs dos cards: raízes dos sites ficam em cache
+        with self.assertNumQueries(4):  # Destaque + "Em Alta" + regulares + tags
+            listing = build_article_listing(queryset)
+
+        self.assertEqual(listing.featured.pk, featured.pk)
+        self.assertEqual([a.pk for a in listing.trending], [trending.pk])
+        self.assertEqual(
+            [a.pk for a in listing.regular],
+            [expired.pk, regular.pk, old_featured.pk],
+        )
+
+    def test_groups_are_bounded(self):
+        for index in range(5):
+            self.add_article(
+                f'hot-{index}', index, is_trending=True, trending_until=None
+            )
+        for index in range(5):
+            self.add_article(f'cold-{index}', 10 + index)
+
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        listing = build_article_listing(queryset, trending_limit=2, regular_limit=3)
+
+        self.assertIsNone(listing.featured)
+        self.assertEqual([a.title for a in listing.trending], ['Hot 0', 'Hot 1'])
+        self.assertEqual([a.title for a in listing.regular], ['Hot 2', 'Hot 3', 'Hot 4'])
+
+        rest, cursor = build_article_page(queryset, listing.next_cursor, page_size=5)
+        self.assertEqual([a.title for a in rest], [f'Cold {index}' for index in range(5)])
+        self.assertEqual(cursor, '')
+
+    def test_listing_reads_only_card_columns(self):
+        self.add_article(
+            'long-read', 1, content_blocks=[('paragraph', '<p>' + 'texto ' * 1000 + '</p>')],
+            body='<p>Legado</p>',
+        )
+        for index in range(12):
+            self.add_article(f'story-{index}', 2 + index)
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        article_table = ArticlePage._meta.db_table
+
+        with CaptureQueriesContext(connection) as captured:
+            listing = build_article_listing(queryset)
+            build_article_page(queryset, listing.next_cursor)
+
+        for query in captured:
+            for column in ('content_blocks', 'body', 'rendered_body', 'rendered_preview'):
+                self.assertNotIn(f'"{article_table}"."{column}"', query['sql'])
+        self.assertTrue(all(isinstance(article, ArticleCard) for article in listing.regular))
+
+
+class ArticleCardTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the ArticleCard projection"""
+
+    def test_card_precomputes_display_values(self):
+        Site.objects.create(hostname='testserver', root_page=self.home_page, is_default_site=True)
+        article = self.add_article(
+            'external', 1, section='economia', is_premium=True,
+            external_image_url='https://cdn.example.com/capa.jpg',
+        )
+        ArticlePage.objects.filter(pk=article.pk).update(
+            introduction='<p>Juros &amp; <b>inflação</b></p>'
+        )
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        request = self.client.get('/').wsgi_request
+
+        card = build_article_listing(queryset, request=request).regular[0]
+
+        self.assertEqual(card.url, '/external/')
+        self.assertEqual(card.section_label, 'Economia')
+        self.assertEqual(card.introduction_text, 'Juros &amp; inflação')
+        self.assertTrue(card.is_premium)
+        self.assertTrue(card.has_image)
+        self.assertEqual(card.thumbnail_url, '')
+        self.assertEqual(card.image_alt, 'External')
+
+    def test_card_is_immutable_and_slotted(self):
+        self.add_article('story', 1)
+        card = build_article_listing(ArticlePage.objects.live()).regular[0]
+
+        self.assertFalse(hasattr(card, '__dict__'))
+        with self.assertRaises(AttributeError):
+            card.title = 'Outro'
+
+
+class KeysetPaginationTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test cursor pagination of regular articles"""
+
+    def test_pages_follow_cursor_without_overlap(self):
+        self.add_article('trending', 0, is_trending=True, trending_until=None)
+        for index in range(7):
+            self.add_article(f'story-{index}', 1 + index)
+
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        listing = build_article_listing(queryset, regular_limit=3)
+        self.assertEqual([a.title for a in listing.regular], ['Story 0', 'Story 1', 'Story 2'])
+
+        with self.assertNumQueries(2):  # Artigos + tags
+            second, cursor = build_article_page(queryset, listing.next_cursor, page_size=3)
+        self.assertEqual([a.title for a in second], ['Story 3', 'Story 4', 'Story 5'])
+
+        third, cursor = build_article_page(queryset, cursor, page_size=3)
+        self.assertEqual([a.title for a in third], ['Story 6'])
+        self.assertEqual(cursor, '')
+
+    def test_invalid_cursor_is_rejected(self):
+        for cursor in ['', 'not-a-cursor', 'MjAyNS0wMS0wMXxhYmM']:
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+
+class ArticleListingFragmentTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the "load more" fragment endpoint"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver',
+            root_page=self.home_page,
+            is_default_site=True,
+            site_name='Test Site',
+        )
+        for index in range(12):
+            self.add_article(f'story-{index}', 1 + index)
+
+    def test_fragment_returns_next_cards_and_cursor(self):
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        cursor = response.context['next_cursor']
+        self.assertTrue(cursor)
+        self.assertEqual(len(response.context['articles']), 9)
+
+        url = reverse('article_listing_fragment', args=[self.home_page.id])
+        response = self.client.get(url, {'cursor': cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Story 9')
+        self.assertContains(response, 'Story 11')
+        self.assertNotContains(response, 'Story 8')
+        self.assertEqual(response['X-Next-Cursor'], '')
+
+    def test_trending_overflow_listed_once(self):
+        # Mais artigos em alta do que cabem no grupo, intercalados com os regulares
+        for index in range(TRENDING_LIMIT + 3):
+            self.add_article(f'hot-{index}', 0.5 + index, is_trending=True, trending_until=None)
+
+        response = self.client.get('/')
+        context = response.context
+        listed = [context['featured_article']] if context['featured_article'] else []
+        listed += context['trending_articles'] + context['articles']
+        self.assertEqual(len(context['trending_articles']), TRENDING_LIMIT)
+
+        url = reverse('article_listing_fragment', args=[self.home_page.id])
+        cursor = context['next_cursor']
+        while cursor:
+            response = self.client.get(url, {'cursor': cursor})
+            listed += response.context['articles']
+            cursor = response['X-Next-Cursor']
+
+        listed_ids = [card.pk for card in listed]
+        live_ids = ArticlePage.objects.descendant_of(self.home_page).live().values_list('pk', flat=True)
+        self.assertEqual(len(listed_ids), len(set(listed_ids)))
+        self.assertEqual(sorted(listed_ids), sorted(live_ids))
+
+    def test_fragment_rejects_invalid_cursor(self):
+        url = reverse('article_listing_fragment', args=[self.home_page.id])
+        response = self.client.get(url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_fragment_requires_listing_page(self):
+        videos_page = VideosPage(title="Vídeos", slug="videos")
+        self.home_page.add_child(instance=videos_page)
+        url = reverse('article_listing_fragment', args=[videos_page.id])
+        response = self.client.get(url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=0)  # Mede a renderização, não o cache de página
+class ListingQueryCountTestCase(ArticleListingFixtureMixin, TestCase):
+    """Regression test for .specific / featured_image N+1 queries"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver',
+            root_page=self.home_page,
+            is_default_site=True,
+            site_name='Test Site',
+        )
+        self.counter = 0
+
+    def add_cards(self, count, **kwargs):
+        articles = []
+        for _ in range(count):
+            self.counter += 1
+            articles.append(self.add_article(f'card-{self.counter}', self.counter, **kwargs))
+        return articles
+
+    def set_curated(self, articles):
+        self.home_page.curated_sections = [
+            ('curated_section', {
+                'title': 'Seleção',
+                'layout_style': 'grid',
+                'accent': 'ink',
+                'articles': articles,
+            })
+        ]
+        self.home_page.save()
+
+    def count_home_queries(self):
+        self.client.get('/')  # Aquece os caches de navegação e de raízes do site
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_home_render_query_count_is_constant(self):
+        external = {'external_image_url': 'https://cdn.example.com/card.jpg'}
+        self.add_article('hot', 0, is_trending=True, trending_until=None, **external)
+        self.set_curated(self.add_cards(2, **external))
+        baseline = self.count_home_queries()
+
+        self.add_article('hot-2', 0, is_trending=True, trending_until=None, **external)
+        self.set_curated(self.add_cards(6, **external))
+        self.add_cards(6, **external)
+        self.assertEqual(self.count_home_queries(), baseline)
+
+    def test_card_relations_are_loaded_in_bulk(self):
+        image = get_image_model().objects.create(
+            title="Card", file=get_test_image_file(filename="card.png"),
+        )
+        articles = self.add_cards(4, featured_image=image)
+        self.set_curated(articles)
+
+        request = self.client.get('/').wsgi_request
+        context = self.home_page.get_context(request)
+        curated = self.home_page.curated_sections[0].value['articles']
+
+        for article in list(context['articles']) + curated:
+            self.assertIsInstance(article, ArticleCard)
+            self.assertEqual(article.image_alt, "Card")
+            self.assertTrue(article.thumbnail_url)
+            self.assertEqual(article.tags, ())
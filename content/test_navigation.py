@@ -0,0 +1,172 @@
+"""
+Tests for the cached header navigation tags.
+
+This test suite ensures:
+1. Navigation tags cost zero queries once cached
+2. Saving SiteCustomization or a SupportSectionPage invalidates the cache
+3. get_topics is bounded and refreshed when articles are published
+4. SiteCustomization and HomePage are loaded at most once per request
+5. An invalidation made by another process is seen at once with a shared cache,
+   and after PROCESS_LOCAL_VERSION_TIMEOUT with a process-local cache
+"""
+
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.models import Page
+
+from content import navigation
+from content.models import ArticlePage, HomePage, SiteCustomization, SupportSectionPage
+from content.navigation import (
+    PROCESS_LOCAL_VERSION_TIMEOUT, TOPICS_LIMIT, get_home_page, get_site_customization,
+)
+from content.templatetags.navigation_tags import get_support_sections, get_topics
+
+
+class NavigationCacheTestCase(TestCase):
+    """Test the versioned navigation cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.home_page = HomePage(title="Nav Home", slug="nav-home")
+        Page.objects.get(id=1).add_child(instance=self.home_page)
+        self.home_page.add_child(
+            instance=SupportSectionPage(title="Teologia", slug="teologia")
+        )
+
+    def test_tags_cost_no_queries_once_cached(self):
+        get_site_customization()
+        get_support_sections()
+        get_topics()
+
+        with self.assertNumQueries(0):
+            get_site_customization()
+            self.assertEqual([s.title for s in get_support_sections()], ["Teologia"])
+            get_topics()
+
+    def test_site_customization_save_invalidates(self):
+        self.assertIsNone(get_site_customization())
+
+        customization = SiteCustomization.objects.create(announcement_text="Aviso")
+
+        self.assertEqual(get_site_customization().pk, customization.pk)
+
+    def test_support_section_save_invalidates(self):
+        get_support_sections()
+        self.home_page.add_child(
+            instance=SupportSectionPage(title="Escatologia", slug="escatologia")
+        )
+
+        titles = [section.title for section in get_support_sections()]
+        self.assertEqual(titles, ["Escatologia", "Teologia"])
+
+    def test_topics_are_bounded_and_refreshed_on_publish(self):
+        self.assertEqual(get_topics(), [])
+        for index in range(TOPICS_LIMIT + 5):
+            self.home_page.add_child(instance=ArticlePage(
+                title=f"Artigo {index:02d}", slug=f"artigo-{index}", introduction="Resumo",
+            ))
+        self.assertEqual(get_topics(), [])  # Ainda cacheado: nada foi publicado
+
+        article = ArticlePage.objects.get(slug='artigo-0')
+        article.title = "Artigo Revisado"
+        article.save_revision().publish()
+
+        topics = get_topics()
+        self.assertEqual(len(topics), TOPICS_LIMIT)
+        titles = [topic.title for topic in topics]
+        self.assertEqual(titles, sorted(titles, key=str.lower))
+
+
+class SiteSingletonLoaderTestCase(TestCase):
+    """Test the request-scoped SiteCustomization/HomePage loader"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.home_page = HomePage(title="Nav Home", slug="nav-home")
+        Page.objects.get(id=1).add_child(instance=self.home_page)
+        SiteCustomization.objects.create(announcement_text="Aviso")
+
+    def test_loaded_once_per_request(self):
+        request = self.factory.get('/')
+        with self.assertNumQueries(2):
+            customization = get_site_customization(request)
+            home_page = get_home_page(request)
+
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertIs(get_site_customization(request), customization)
+            self.assertIs(get_home_page(request), home_page)
+
+    def test_login_page_reuses_cached_singletons(self):
+        self.client.get('/accounts/login/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/accounts/login/')
+        self.assertEqual(response.context['home_page'].pk, self.home_page.pk)
+
+    def test_home_page_publish_invalidates(self):
+        self.assertEqual(get_home_page().title, "Nav Home")
+
+        self.home_page.title = "Portal"
+        self.home_page.save_revision().publish()
+
+        self.assertEqual(get_home_page().title, "Portal")
+
+
+class NavigationProcessesTestCase(TestCase):
+    """Test invalidations made by another server process"""
+
+    def setUp(self):
+        cache.clear()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        self.home_page = HomePage(title="Nav Home", slug="nav-home")
+        Page.objects.get(id=1).add_child(instance=self.home_page)
+        self.home_page.add_child(
+            instance=SupportSectionPage(title="Teologia", slug="teologia")
+        )
+
+    @contextmanager
+    def other_process(self, other_cache):
+        """Outro worker: cópia local própria e a sua instância do backend de cache."""
+        with mock.patch.object(navigation, '_local_cache', {}), \
+                mock.patch.object(navigation, 'get_navigation_cache', return_value=other_cache):
+            yield
+
+    def add_section_in_other_process(self, other_cache):
+        with self.other_process(other_cache):
+            self.assertEqual(len(get_support_sections()), 1)
+            self.home_page.add_child(
+                instance=SupportSectionPage(title="Escatologia", slug="escatologia")
+            )
+
+    def test_shared_cache_invalidation_reaches_other_process(self):
+        with override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': self.cache_dir,
+            },
+        }):
+            self.assertEqual(len(get_support_sections()), 1)
+
+            self.add_section_in_other_process(FileBasedCache(self.cache_dir, {}))
+
+            self.assertEqual(len(get_support_sections()), 2)
+
+    def test_process_local_tokens_expire(self):
+        self.assertEqual(len(get_support_sections()), 1)
+
+        self.add_section_in_other_process(LocMemCache('other-process', {}))
+
+        self.assertEqual(len(get_support_sections()), 1)  # Token antigo ainda válido aqui
+        later = time.time() + PROCESS_LOCAL_VERSION_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertEqual(len(get_support_sections()), 2)
@@ -0,0 +1,215 @@
+"""
+Tests for the anonymous full-page cache.
+
+This test suite ensures:
+1. Anonymous GETs are served from the cache after the first render
+2. Logged-in readers always get a freshly rendered page
+3. Publishing an article purges only the pages that list it
+4. Moving an article purges the listings of its previous location
+5. Articles are served as one public shell (ETag, no Vary: Cookie) to every reader
+6. The reader fragment carries the per-user header and the subscriber body
+7. Adding or removing a view restriction purges the cached shells below it
+8. Saving the site customization purges every cached page
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from wagtail.models import PageViewRestriction, Site
+
+from content.models import ArticlePage, SectionPage, SiteCustomization, SupportSectionPage
+from content.page_cache import PAGE_CACHE_HEADER
+from content.test_listings import ArticleListingFixtureMixin
+
+
+class PageCacheTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test caching and publish-driven invalidation"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver',
+            root_page=self.home_page,
+            is_default_site=True,
+            site_name='Test Site',
+        )
+        self.section_page = SectionPage(
+            title="Geopolítica", slug="geopolitica", section_key='geopolitica',
+        )
+        self.home_page.add_child(instance=self.section_page)
+        self.support_page = SupportSectionPage(title="Apoio", slug="apoio")
+        self.home_page.add_child(instance=self.support_page)
+        self.other_support_page = SupportSectionPage(title="Outro", slug="outro")
+        self.home_page.add_child(instance=self.other_support_page)
+        # As URLs públicas ganham o prefixo /subsecao/; o roteamento é pelo slug
+        self.support_url = '/apoio/'
+        self.other_support_url = '/outro/'
+        self.article = self.add_article('story', 1, section='geopolitica')
+
+    def cache_status(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.get(PAGE_CACHE_HEADER)
+
+    def test_anonymous_get_is_cached(self):
+        first = self.client.get(self.article.url)
+        second = self.client.get(self.article.url)
+
+        self.assertEqual(first[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(second[PAGE_CACHE_HEADER], 'HIT')
+        self.assertEqual(first.content, second.content)
+
+    def test_authenticated_reader_is_not_cached(self):
+        user = User.objects.create_user(username='leitor', password='senha-segura-123')
+        self.client.force_login(user)
+
+        self.assertIsNone(self.cache_status('/'))
+        self.assertIsNone(self.cache_status('/'))
+
+    def test_publish_purges_affected_pages(self):
+        urls = ['/', self.section_page.url, self.article.url, self.other_support_url]
+        for url in urls:
+            self.cache_status(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.save_revision().publish()
+
+        self.assertEqual(self.cache_status('/'), 'MISS')
+        self.assertEqual(self.cache_status(self.section_page.url), 'MISS')
+        self.assertEqual(self.cache_status(self.article.url), 'MISS')
+        self.assertEqual(self.cache_status(self.other_support_url), 'HIT')
+
+    def test_move_purges_previous_listing(self):
+        article = ArticlePage(title="Apoio Story", slug="apoio-story", introduction="Resumo")
+        self.support_page.add_child(instance=article)
+        self.cache_status(self.support_url)
+        self.cache_status(self.other_support_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article.move(self.other_support_page, pos='last-child')
+
+        self.assertEqual(self.cache_status(self.support_url), 'MISS')
+        self.assertEqual(self.cache_status(self.other_support_url), 'MISS')
+
+
+    def test_site_customization_purges_every_page(self):
+        urls = ['/', self.section_page.url, self.article.url, self.other_support_url]
+        for url in urls:
+            self.cache_status(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteCustomization.objects.create(announcement_enabled=True, announcement_text="Novo aviso")
+
+        for url in urls:
+            self.assertEqual(self.cache_status(url), 'MISS', url)
+        self.assertContains(self.client.get(self.article.url), 'Novo aviso')
+
+
+class ArticleShellTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the shared article shell and the per-user reader fragment"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver', root_page=self.home_page, is_default_site=True, site_name='Test Site',
+        )
+        self.article = self.add_article('premium', 1, is_premium=True, content_blocks=[
+            ('paragraph', f'<p>{text}</p>')
+            for text in ("Primeiro trecho", "Segundo trecho", "Trecho exclusivo")
+        ])
+        self.reader_url = reverse('article_reader_fragment', args=[self.article.pk])
+
+        self.reader = User.objects.create_user(username='leitor', password='senha-segura-123')
+        self.subscriber = User.objects.create_user(username='assinante', password='senha-segura-123')
+        self.subscriber.userprofile.is_subscriber = True
+        self.subscriber.userprofile.save()
+
+    def test_same_public_shell_for_every_reader(self):
+        anonymous = self.client.get(self.article.url)
+        self.client.force_login(self.subscriber)
+        subscriber = self.client.get(self.article.url)
+
+        self.assertEqual(anonymous[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(subscriber[PAGE_CACHE_HEADER], 'HIT')
+        self.assertEqual(anonymous.content, subscriber.content)
+        self.assertEqual(subscriber['ETag'], anonymous['ETag'])
+        self.assertIn('public', subscriber['Cache-Control'])
+        self.assertIn('s-maxage=', subscriber['Cache-Control'])
+        self.assertNotIn('Cookie', subscriber.get('Vary', ''))
+        self.assertNotContains(subscriber, 'Trecho exclusivo')
+        self.assertContains(subscriber, 'Entrar')
+
+    def test_shell_skips_session_and_auth(self):
+        self.client.force_login(self.subscriber)
+
+        for _ in range(2):  # MISS e HIT
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(self.article.url)
+            self.assertEqual(response.status_code, 200)
+            for query in captured:
+                self.assertNotIn('django_session', query['sql'])
+                self.assertNotIn('auth_user', query['sql'])
+
+    def test_view_restriction_purges_shell(self):
+        self.assertEqual(self.client.get(self.article.url)[PAGE_CACHE_HEADER], 'MISS')
+
+        # Restrição na home: vale para o artigo, que é descendente
+        with self.captureOnCommitCallbacks(execute=True):
+            restriction = PageViewRestriction.objects.create(
+                page=self.home_page, restriction_type=PageViewRestriction.PASSWORD, password='senha',
+            )
+        restricted = self.client.get(self.article.url)
+
+        self.assertNotEqual(restricted.get(PAGE_CACHE_HEADER), 'HIT')
+        self.assertNotContains(restricted, 'Primeiro trecho')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            restriction.delete()
+        response = self.client.get(self.article.url)
+
+        self.assertEqual(response[PAGE_CACHE_HEADER], 'MISS')
+        self.assertContains(response, 'Primeiro trecho')
+
+    def test_conditional_get_returns_not_modified(self):
+        etag = self.client.get(self.article.url)['ETag']
+
+        response = self.client.get(self.article.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_publish_changes_shell_etag(self):
+        etag = self.client.get(self.article.url)['ETag']
+        self.article.title = "Premium revisado"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.save_revision().publish()
+
+        response = self.client.get(self.article.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_reader_fragment(self):
+        anonymous = self.client.get(self.reader_url).json()
+        self.assertFalse(anonymous['authenticated'])
+        self.assertIn('Entrar', anonymous['slots']['account'])
+        self.assertNotIn('article-body', anonymous['slots'])
+
+        self.client.force_login(self.reader)
+        reader = self.client.get(self.reader_url)
+        self.assertIn('no-cache', reader['Cache-Control'])
+        self.assertTrue(reader.json()['authenticated'])
+        self.assertIn('Sair', reader.json()['slots']['logout'])
+        self.assertNotIn('article-body', reader.json()['slots'])
+
+        self.client.force_login(self.subscriber)
+        subscriber = self.client.get(self.reader_url).json()
+        self.assertIn('Trecho exclusivo', subscriber['slots']['article-body'])
+        self.assertIn('Premium', subscriber['slots']['account'])
+
+    def test_reader_fragment_requires_live_article(self):
+        ArticlePage.objects.filter(pk=self.article.pk).update(live=False)
+
+        self.assertEqual(self.client.get(self.reader_url).status_code, 404)
@@ -5,13 +5,24 @@ This test suite ensures:
 1. Premium articles remain premium indefinitely (no auto-expiration)
 2. Trending articles expire after 3 hours as expected
 3. Premium and trending flags are independent
+4. New articles get their trending window in a single write
+5. The expire_trending sweep clears expired trending windows
+6. The sweep is kept scheduled as a single recurring db_worker task
 """
 
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from datetime import timedelta
+from django_tasks.backends.database.models import DBTaskResult
+from django_tasks.task import ResultStatus
 from freezegun import freeze_time
 from wagtail.models import Page
+from content.listings import expire_trending, sweep_trending
 from content.models import HomePage, ArticlePage
 
 
@@ -311,3 +322,78 @@ class ArticleSaveMethodTestCase(TestCase):
         
         # Premium should still be True
         self.assertTrue(article.is_premium, "is_premium should persist through saves")
+
+
+class TrendingSweepTestCase(TestCase):
+    """Test the single-write trending window and the expire_trending sweep"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        root_page = Page.objects.get(id=1)
+        self.home_page = HomePage(
+            title="Test Home",
+            slug="test-home",
+        )
+        root_page.add_child(instance=self.home_page)
+    
+    def test_new_article_gets_trending_window_in_single_write(self):
+        """Test that creating an article never re-saves it to set trending"""
+        article = ArticlePage(
+            title="Single Write",
+            slug="single-write",
+            introduction="Single write",
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.home_page.add_child(instance=article)
+        
+        article_updates = [
+            query['sql'] for query in queries
+            if query['sql'].startswith('UPDATE "content_articlepage"')
+        ]
+        self.assertEqual(article_updates, [])
+        article.refresh_from_db()
+        self.assertTrue(article.is_trending)
+        self.assertIsNotNone(article.trending_until)
+    
+    def test_sweep_expires_only_past_windows(self):
+        """Test that expire_trending clears expired articles and keeps the rest"""
+        initial_time = timezone.now()
+        with freeze_time(initial_time):
+            expiring = ArticlePage(title="Expiring", slug="expiring", introduction="A")
+            self.home_page.add_child(instance=expiring)
+            manual = ArticlePage(title="Manual", slug="manual", introduction="B")
+            self.home_page.add_child(instance=manual)
+        ArticlePage.objects.filter(pk=manual.pk).update(trending_until=None)
+        
+        out = StringIO()
+        with freeze_time(initial_time + timedelta(hours=3, minutes=1)):
+            call_command('expire_trending', stdout=out)
+        
+        expiring.refresh_from_db()
+        manual.refresh_from_db()
+        self.assertFalse(expiring.is_trending)
+        self.assertTrue(manual.is_trending)
+        self.assertIn('1 artigos', out.getvalue())
+        self.assertEqual(expire_trending(), 0)
+
+    def test_sweep_reschedules_itself(self):
+        """Test that the command and the task keep exactly one sweep queued"""
+        for _ in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('expire_trending', stdout=StringIO())
+
+        queued = DBTaskResult.objects.get(task_path='content.listings.sweep_trending')
+        self.assertEqual(queued.status, ResultStatus.READY)
+        self.assertGreater(queued.run_after, timezone.now())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(sweep_trending.call(), 0)
+        self.assertEqual(
+            DBTaskResult.objects.filter(task_path='content.listings.sweep_trending').count(), 1
+        )
+        DBTaskResult.objects.all().delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            sweep_trending.call()
+        self.assertTrue(
+            DBTaskResult.objects.filter(task_path='content.listings.sweep_trending').exists()
+        )
@@ -0,0 +1,175 @@
+"""
+Tests for the local copies of remote images.
+
+This test suite ensures:
+1. A remote URL is fetched once, stored as a Wagtail image and gets its renditions
+2. Failed downloads are recorded and not retried inside the retry window
+3. Article cards and video thumbnails serve the local rendition once ingested
+4. A changed URL falls back to the remote image until it is ingested again
+5. The ingest_remote_images command backfills articles and videos
+6. Publishing queues the download for the task worker; the command retries failed downloads
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django_tasks.backends.database.models import DBTaskResult
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Page
+
+from content.listings import build_article_listing
+from content.models import ArticlePage, HomePage, RemoteImage, VideoShort
+from content.remote_images import (
+    RemoteImageError, attach_article_image, attach_video_thumbnail, ingest_remote_image,
+)
+
+
+fetched_urls = []
+
+
+def local_fetcher(url):
+    """Fetcher de teste: devolve um PNG gerado localmente."""
+    fetched_urls.append(url)
+    return get_test_image_file(filename='remote.png').file.getvalue()
+
+
+def failing_fetcher(url):
+    fetched_urls.append(url)
+    raise RemoteImageError('HTTP 404')
+
+
+@override_settings(REMOTE_IMAGE_FETCHER='content.test_remote_images.local_fetcher')
+class RemoteImageTestCase(TestCase):
+    """Test the remote image ingest pipeline"""
+
+    def setUp(self):
+        fetched_urls.clear()
+        # O Wagtail guarda renditions em cache pelo id da imagem, que se repete entre testes
+        get_image_model().get_rendition_model().cache_backend.clear()
+        self.home_page = HomePage(title="Remote Home", slug="remote-home")
+        Page.objects.get(id=1).add_child(instance=self.home_page)
+
+    def add_article(self, slug, external_image_url):
+        article = ArticlePage(
+            title=slug.title(), slug=slug, introduction="Resumo",
+            external_image_url=external_image_url,
+        )
+        self.home_page.add_child(instance=article)
+        return article
+
+    def only_card(self):
+        listing = build_article_listing(ArticlePage.objects.live())
+        (card,) = listing.trending + listing.regular
+        return card
+
+    def test_url_fetched_once_with_renditions(self):
+        url = 'https://cdn.example.com/capa.jpg'
+
+        remote = ingest_remote_image(url)
+        again = ingest_remote_image(url)
+
+        self.assertEqual(fetched_urls, [url])
+        self.assertEqual(again.pk, remote.pk)
+        self.assertEqual(remote.image.width, 640)
+        self.assertTrue(remote.image.renditions.filter(filter_spec='fill-400x250').exists())
+
+    @override_settings(REMOTE_IMAGE_FETCHER='content.test_remote_images.failing_fetcher')
+    def test_failure_recorded_and_not_retried_immediately(self):
+        url = 'https://cdn.example.com/ausente.jpg'
+
+        remote = ingest_remote_image(url)
+        ingest_remote_image(url)
+
+        self.assertIsNone(remote.image)
+        self.assertEqual(remote.last_error, 'HTTP 404')
+        self.assertEqual(fetched_urls, [url])
+
+        RemoteImage.objects.update(attempted_at=timezone.now() - timedelta(days=1))
+        ingest_remote_image(url)
+        self.assertEqual(len(fetched_urls), 2)
+
+    def test_card_serves_local_rendition(self):
+        article = self.add_article('capa', 'https://cdn.example.com/capa.jpg')
+        attach_article_image(article.pk)
+
+        card = self.only_card()
+
+        self.assertEqual(card.external_image_url, '')
+        self.assertTrue(card.thumbnail_url.startswith('/media/images/remote-'))
+        self.assertEqual(card.image_alt, 'Capa')
+
+    def test_changed_url_falls_back_to_remote(self):
+        article = self.add_article('capa', 'https://cdn.example.com/capa.jpg')
+        attach_article_image(article.pk)
+        ArticlePage.objects.filter(pk=article.pk).update(
+            external_image_url='https://cdn.example.com/nova.jpg'
+        )
+
+        card = self.only_card()
+
+        self.assertEqual(card.external_image_url, 'https://cdn.example.com/nova.jpg')
+        self.assertEqual(card.thumbnail_url, '')
+
+    def test_publish_links_already_ingested_url(self):
+        url = 'https://cdn.example.com/capa.jpg'
+        remote = ingest_remote_image(url)
+        article = self.add_article('capa', url)
+
+        article.save_revision().publish()
+
+        self.assertEqual(ArticlePage.objects.get(pk=article.pk).external_image_id, remote.pk)
+        self.assertEqual(fetched_urls, [url])
+
+    def test_video_thumbnail_served_locally(self):
+        video = VideoShort.objects.create(title="Short", video_url="https://youtu.be/Video000001")
+        self.assertEqual(video.get_thumbnail_url(), 'https://img.youtube.com/vi/Video000001/hqdefault.jpg')
+
+        attach_video_thumbnail(video.pk)
+
+        video = VideoShort.objects.select_related('remote_thumbnail__image').get(pk=video.pk)
+        self.assertEqual(fetched_urls, ['https://img.youtube.com/vi/Video000001/hqdefault.jpg'])
+        self.assertIn('fill-360x640', video.get_thumbnail_url())
+
+    def test_command_backfills_articles_and_videos(self):
+        self.add_article('capa', 'https://cdn.example.com/capa.jpg')
+        self.add_article('sem-imagem', '')
+        VideoShort.objects.create(title="Short", video_url="https://vimeo.com/42")
+        stdout = StringIO()
+
+        call_command('ingest_remote_images', workers=1, stdout=stdout)
+
+        self.assertIn('2 de 2 imagens remotas', stdout.getvalue())
+        self.assertEqual(RemoteImage.objects.filter(image__isnull=False).count(), 2)
+        self.assertTrue(
+            ArticlePage.objects.filter(slug='capa', external_image__isnull=False).exists()
+        )
+
+    def test_publish_queues_download_for_the_worker(self):
+        article = self.add_article('capa', 'https://cdn.example.com/capa.jpg')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save_revision().publish()
+
+        self.assertEqual(fetched_urls, [])
+        queued = DBTaskResult.objects.get(task_path='content.remote_images.ingest_article_image')
+        self.assertEqual(queued.args_kwargs, {'args': [article.pk], 'kwargs': {}})
+
+    def test_command_retries_failed_downloads(self):
+        with override_settings(REMOTE_IMAGE_FETCHER='content.test_remote_images.failing_fetcher'):
+            failed = self.add_article('ausente', 'https://cdn.example.com/ausente.jpg')
+            attach_article_image(failed.pk)
+        attached = self.add_article('capa', 'https://cdn.example.com/capa.jpg')
+        attach_article_image(attached.pk)
+        fetched_urls.clear()
+        stdout = StringIO()
+
+        call_command('ingest_remote_images', workers=1, stdout=stdout)
+
+        # Só a falha recente é tentada de novo; a já ligada fica como está
+        self.assertEqual(fetched_urls, ['https://cdn.example.com/ausente.jpg'])
+        self.assertIn('1 de 1 imagens remotas pendentes', stdout.getvalue())
+        self.assertIsNotNone(ArticlePage.objects.get(pk=failed.pk).external_image_id)
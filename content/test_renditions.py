@@ -0,0 +1,186 @@
+"""
+Tests for pre-generated image renditions.
+
+This test suite ensures:
+1. Requests never resize images: missing renditions fall back to the original
+2. Listings load every card rendition with a single query
+3. Publishing an article queues its renditions for the task worker after commit
+4. The warm_renditions command generates missing renditions
+5. Article images render as <picture> with AVIF/WebP srcsets built from existing renditions
+6. Publishing re-renders the stored body once its image renditions exist
+7. Share images and video posters use sized renditions instead of originals
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django_tasks.backends.database.models import DBTaskResult
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Site
+
+from content.listings import build_article_listing
+from content.models import ArticlePage
+from content.renditions import (
+    ARTICLE_IMAGE_SPECS,
+    POSTER_IMAGE_SPEC,
+    RESPONSIVE_IMAGE_SPECS,
+    OriginalImage,
+    generate_renditions,
+    ready_rendition,
+    responsive_image,
+)
+from content.test_listings import ArticleListingFixtureMixin
+
+
+# Executa as tarefas enfileiradas no próprio processo do teste
+IMMEDIATE_TASKS = {'default': {'BACKEND': 'django_tasks.backends.immediate.ImmediateBackend'}}
+
+
+class RenditionTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test rendition generation and bulk loading"""
+
+    def setUp(self):
+        super().setUp()
+        self.image = get_image_model().objects.create(
+            title="Capa", file=get_test_image_file(filename="capa.png"),
+        )
+        self.rendition_model = get_image_model().get_rendition_model()
+        # O Wagtail guarda renditions em cache pelo id da imagem, que se repete entre testes
+        self.rendition_model.cache_backend.clear()
+
+    def test_missing_rendition_falls_back_to_original(self):
+        result = ready_rendition(self.image, 'fill-400x250')
+
+        self.assertIsInstance(result, OriginalImage)
+        self.assertEqual(result.url, self.image.file.url)
+        self.assertFalse(self.rendition_model.objects.exists())
+
+    def test_listing_loads_renditions_in_bulk(self):
+        for index in range(4):
+            self.add_article(f'story-{index}', index, featured_image=self.image)
+        generate_renditions([self.image.pk])
+
+        queryset = ArticlePage.objects.descendant_of(self.home_page).live()
+        Site.get_site_root_paths()  # URLs dos cards: raízes dos sites ficam em cache
+        with self.assertNumQueries(5):  # Três grupos de artigos + tags + renditions
+            listing = build_article_listing(queryset)
+
+        thumb = self.image.get_rendition('fill-400x250')
+        self.assertEqual((thumb.width, thumb.height), (400, 250))
+        for article in listing.regular:
+            self.assertEqual(article.thumbnail_url, thumb.url)
+
+    def test_publish_generates_renditions_after_commit(self):
+        article = self.add_article('story', 1, featured_image=self.image)
+
+        with self.captureOnCommitCallbacks(execute=True), override_settings(TASKS=IMMEDIATE_TASKS):
+            article.save_revision().publish()
+
+        specs = set(
+            self.rendition_model.objects.filter(image=self.image)
+            .values_list('filter_spec', flat=True)
+        )
+        self.assertEqual(specs, set(ARTICLE_IMAGE_SPECS))
+
+    def test_publish_queues_renditions_for_the_worker(self):
+        article = self.add_article('story', 1, featured_image=self.image)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save_revision().publish()
+
+        self.assertFalse(self.rendition_model.objects.exists())
+        queued = DBTaskResult.objects.get(task_path='content.renditions.warm_page_renditions')
+        self.assertEqual(queued.args_kwargs, {'args': [article.pk], 'kwargs': {}})
+
+    def test_warm_renditions_command(self):
+        self.add_article('story', 1, featured_image=self.image)
+        out = StringIO()
+
+        call_command('warm_renditions', workers=1, stdout=out)
+
+        self.assertEqual(
+            self.rendition_model.objects.filter(image=self.image).count(),
+            len(ARTICLE_IMAGE_SPECS),
+        )
+        self.assertIn('ArticlePage.featured_image: 1 imagens', out.getvalue())
+
+
+class ResponsiveImageTestCase(ArticleListingFixtureMixin, TestCase):
+    """Test the responsive <picture> pipeline for article media"""
+
+    def setUp(self):
+        super().setUp()
+        Site.objects.create(
+            hostname='testserver', root_page=self.home_page, is_default_site=True, site_name='Test Site',
+        )
+        self.image = get_image_model().objects.create(
+            title="Capa", file=get_test_image_file(filename="capa.png", size=(1000, 500)),
+        )
+        self.rendition_model = get_image_model().get_rendition_model()
+        self.rendition_model.cache_backend.clear()
+
+    def publish_synchronously(self, article):
+        with self.captureOnCommitCallbacks(execute=True), override_settings(TASKS=IMMEDIATE_TASKS):
+            article.save_revision().publish()
+        article.refresh_from_db()
+
+    def test_srcset_uses_existing_renditions_only(self):
+        picture = responsive_image(self.image)
+        self.assertEqual(picture.sources, [])
+        self.assertEqual(picture.url, self.image.file.url)
+        self.assertFalse(self.rendition_model.objects.exists())
+
+        generate_renditions([self.image.pk], RESPONSIVE_IMAGE_SPECS)
+        with self.assertNumQueries(1):
+            picture = responsive_image(get_image_model().objects.get(pk=self.image.pk))
+
+        self.assertEqual([mime for mime, _ in picture.sources], ['image/avif', 'image/webp'])
+        avif_srcset = picture.sources[0][1]
+        self.assertIn('.format-avif.avif 480w', avif_srcset)
+        self.assertIn('.format-avif.avif 1000w', avif_srcset)
+        # 1200 e 1600 não ampliam a imagem: uma entrada por largura real
+        self.assertEqual(avif_srcset.count('w,') + 1, 3)
+        self.assertEqual((picture.width, picture.height), (1000, 500))
+        self.assertIn('width-1200', picture.url)
+
+    def test_publish_rerenders_body_with_srcset(self):
+        article = self.add_article(
+            'story', 1, featured_image=self.image, content_blocks=[('image', self.image)],
+        )
+
+        self.publish_synchronously(article)
+
+        self.assertIn('<source type="image/avif"', article.rendered_body)
+        self.assertIn('sizes="(min-width: 900px) 868px, 100vw"', article.rendered_body)
+        self.assertNotIn(self.image.file.url, article.rendered_body)
+        response = self.client.get(article.url)
+        self.assertContains(response, '<source type="image/webp"', count=2)
+
+    def test_share_image_and_poster_are_sized(self):
+        article = self.add_article(
+            'story', 1, featured_image=self.image, highlight_video_poster=self.image,
+            highlight_video_url='https://cdn.example.com/video.mp4',
+        )
+        self.assertEqual(article.get_image_url(), self.image.file.url)
+
+        self.publish_synchronously(article)
+        article = ArticlePage.objects.get(pk=article.pk)
+
+        self.assertEqual(article.get_image_url(), self.image.get_rendition('width-1200').url)
+        self.assertEqual(
+            article.get_highlight_video_poster_url(), self.image.get_rendition(POSTER_IMAGE_SPEC).url
+        )
+
+    def test_warm_renditions_includes_body_images(self):
+        self.add_article('story', 1, content_blocks=[('image', self.image)])
+        out = StringIO()
+
+        call_command('warm_renditions', workers=1, stdout=out)
+
+        self.assertEqual(
+            set(self.rendition_model.objects.filter(image=self.image).values_list('filter_spec', flat=True)),
+            set(RESPONSIVE_IMAGE_SPECS),
+        )
+        self.assertIn('ArticlePage.content_blocks: 1 imagens', out.getvalue())
@@ -6,12 +6,20 @@ This test suite ensures:
 2. Premium articles have proper visual indicators in templates
 3. Non-subscribers see limited content on article detail pages
 4. Subscribers see full content on article detail pages
+5. Subscriber status is loaded with the session user, without profile queries
+6. Sessions opened through Django's ModelBackend stay logged in
+7. Admin previews of premium drafts render the draft body inline
 """
 
+from django.contrib.auth import authenticate
+from django.db import connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.contrib.auth.models import User
-from wagtail.models import Page
+from wagtail.models import Page, Site
 from content.models import HomePage, ArticlePage, SectionPage, SupportSectionPage
+from content.page_cache import paywall_state
 from accounts.models import UserProfile
 
 
@@ -239,6 +247,20 @@ class ArticlePaywallTestCase(TestCase):
         self.assertFalse(context['is_subscriber'],
                         "is_subscriber should be False for non-subscribers in article context")
     
+    def test_premium_draft_preview_renders_draft_body(self):
+        """Previewing a premium draft shows its body, not the live page or the paywall"""
+        self.premium_article.content_blocks = [('paragraph', '<p>Texto publicado</p>')]
+        self.premium_article.save_revision().publish()
+        self.premium_article.content_blocks = [('paragraph', '<p>Texto do rascunho</p>')]
+        revision = self.premium_article.save_revision()
+
+        response = revision.as_object().make_preview_request()
+
+        self.assertContains(response, 'Texto do rascunho')
+        self.assertNotContains(response, 'Texto publicado')
+        self.assertNotContains(response, 'data-reader-slot="article-body"')
+        self.assertNotContains(response, 'paywall-overlay')
+
     def test_userprofile_is_subscriber_field_exists(self):
         """UserProfile should have is_subscriber field"""
         self.assertTrue(hasattr(UserProfile, 'is_subscriber'),
@@ -248,3 +270,60 @@ class ArticlePaywallTestCase(TestCase):
         user = User.objects.create_user(username='test_user', password='test')
         self.assertFalse(user.userprofile.is_subscriber,
                         "is_subscriber should default to False")
+
+
+class SubscriberStatusQueryTestCase(TestCase):
+    """Test that paywall decisions reuse the profile loaded with the user"""
+
+    def setUp(self):
+        root_page = Page.objects.get(id=1)
+        self.home_page = HomePage(title="Test Home", slug="test-home-profile")
+        root_page.add_child(instance=self.home_page)
+        Site.objects.create(hostname='testserver', root_page=self.home_page, is_default_site=True)
+        self.article = ArticlePage(
+            title="Premium Article",
+            slug="premium-profile",
+            introduction="Premium introduction",
+            is_premium=True,
+        )
+        self.home_page.add_child(instance=self.article)
+        self.subscriber = User.objects.create_user(
+            username='profile_subscriber', email='assinante@example.com', password='testpass123'
+        )
+        self.subscriber.userprofile.is_subscriber = True
+        self.subscriber.userprofile.save()
+
+    def test_authenticated_views_add_no_profile_queries(self):
+        for backend in (
+            'accounts.backends.EmailAuthenticationBackend',
+            'accounts.backends.UsernameAuthenticationBackend',
+        ):
+            self.client.force_login(self.subscriber, backend=backend)
+            reader_url = reverse('article_reader_fragment', args=[self.article.pk])
+            for url in (self.article.url, reader_url, self.home_page.url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+
+                self.assertContains(response, 'Premium')
+                profile_queries = [
+                    query['sql'] for query in queries
+                    if 'FROM "accounts_userprofile"' in query['sql']
+                ]
+                self.assertEqual(profile_queries, [], backend)
+
+    def test_model_backend_sessions_stay_logged_in(self):
+        self.client.force_login(
+            self.subscriber, backend='django.contrib.auth.backends.ModelBackend'
+        )
+
+        response = self.client.get(self.article.url)
+
+        self.assertEqual(response.wsgi_request.user, self.subscriber)
+        self.assertEqual(paywall_state(response.wsgi_request), 'subscriber')
+
+    def test_username_and_email_logins_still_work(self):
+        by_username = authenticate(username='profile_subscriber', password='testpass123')
+        by_email = authenticate(username='assinante@example.com', password='testpass123')
+
+        self.assertEqual(by_username, self.subscriber)
+        self.assertEqual(by_email, self.subscriber)
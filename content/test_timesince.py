@@ -0,0 +1,122 @@
+"""
+Tests for the precomputed timesince_brasilia implementation.
+
+This test suite ensures:
+1. Output is identical to the original per-call implementation
+2. The bulk variant matches the filter item by item
+3. "now" is frozen once per request and reaches templates via context processor
+"""
+
+import zoneinfo
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from content.context_processors import brasilia_now
+from content.templatetags.navigation_tags import timesince_brasilia
+from content.timesince import BRASILIA_TZ, request_now, timesince_many
+
+
+def original_timesince(value, now):
+    """Implementação anterior do filtro, com o "agora" (UTC) injetado."""
+    if not value:
+        return ''
+    if isinstance(value, datetime):
+        date_obj = value
+    elif isinstance(value, date):
+        date_obj = datetime.combine(value, datetime.min.time())
+    else:
+        return ''
+    brasilia_tz = zoneinfo.ZoneInfo('America/Sao_Paulo')
+    if timezone.is_naive(date_obj):
+        date_obj = date_obj.replace(tzinfo=brasilia_tz)
+    else:
+        date_obj = date_obj.astimezone(brasilia_tz)
+    diff = now.astimezone(brasilia_tz) - date_obj
+    if diff.total_seconds() < 0:
+        return 'agora'
+    if diff.days == 0:
+        hours = diff.seconds // 3600
+        if hours == 0:
+            minutes = diff.seconds // 60
+            if minutes == 0:
+                return 'agora'
+            return f'{minutes} minuto{"s" if minutes > 1 else ""}'
+        return f'{hours} hora{"s" if hours > 1 else ""}'
+    elif diff.days == 1:
+        return '1 dia'
+    elif diff.days < 30:
+        return f'{diff.days} dias'
+    elif diff.days < 365:
+        months = diff.days // 30
+        return f'{months} {"mês" if months == 1 else "meses"}'
+    else:
+        years = diff.days // 365
+        return f'{years} ano{"s" if years > 1 else ""}'
+
+
+class TimesinceEquivalenceTestCase(TestCase):
+    """Compare against the original implementation"""
+
+    def setUp(self):
+        # Antes do fim do horário de verão de 2019, para cobrir datas com DST
+        self.now = datetime(2019, 2, 20, 14, 30, 15, tzinfo=dt_timezone.utc)
+
+    def sample_values(self):
+        offsets = [
+            timedelta(seconds=seconds) for seconds in (-3600, -1, 0, 59, 60, 61, 3599, 3600)
+        ] + [
+            timedelta(minutes=minutes) for minutes in range(0, 24 * 60 + 5, 7)
+        ] + [
+            timedelta(days=days, hours=hours)
+            for days in range(0, 800, 3) for hours in (0, 5, 23)
+        ]
+        values = []
+        for offset in offsets:
+            value = self.now - offset
+            values.append(value)
+            values.append(value.astimezone(BRASILIA_TZ))
+            values.append(value.astimezone(BRASILIA_TZ).replace(tzinfo=None))
+            values.append(value.date())
+        return values + [None, '', 'texto']
+
+    def test_output_matches_original(self):
+        now = self.now.astimezone(BRASILIA_TZ)
+        for value in self.sample_values():
+            self.assertEqual(
+                timesince_brasilia(value, now), original_timesince(value, self.now), value
+            )
+
+    def test_bulk_matches_filter(self):
+        now = self.now.astimezone(BRASILIA_TZ)
+        values = self.sample_values()
+        self.assertEqual(
+            timesince_many(values, now), [timesince_brasilia(value, now) for value in values]
+        )
+
+    def test_without_now_uses_current_time(self):
+        self.assertEqual(timesince_brasilia(timezone.now() - timedelta(hours=2)), '2 horas')
+        self.assertEqual(timesince_many([timezone.now() - timedelta(days=3)]), ['3 dias'])
+
+
+class RequestNowTestCase(TestCase):
+    """Test the per-request frozen "now\""""
+
+    def test_now_is_frozen_per_request(self):
+        request = RequestFactory().get('/')
+        first = request_now(request)
+
+        self.assertIs(request_now(request), first)
+        self.assertIs(brasilia_now(request)['brasilia_now'], first)
+        self.assertEqual(first.tzinfo, BRASILIA_TZ)
+
+    def test_template_uses_frozen_now(self):
+        now = datetime(2026, 1, 10, 12, 0, tzinfo=BRASILIA_TZ)
+        template = Template(
+            '{% load navigation_tags %}{{ value|timesince_brasilia:brasilia_now }}'
+        )
+        context = Context({'value': now - timedelta(minutes=90), 'brasilia_now': now})
+
+        self.assertEqual(template.render(context), '1 hora')
@@ -0,0 +1,235 @@
+"""
+Tests for the video provider registry and the stored VideoShort metadata.
+
+This test suite ensures:
+1. YouTube and Vimeo links are recognized once and mapped to embed/thumbnail URLs
+2. VideoShort stores the derived URLs on save and serves them without parsing
+3. The refresh_video_metadata command backfills rows written without save()
+4. The videos grid renders without parsing any URL
+5. Article video embeds render as click-to-load facades, without iframes or the Plyr bundle
+6. Video ids outside the platform format (e.g. longer than VideoShort.video_id) are rejected
+7. Facade posters are ingested in the background and served from the local copy, with the remote fallback
+"""
+
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.templatetags.static import static
+from django.test import TestCase, override_settings
+from django_tasks.backends.database.models import DBTaskResult
+from wagtail.models import Page, Site
+
+from content.models import ArticlePage, HomePage, RemoteImage, VideoShort, VideosPage
+from content.remote_images import attach_article_video_posters
+from content.video_providers import parse_video_url
+
+
+class ParseVideoUrlTestCase(TestCase):
+    """Test the provider registry"""
+
+    def test_known_links(self):
+        cases = {
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10': ('youtube', 'dQw4w9WgXcQ'),
+            'https://youtube.com/shorts/AbCdEf12345/': ('youtube', 'AbCdEf12345'),
+            'https://www.youtube-nocookie.com/embed/AbCdEf12345': ('youtube', 'AbCdEf12345'),
+            'https://m.youtube.com/live/Live1234567': ('youtube', 'Live1234567'),
+            'https://youtu.be/XyZ98765432': ('youtube', 'XyZ98765432'),
+            'https://vimeo.com/channels/staff/123456': ('vimeo', '123456'),
+        }
+        for url, (provider, video_id) in cases.items():
+            match = parse_video_url(url)
+            self.assertEqual((match.provider, match.video_id), (provider, video_id), url)
+
+        match = parse_video_url('https://vimeo.com/123456')
+        self.assertEqual(match.embed_url, 'https://player.vimeo.com/video/123456')
+        self.assertEqual(match.thumbnail_url, 'https://vumbnail.com/123456.jpg')
+
+    def test_unknown_links(self):
+        for url in ('', None, 'https://vimeo.com/about', 'https://example.com/video.mp4'):
+            self.assertIsNone(parse_video_url(url), url)
+
+    def test_invalid_ids(self):
+        long_id = 'A' * 80
+        for url in (
+            f'https://www.youtube.com/watch?v={long_id}',
+            f'https://youtu.be/{long_id}',
+            'https://youtu.be/Short',
+            'https://www.youtube.com/embed/AbCdEf1234%3Cscript%3E',
+            f'https://vimeo.com/{"1" * 80}',
+        ):
+            self.assertIsNone(parse_video_url(url), url)
+
+
+class VideoShortMetadataTestCase(TestCase):
+    """Test the metadata stored on VideoShort"""
+
+    def test_metadata_stored_on_save(self):
+        video = VideoShort.objects.create(
+            title="Short", video_url="https://www.youtube.com/shorts/AbCdEf12345",
+        )
+        video = VideoShort.objects.get(pk=video.pk)
+
+        self.assertEqual(video.video_provider, 'youtube')
+        self.assertEqual(video.video_id, 'AbCdEf12345')
+        with mock.patch('content.video_providers.parse_video_url') as parse:
+            self.assertEqual(video.get_embed_url(), 'https://www.youtube.com/embed/AbCdEf12345')
+            self.assertEqual(
+                video.get_thumbnail_url(), 'https://img.youtube.com/vi/AbCdEf12345/hqdefault.jpg'
+            )
+        parse.assert_not_called()
+
+    def test_unknown_and_cdn_sources(self):
+        unknown = VideoShort.objects.create(title="Outro", video_url="https://example.com/v/1")
+        self.assertEqual(unknown.embed_url, 'https://example.com/v/1')
+        self.assertEqual(unknown.get_thumbnail_url(), static(VideoShort.PLACEHOLDER_THUMBNAIL))
+
+        cdn = VideoShort.objects.create(
+            title="CDN", video_source_type='cdn',
+            video_url="https://youtu.be/XyZ98765432",
+            cdn_video_url="https://cdn.example.com/v.mp4", cdn_mime_type='video/mp4',
+        )
+        self.assertEqual(cdn.embed_url, '')
+        self.assertEqual(cdn.auto_thumbnail_url, 'https://img.youtube.com/vi/XyZ98765432/hqdefault.jpg')
+
+    def test_over_long_id_rejected(self):
+        url = f'https://www.youtube.com/watch?v={"A" * 80}'
+        video = VideoShort(title="Longo", video_url=url)
+
+        with self.assertRaises(ValidationError) as raised:
+            video.full_clean()
+        self.assertIn('video_url', raised.exception.message_dict)
+
+        # Gravado sem validação (ex.: importação): o id não é guardado
+        video.save()
+        video = VideoShort.objects.get(pk=video.pk)
+        self.assertEqual((video.video_provider, video.video_id), ('', ''))
+        self.assertEqual(video.embed_url, url)
+
+    def test_update_fields_includes_metadata(self):
+        video = VideoShort.objects.create(title="Short", video_url="https://youtu.be/First123456")
+        video.video_url = 'https://youtu.be/Second12345'
+        video.save(update_fields=['video_url'])
+
+        self.assertEqual(VideoShort.objects.get(pk=video.pk).video_id, 'Second12345')
+
+    def test_command_backfills_bulk_created_rows(self):
+        VideoShort.objects.bulk_create([
+            VideoShort(title="Vimeo", video_url="https://vimeo.com/42"),
+            VideoShort(title="Sem link"),
+        ])
+        stdout = StringIO()
+
+        call_command('refresh_video_metadata', stdout=stdout)
+
+        self.assertEqual(
+            VideoShort.objects.get(title="Vimeo").embed_url, 'https://player.vimeo.com/video/42'
+        )
+        self.assertIn('1 vídeos atualizados (1 já estavam atualizados)', stdout.getvalue())
+
+
+class VideosGridTestCase(TestCase):
+    """Test that the videos grid does no URL parsing at request time"""
+
+    def setUp(self):
+        home_page = HomePage(title="Videos Home", slug="videos-home")
+        Page.objects.get(id=1).add_child(instance=home_page)
+        Site.objects.create(hostname='testserver', root_page=home_page, is_default_site=True)
+        self.videos_page = VideosPage(title="Vídeos", slug="videos")
+        home_page.add_child(instance=self.videos_page)
+        for index in range(3):
+            VideoShort.objects.create(
+                title=f"Short {index}", video_url=f"https://youtu.be/Video{index:06d}",
+            )
+
+    def test_grid_renders_stored_urls(self):
+        with mock.patch('content.video_providers.parse_video_url') as parse:
+            response = self.client.get(self.videos_page.url)
+
+        parse.assert_not_called()
+        self.assertContains(response, 'https://www.youtube.com/embed/Video000002')
+        self.assertContains(response, 'https://img.youtube.com/vi/Video000000/hqdefault.jpg')
+        self.assertContains(response, 'data-provider="youtube"')
+        self.assertContains(response, 'data-video-id="Video000002"')
+        self.assertNotContains(response, 'plyr')
+
+
+class VideoFacadeTestCase(TestCase):
+    """Test the lite embeds of article video blocks"""
+
+    def setUp(self):
+        home_page = HomePage(title="Facade Home", slug="facade-home")
+        Page.objects.get(id=1).add_child(instance=home_page)
+        Site.objects.create(hostname='testserver', root_page=home_page, is_default_site=True)
+        self.home_page = home_page
+
+    def publish(self, *urls):
+        article = ArticlePage(
+            title="Vídeos", slug="videos-artigo", introduction="Resumo",
+            content_blocks=[('video', url) for url in urls],
+        )
+        self.home_page.add_child(instance=article)
+        article.save_revision().publish()
+        return ArticlePage.objects.get(pk=article.pk)
+
+    def test_known_providers_render_facades(self):
+        with mock.patch('wagtail.embeds.embeds.get_embed') as get_embed:
+            article = self.publish(
+                'https://www.youtube.com/watch?v=AbCdEf12345', 'https://youtube.com/shorts/Short123456',
+                'https://vimeo.com/42',
+            )
+
+        get_embed.assert_not_called()
+        body = article.rendered_body
+        self.assertNotIn('<iframe', body)
+        self.assertEqual(body.count('data-video-facade'), 3)
+        self.assertIn('data-embed-url="https://www.youtube.com/embed/AbCdEf12345"', body)
+        self.assertIn('src="https://img.youtube.com/vi/AbCdEf12345/hqdefault.jpg"', body)
+        self.assertIn('href="https://www.youtube.com/watch?v=AbCdEf12345"', body)
+        self.assertIn('ratio-9x16', body)
+        self.assertIn('data-embed-url="https://player.vimeo.com/video/42"', body)
+
+    def test_unknown_provider_keeps_embed(self):
+        embed = mock.Mock(html='<iframe src="https://example.com/player/1"></iframe>')
+        with mock.patch('wagtail.embeds.embeds.get_embed', return_value=embed):
+            article = self.publish('https://example.com/v/1')
+
+        self.assertIn('<iframe src="https://example.com/player/1"></iframe>', article.rendered_body)
+        self.assertNotIn('data-video-facade', article.rendered_body)
+
+    @override_settings(REMOTE_IMAGE_FETCHER='content.test_remote_images.local_fetcher')
+    def test_poster_served_from_local_copy(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            article = self.publish('https://www.youtube.com/watch?v=AbCdEf12345')
+
+        queued = DBTaskResult.objects.get(task_path='content.remote_images.ingest_article_video_posters')
+        self.assertEqual(queued.args_kwargs, {'args': [article.pk], 'kwargs': {}})
+        self.assertIn('src="https://img.youtube.com/vi/AbCdEf12345/hqdefault.jpg"', article.rendered_body)
+
+        self.assertEqual(attach_article_video_posters(article.pk), 1)
+
+        body = ArticlePage.objects.get(pk=article.pk).rendered_body
+        self.assertNotIn('img.youtube.com', body)
+        self.assertIn('<picture>', body)
+        self.assertIn('class="video-facade-poster"', body)
+        poster = RemoteImage.objects.get(source_url='https://img.youtube.com/vi/AbCdEf12345/hqdefault.jpg')
+        self.assertIn(poster.image.get_rendition('width-1200').url, body)
+
+    @override_settings(REMOTE_IMAGE_FETCHER='content.test_remote_images.local_fetcher')
+    def test_command_backfills_posters(self):
+        article = self.publish('https://vimeo.com/42')
+        stdout = StringIO()
+
+        call_command('ingest_remote_images', workers=1, stdout=stdout)
+
+        self.assertIn('1 de 1 imagens remotas', stdout.getvalue())
+        self.assertIn('<picture>', ArticlePage.objects.get(pk=article.pk).rendered_body)
+
+    def test_article_page_does_not_load_plyr(self):
+        article = self.publish('https://youtu.be/AbCdEf12345')
+
+        response = self.client.get(article.url)
+
+        self.assertContains(response, 'data-video-facade')
+        self.assertNotContains(response, 'plyr')
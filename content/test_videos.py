@@ -0,0 +1,114 @@
+"""
+Tests for the short video listings.
+
+This test suite ensures:
+1. VideosPage walks the grid with keyset cursors, without gaps or repeats
+2. The featured strip and the first grid page are cached and invalidated on save
+3. The "load more" fragment rejects malformed cursors
+4. Grid and featured queries use the VideoShort indexes
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from wagtail.models import Page, Site
+
+from content.listings import InvalidCursor
+from content.models import HomePage, VideoShort, VideosPage
+from content.videos import (
+    build_video_page, decode_video_cursor, get_featured_videos, load_video_page, video_queryset,
+)
+
+
+class VideoListingTestCase(TestCase):
+    """Test the paginated and cached video listings"""
+
+    def setUp(self):
+        cache.clear()
+        home_page = HomePage(title="Videos Home", slug="videos-home")
+        Page.objects.get(id=1).add_child(instance=home_page)
+        Site.objects.create(hostname='testserver', root_page=home_page, is_default_site=True)
+        self.videos_page = VideosPage(title="Vídeos", slug="videos")
+        home_page.add_child(instance=self.videos_page)
+        # Ordens repetidas para exercitar o desempate por created_at e id
+        for index in range(7):
+            VideoShort.objects.create(
+                title=f"Short {index}", video_url=f"https://youtu.be/Video{index:06d}",
+                order=index // 3, is_featured=index % 2 == 0,
+            )
+
+    def test_keyset_pages_cover_grid_in_order(self):
+        expected = list(video_queryset().values_list('pk', flat=True))
+
+        seen = []
+        videos, cursor = load_video_page(page_size=3)
+        seen.extend(video.pk for video in videos)
+        while cursor:
+            with self.assertNumQueries(1):
+                videos, cursor = load_video_page(decode_video_cursor(cursor), page_size=3)
+            seen.extend(video.pk for video in videos)
+
+        self.assertEqual(seen, expected)
+
+    def test_first_page_and_featured_are_cached_until_save(self):
+        build_video_page()
+        get_featured_videos()
+        with self.assertNumQueries(0):
+            self.assertEqual(len(build_video_page()[0]), 7)
+            self.assertEqual(len(get_featured_videos()), 4)
+
+        VideoShort.objects.filter(title="Short 1").get().delete()
+        video = VideoShort.objects.get(title="Short 3")
+        video.is_featured = True
+        video.save()
+
+        self.assertEqual(len(build_video_page()[0]), 6)
+        self.assertEqual(len(get_featured_videos()), 5)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            build_video_page('not-a-cursor')
+
+        url = reverse('video_listing_fragment', args=[self.videos_page.pk])
+        self.assertEqual(self.client.get(url, {'cursor': 'bad'}).status_code, 400)
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+    def test_fragment_serves_next_page(self):
+        first_page, cursor = load_video_page(page_size=4)
+        url = reverse('video_listing_fragment', args=[self.videos_page.pk])
+
+        response = self.client.get(url, {'cursor': cursor})
+
+        self.assertEqual(response['X-Next-Cursor'], '')
+        self.assertNotContains(response, first_page[0].title)
+        self.assertContains(response, 'class="video-short-card"', count=3)
+
+    def test_videos_page_renders_first_page(self):
+        response = self.client.get(self.videos_page.url)
+
+        self.assertContains(response, 'class="video-short-card"', count=7)
+        self.assertEqual(response.context['next_cursor'], '')
+
+
+class VideoIndexTestCase(TestCase):
+    """Fail if the video listing queries stop using their indexes"""
+
+    def setUp(self):
+        for index in range(30):
+            VideoShort.objects.create(title=f"Short {index}", order=index, is_featured=index < 6)
+
+    def assertUsesIndex(self, queryset, index_name):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Plano verificado apenas no SQLite')
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+        self.assertNotIn('TEMP B-TREE FOR ORDER BY', plan, plan)
+
+    def test_grid_uses_order_index(self):
+        self.assertUsesIndex(video_queryset()[:25], 'videoshort_order_idx')
+
+    def test_featured_uses_partial_index(self):
+        self.assertUsesIndex(
+            video_queryset().filter(is_featured=True)[:6], 'videoshort_featured_idx'
+        )
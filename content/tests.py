@@ -1,3 +1,4 @@
+from django.templatetags.static import static
 from django.test import TestCase, RequestFactory
 from datetime import datetime, timedelta, date
 from django.utils import timezone
@@ -51,7 +52,7 @@ class SupportSectionNavigationTestCase(TestCase):
     def test_get_support_sections_returns_all_published(self):
         """Test that get_support_sections returns all published support sections"""
         sections = get_support_sections()
-        self.assertEqual(sections.count(), 2)
+        self.assertEqual(len(sections), 2)
         
         section_titles = [section.title for section in sections]
         self.assertIn("Escatologia", section_titles)
@@ -246,7 +247,7 @@ class MediaFallbackTests(TestCase):
 
         self.assertEqual(
             video.get_thumbnail_url(),
-            VideoShort.PLACEHOLDER_THUMBNAIL
+            static(VideoShort.PLACEHOLDER_THUMBNAIL)
         )
 
     def test_video_short_thumbnail_generated_from_youtube_watch(self):
@@ -0,0 +1,117 @@
+"""
+Tempo decorrido ("há 3 horas") no fuso horário de Brasília.
+
+O filtro ``timesince_brasilia`` roda para cada card de cada listagem, então o
+cálculo foi reduzido ao mínimo:
+
+- o fuso é criado uma vez, no import do módulo;
+- o "agora" é congelado por requisição (``request_now``) e chega aos
+  templates pelo context processor ``content.context_processors.brasilia_now``;
+  todos os cards de uma página usam o mesmo instante;
+- os rótulos são pré-calculados: uma tabela por minuto para o mesmo dia e uma
+  por dia para o primeiro ano, de modo que formatar uma data é uma conversão de
+  fuso, uma subtração e uma consulta à tabela.
+
+``timesince_many`` formata uma lista inteira de datas com o mesmo "agora".
+
+A saída é a mesma da implementação original: as duas datas são comparadas
+como horário de parede de Brasília (datas sem fuso são consideradas de
+Brasília) e datas futuras viram "agora".
+"""
+
+import zoneinfo
+from datetime import date, datetime, time
+
+from django.utils import timezone
+
+
+try:
+    BRASILIA_TZ = zoneinfo.ZoneInfo('America/Sao_Paulo')
+except zoneinfo.ZoneInfoNotFoundError:
+    # Fallback para UTC se a base de fusos não estiver disponível
+    BRASILIA_TZ = zoneinfo.ZoneInfo('UTC')
+
+NOW_ATTRIBUTE = '_brasilia_now'
+
+
+def _plural(count, singular, plural):
+    return f'{count} {singular if count == 1 else plural}'
+
+
+def _same_day_label(minutes):
+    if minutes == 0:
+        return 'agora'
+    if minutes < 60:
+        return _plural(minutes, 'minuto', 'minutos')
+    return _plural(minutes // 60, 'hora', 'horas')
+
+
+def _day_label(days):
+    if days == 1:
+        return '1 dia'
+    if days < 30:
+        return f'{days} dias'
+    return _plural(days // 30, 'mês', 'meses')
+
+
+# Rótulos por minuto decorrido no mesmo dia e por dia decorrido no primeiro ano
+SAME_DAY_LABELS = tuple(_same_day_label(minutes) for minutes in range(24 * 60))
+DAY_LABELS = (None,) + tuple(_day_label(days) for days in range(1, 365))
+
+
+def brasilia_now():
+    return timezone.now().astimezone(BRASILIA_TZ)
+
+
+def request_now(request=None):
+    """O "agora" de Brasília congelado no ``request`` (ou o atual, sem request)."""
+    if request is None:
+        return brasilia_now()
+    now = getattr(request, NOW_ATTRIBUTE, None)
+    if now is None:
+        now = brasilia_now()
+        setattr(request, NOW_ATTRIBUTE, now)
+    return now
+
+
+def _elapsed(value, now):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=BRASILIA_TZ)
+        else:
+            value = value.astimezone(BRASILIA_TZ)
+    elif isinstance(value, date):
+        # DateField: início do dia em Brasília
+        value = datetime.combine(value, time.min, tzinfo=BRASILIA_TZ)
+    else:
+        return ''
+
+    # Mesmo tzinfo nos dois lados: subtração pelo horário de parede
+    diff = now - value
+    days = diff.days
+    if days < 0:
+        return 'agora'
+    if days == 0:
+        return SAME_DAY_LABELS[diff.seconds // 60]
+    if days < 365:
+        return DAY_LABELS[days]
+    return _plural(days // 365, 'ano', 'anos')
+
+
+def timesince(value, now=None):
+    """
+    Tempo decorrido desde ``value`` (datetime ou date) em português.
+
+    Args:
+        value: data a formatar; valores vazios resultam em ``''``
+        now: "agora" em Brasília (ver ``request_now``); o instante atual se omitido
+    """
+    if not value:
+        return ''
+    return _elapsed(value, now or brasilia_now())
+
+
+def timesince_many(values, now=None):
+    """Formata uma lista de datas de uma vez, todas com o mesmo "agora"."""
+    now = now or brasilia_now()
+    return [_elapsed(value, now) if value else '' for value in values]
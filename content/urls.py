@@ -0,0 +1,9 @@
+# content/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('artigos/<int:page_id>/', views.article_listing_fragment, name='article_listing_fragment'),
+    path('videos/<int:page_id>/', views.video_listing_fragment, name='video_listing_fragment'),
+    path('artigos/<int:page_id>/leitor/', views.article_reader_fragment, name='article_reader_fragment'),
+]
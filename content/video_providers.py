@@ -0,0 +1,155 @@
+"""
+Reconhecimento de links de plataformas de vídeo (YouTube, Vimeo).
+
+Cada plataforma é registrada uma vez com um padrão de host pré-compilado, uma
+função que extrai o id do vídeo, o formato válido do id e os modelos de URL de
+incorporação e de thumbnail. ``parse_video_url`` analisa o link uma única vez e devolve tudo de
+que os templates precisam.
+
+``VideoShort`` guarda o resultado ao salvar (``embed_url``,
+``auto_thumbnail_url``, ``video_provider`` e ``video_id``); as listagens de
+vídeos não analisam URLs durante a requisição. O comando
+``refresh_video_metadata`` recalcula os campos de todos os vídeos (ex.: após
+registrar uma nova plataforma).
+"""
+
+import re
+from collections import namedtuple
+from urllib.parse import parse_qs, urlparse
+
+
+VideoProvider = namedtuple(
+    'VideoProvider', 'name host_pattern extract_id id_pattern embed_url thumbnail_url'
+)
+VideoMatch = namedtuple('VideoMatch', 'provider video_id embed_url thumbnail_url')
+
+PROVIDERS = []
+
+
+def register_provider(name, host, extract_id, id_pattern, embed_url, thumbnail_url):
+    """
+    Registra uma plataforma.
+
+    Args:
+        name: identificador guardado em ``VideoShort.video_provider``
+        host: expressão regular procurada no host do link
+        extract_id: função ``(parsed_url, path) -> id`` (``''`` se não reconhecer)
+        id_pattern: expressão regular que o id inteiro precisa satisfazer
+            (cabe em ``VideoShort.video_id``)
+        embed_url / thumbnail_url: modelos com ``{id}``
+    """
+    PROVIDERS.append(VideoProvider(
+        name, re.compile(host), extract_id, re.compile(id_pattern), embed_url, thumbnail_url,
+    ))
+
+
+def _segments(path):
+    return [segment.split('?')[0] for segment in path.split('/') if segment]
+
+
+def _youtube_id(parsed, path):
+    if path == '/watch':
+        return parse_qs(parsed.query).get('v', [''])[0]
+    segments = _segments(path)
+    if not segments:
+        return ''
+    if segments[0] in {'embed', 'shorts', 'live'} and len(segments) > 1:
+        return segments[1]
+    return segments[-1]
+
+
+def _youtu_be_id(parsed, path):
+    return path.lstrip('/').split('?')[0]
+
+
+def _vimeo_id(parsed, path):
+    segments = _segments(path)
+    if segments and segments[-1].isdigit():
+        return segments[-1]
+    return ''
+
+
+# Ids do YouTube: 11 caracteres base64 para URL; do Vimeo: numéricos
+YOUTUBE_ID = r'[A-Za-z0-9_-]{11}'
+VIMEO_ID = r'[0-9]{1,20}'
+
+register_provider(
+    'youtube', r'youtube\.com|youtube-nocookie\.com', _youtube_id, YOUTUBE_ID,
+    'https://www.youtube.com/embed/{id}', 'https://img.youtube.com/vi/{id}/hqdefault.jpg',
+)
+register_provider(
+    'youtube', r'youtu\.be', _youtu_be_id, YOUTUBE_ID,
+    'https://www.youtube.com/embed/{id}', 'https://img.youtube.com/vi/{id}/hqdefault.jpg',
+)
+register_provider(
+    'vimeo', r'vimeo\.com', _vimeo_id, VIMEO_ID,
+    'https://player.vimeo.com/video/{id}', 'https://vumbnail.com/{id}.jpg',
+)
+
+
+def _parse(url):
+    """``(url analisada, host sem www., caminho)``, ou ``None`` para links vazios ou inválidos."""
+    url = (url or '').strip()
+    if not url:
+        return None
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+
+    netloc = parsed.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    return parsed, netloc, parsed.path.rstrip('/')
+
+
+def is_provider_url(url):
+    """``url`` aponta para o host de uma plataforma registrada (com id válido ou não)."""
+    parts = _parse(url)
+    return parts is not None and any(
+        provider.host_pattern.search(parts[1]) for provider in PROVIDERS
+    )
+
+
+def parse_video_url(url):
+    """
+    Plataforma, id e URLs derivadas de ``url``, ou ``None`` se não reconhecida.
+
+    Ids fora do formato da plataforma (ex.: longos demais) não são reconhecidos.
+    """
+    parts = _parse(url)
+    if parts is None:
+        return None
+    parsed, netloc, path = parts
+
+    for provider in PROVIDERS:
+        if not provider.host_pattern.search(netloc):
+            continue
+        video_id = provider.extract_id(parsed, path)
+        if video_id and provider.id_pattern.fullmatch(video_id):
+            return VideoMatch(
+                provider.name,
+                video_id,
+                provider.embed_url.format(id=video_id),
+                provider.thumbnail_url.format(id=video_id),
+            )
+    return None
+
+
+def video_metadata(video_url, video_source_type, cdn_video_url):
+    """Valores dos campos derivados de ``VideoShort`` para a origem informada."""
+    match = parse_video_url(video_url)
+    uses_cdn = video_source_type == 'cdn' and bool(cdn_video_url)
+
+    if uses_cdn or not video_url:
+        embed_url = ''
+    else:
+        # Links não reconhecidos são incorporados como estão
+        embed_url = match.embed_url if match else video_url
+
+    return {
+        'video_provider': match.provider if match else '',
+        'video_id': match.video_id if match else '',
+        'embed_url': embed_url,
+        'auto_thumbnail_url': match.thumbnail_url if match else '',
+    }
@@ -0,0 +1,115 @@
+"""
+Vídeos curtos: faixa de destaque da home e grade paginada da VideosPage.
+
+As duas listagens seguem a ordem editorial ``(order, -created_at, -id)``,
+coberta pelos índices ``videoshort_order_idx`` e ``videoshort_featured_idx``
+(parcial, só vídeos destacados):
+
+- a faixa de destaque e a primeira página da grade ficam no cache de
+  navigação (ver ``content.navigation``) e são invalidadas quando um
+  ``VideoShort`` é salvo ou removido;
+- as páginas seguintes são paginadas por conjunto de chaves: o cursor aponta
+  para o último vídeo entregue e a próxima página é uma busca por intervalo no
+  índice, com o mesmo custo em qualquer profundidade.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.apps import apps
+from django.db.models import Q
+from django.utils import timezone
+
+from content.listings import InvalidCursor
+from content.navigation import FEATURED_VIDEOS, VIDEOS_FIRST_PAGE, get_navigation_data
+from content.renditions import rendition_prefetch
+
+
+FEATURED_VIDEOS_LIMIT = 6
+VIDEOS_PAGE_SIZE = 24
+
+VIDEO_ORDERING = ('order', '-created_at', '-pk')
+
+
+def video_queryset():
+    from content.remote_images import VIDEO_THUMBNAIL_SPECS
+
+    VideoShort = apps.get_model('content', 'VideoShort')
+    return (
+        VideoShort.objects.select_related('thumbnail_image', 'remote_thumbnail__image')
+        .prefetch_related(rendition_prefetch('remote_thumbnail__image', VIDEO_THUMBNAIL_SPECS))
+        .order_by(*VIDEO_ORDERING)
+    )
+
+
+def encode_video_cursor(video):
+    """Codifica a posição ``(order, created_at, pk)`` de um vídeo em texto opaco."""
+    raw = f'{video.order}|{video.created_at.isoformat()}|{video.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_video_cursor(cursor):
+    """
+    Decodifica um cursor gerado por ``encode_video_cursor``.
+
+    Raises:
+        InvalidCursor: Se o cursor não puder ser interpretado
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        order_part, date_part, pk_part = raw.split('|')
+        order = int(order_part)
+        created_at = datetime.fromisoformat(date_part)
+        pk = int(pk_part)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if timezone.is_naive(created_at):
+        raise InvalidCursor(cursor)
+    return order, created_at, pk
+
+
+def load_featured_videos(limit=FEATURED_VIDEOS_LIMIT):
+    return list(video_queryset().filter(is_featured=True)[:limit])
+
+
+def get_featured_videos():
+    """Vídeos destacados exibidos na home (cacheado)."""
+    return get_navigation_data(FEATURED_VIDEOS, load_featured_videos)
+
+
+def load_video_page(position=None, page_size=VIDEOS_PAGE_SIZE):
+    """
+    Vídeos seguintes a ``position`` (``(order, created_at, pk)``) na ordem editorial.
+
+    Returns:
+        tuple: (lista de ``VideoShort``, cursor da próxima página ou '')
+    """
+    queryset = video_queryset()
+    if position is not None:
+        order, created_at, pk = position
+        queryset = queryset.filter(
+            Q(order__gt=order)
+            | Q(order=order, created_at__lt=created_at)
+            | Q(order=order, created_at=created_at, pk__lt=pk)
+        )
+    videos = list(queryset[:page_size + 1])
+    next_cursor = ''
+    if len(videos) > page_size:
+        del videos[page_size:]
+        next_cursor = encode_video_cursor(videos[-1])
+    return videos, next_cursor
+
+
+def build_video_page(cursor=''):
+    """
+    Página da grade de vídeos seguinte ao ``cursor``; sem cursor, a primeira
+    página, servida do cache.
+
+    Raises:
+        InvalidCursor: Se o cursor for inválido
+    """
+    if not cursor:
+        return get_navigation_data(VIDEOS_FIRST_PAGE, load_video_page)
+    return load_video_page(decode_video_cursor(cursor))
@@ -1,3 +1,122 @@
-from django.shortcuts import render
+"""Views auxiliares do aplicativo de conteúdo (fragmentos carregados via JavaScript)."""
 
-# Create your views here.
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.template.loader import render_to_string
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+from wagtail.models import Page
+
+from content.listings import InvalidCursor
+from content.models import ArticleListingMixin, ArticlePage, VideosPage
+from content.navigation import get_site_customization
+
+
+@require_GET
+def article_listing_fragment(request, page_id):
+    """
+    Devolve os próximos cards de artigos de uma página de listagem.
+
+    Usado pelo botão "Carregar mais" / rolagem infinita do ``main.js``. O
+    cursor da página seguinte volta no cabeçalho ``X-Next-Cursor`` (vazio
+    quando não há mais artigos).
+    """
+    page = get_object_or_404(Page, id=page_id, live=True).specific
+    if not isinstance(page, ArticleListingMixin):
+        raise Http404('Página sem listagem de artigos')
+
+    cursor = request.GET.get('cursor', '')
+    try:
+        context = page.get_listing_page_context(
+            request, cursor, get_site_customization(request)
+        )
+    except InvalidCursor:
+        return HttpResponseBadRequest('Cursor de paginação inválido.')
+
+    response = render(request, page.listing_cards_template, context)
+    response['X-Next-Cursor'] = context['next_cursor']
+    return response
+
+
+@require_GET
+def video_listing_fragment(request, page_id):
+    """
+    Devolve os próximos vídeos da grade de uma ``VideosPage``.
+
+    Mesmo contrato de ``article_listing_fragment``: o cursor da página
+    seguinte volta no cabeçalho ``X-Next-Cursor``.
+    """
+    from content.videos import build_video_page
+
+    get_object_or_404(VideosPage, id=page_id, live=True)
+
+    cursor = request.GET.get('cursor', '')
+    if not cursor:
+        return HttpResponseBadRequest('Cursor de paginação inválido.')
+    try:
+        videos, next_cursor = build_video_page(cursor)
+    except InvalidCursor:
+        return HttpResponseBadRequest('Cursor de paginação inválido.')
+
+    response = render(request, 'content/partials/video_cards.html', {'videos': videos})
+    response['X-Next-Cursor'] = next_cursor
+    return response
+
+
+# Trechos pessoais do cabeçalho, presentes em todas as páginas
+READER_SLOT_TEMPLATES = {
+    'account': 'header_account.html',
+    'logout': 'header_logout.html',
+}
+
+
+@never_cache
+@require_GET
+def article_reader_fragment(request, page_id):
+    """
+    Parte pessoal de um artigo, aplicada pelo ``main.js`` sobre o shell
+    cacheado (ver ``content.page_cache.serve_shell``).
+
+    Devolve JSON com o HTML de cada ``data-reader-slot`` a trocar: a conta e
+    o botão de saída do cabeçalho e, para assinantes de artigos premium, o
+    corpo completo no lugar da prévia do paywall. É a única requisição do
+    artigo que passa pela sessão e pela autenticação.
+    """
+    from content.page_cache import paywall_state
+
+    # O corpo só é lido para assinantes (uma consulta a mais, pelos campos adiados)
+    article = get_object_or_404(
+        ArticlePage.objects.live().defer('content_blocks', 'body', 'rendered_body', 'rendered_preview'),
+        pk=page_id,
+    )
+    for restriction in article.get_view_restrictions():
+        if not restriction.accept_request(request):
+            raise Http404('Artigo restrito')
+
+    state = paywall_state(request)
+    slots = {
+        name: render_to_string(template_name, request=request)
+        for name, template_name in READER_SLOT_TEMPLATES.items()
+    }
+    if article.is_premium and state == 'subscriber':
+        slots['article-body'] = render_to_string(
+            'content/partials/article_premium_body.html', {'page': article}, request=request
+        )
+    return JsonResponse({'authenticated': state != 'anonymous', 'slots': slots})
+
+
+def serve_document(request, document_id, document_filename):
+    """
+    ``wagtaildocs_serve`` com suporte a ``Range`` (ver ``content.document_serving``).
+
+    Mantém a view do Wagtail (restrições, hooks, ETag) e reduz a resposta ao
+    trecho pedido.
+    """
+    from wagtail.documents.views.serve import serve
+    from content.document_serving import partial_response
+
+    response = serve(request, document_id, document_filename)
+    # wagtail.utils.sendfile grava "None" quando o arquivo não tem codificação
+    if response.get('Content-Encoding') == 'None':
+        del response['Content-Encoding']
+    return partial_response(request, response)
@@ -45,8 +45,13 @@ def customize_main_menu(request, menu_items):
     # )
     pass
 
-@hooks.register('before_serve_page')
-def set_custom_cache_control(page, request, serve_args, serve_kwargs):
-    """Define controle de cache customizado para páginas"""
-    # Isso pode ser usado para otimizar o desempenho
-    pass
+# Ordem alta: roda depois da checagem de restrições de acesso do Wagtail
+@hooks.register('on_serve_page', order=100)
+def serve_from_page_cache(next_serve):
+    """Serve páginas públicas do cache de página inteira (ver content.page_cache)"""
+    from content.page_cache import serve_cached
+
+    def inner(page, request, serve_args, serve_kwargs):
+        return serve_cached(next_serve, page, request, serve_args, serve_kwargs)
+
+    return inner
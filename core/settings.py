@@ -62,6 +62,8 @@ INSTALLED_APPS = [
 
     'modelcluster',
     'taggit',
+    'django_tasks',
+    'django_tasks.backends.database',
 
     'django.contrib.admin',
     'django.contrib.auth',
@@ -112,6 +114,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'content.context_processors.home_page_settings',  # Custom context processor for HomePage settings
+                'content.context_processors.brasilia_now',
             ],
         },
     },
@@ -146,6 +149,69 @@ else:
     }
 
 
+# Cache
+# Em arquivo, em CACHE_DIR: o cache de página, a navegação e as invalidações
+# precisam ser vistos por todos os processos do servidor. A memória local de
+# cada processo só é aceita em desenvolvimento.
+CACHE_DIR = os.getenv('CACHE_DIR')
+if CACHE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+        }
+    }
+elif DEBUG:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'portal-analise',
+        }
+    }
+else:
+    raise ImproperlyConfigured(
+        'Defina CACHE_DIR em produção: o cache precisa ser compartilhado entre os workers.'
+    )
+
+# Tarefas em segundo plano (ex.: renditions ao publicar): enfileiradas no
+# banco depois do commit e executadas pelo ``manage.py db_worker``, fora dos
+# workers web
+TASKS = {
+    'default': {
+        'BACKEND': os.getenv('TASKS_BACKEND', 'django_tasks.backends.database.DatabaseBackend'),
+    }
+}
+
+# Intervalo, em segundos, da varredura recorrente de "Em Alta" (tarefa
+# content.listings.sweep_trending, agendada pelo comando expire_trending)
+TRENDING_SWEEP_INTERVAL = int(os.getenv('TRENDING_SWEEP_INTERVAL', '300'))
+
+# Cache de página inteira para leitores anônimos, em segundos (0 desativa)
+PAGE_CACHE_TIMEOUT = int(os.getenv('PAGE_CACHE_TIMEOUT', '300'))
+
+# Prévia do paywall: primeiros blocos do artigo e total de palavras exibidas
+PAYWALL_PREVIEW_BLOCKS = int(os.getenv('PAYWALL_PREVIEW_BLOCKS', '2'))
+PAYWALL_PREVIEW_WORDS = int(os.getenv('PAYWALL_PREVIEW_WORDS', '60'))
+
+# Cópia local de imagens externas (content.remote_images)
+REMOTE_IMAGE_FETCHER = os.getenv('REMOTE_IMAGE_FETCHER', 'content.remote_images.urllib_fetcher')
+REMOTE_IMAGE_TIMEOUT = int(os.getenv('REMOTE_IMAGE_TIMEOUT', '10'))
+REMOTE_IMAGE_MAX_BYTES = int(os.getenv('REMOTE_IMAGE_MAX_BYTES', str(10 * 1024 * 1024)))
+REMOTE_IMAGE_RETRY_AFTER = int(os.getenv('REMOTE_IMAGE_RETRY_AFTER', '3600'))
+
+# Conversão dos GIFs do corpo dos artigos (content.gif_transcoding)
+GIF_WEBP_QUALITY = int(os.getenv('GIF_WEBP_QUALITY', '75'))
+GIF_FFMPEG_BINARY = os.getenv('GIF_FFMPEG_BINARY', 'ffmpeg')
+GIF_TRANSCODE_TIMEOUT = int(os.getenv('GIF_TRANSCODE_TIMEOUT', '120'))
+
+# Entrega de documentos (content.document_serving). Atrás do nginx use
+# DOCUMENT_SENDFILE_HEADER=X-Accel-Redirect e uma "location /protected-media/
+# { internal; alias <MEDIA_ROOT>/; }"; sem proxy, o Gunicorn envia com sendfile
+SENDFILE_BACKEND = 'content.document_serving'
+DOCUMENT_SENDFILE_HEADER = os.getenv('DOCUMENT_SENDFILE_HEADER', '')
+DOCUMENT_SENDFILE_URL = os.getenv('DOCUMENT_SENDFILE_URL', '/protected-media/')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -221,6 +287,9 @@ LOGOUT_REDIRECT_URL = '/'
 # Custom authentication backends - allows login with email only
 AUTHENTICATION_BACKENDS = [
     'accounts.backends.EmailAuthenticationBackend',
+    'accounts.backends.UsernameAuthenticationBackend',
+    # Sessões abertas antes do UsernameAuthenticationBackend guardam este caminho;
+    # os logins por nome de usuário são atendidos antes, pelo backend acima
     'django.contrib.auth.backends.ModelBackend',
 ]
 
@@ -1,6 +1,6 @@
 # Em core/urls.py
 
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -9,12 +9,17 @@ from wagtail.admin import urls as wagtailadmin_urls
 from wagtail import urls as wagtail_urls
 from wagtail.documents import urls as wagtaildocs_urls
 
+from content.views import serve_document
+
 urlpatterns = [
     path('django-admin/', admin.site.urls),
     path('admin/', include(wagtailadmin_urls)),
+    # Mesma URL de wagtaildocs_serve, com suporte a Range
+    re_path(r'^documents/(\d+)/(.*)$', serve_document),
     path('documents/', include(wagtaildocs_urls)),
     path('accounts/', include('accounts.urls')),
     path('accounts/', include('django.contrib.auth.urls')),
+    path('fragmentos/', include('content.urls')),
     path('', include(wagtail_urls)),
 ]
 
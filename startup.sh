@@ -3,6 +3,10 @@
 
 echo "===== Iniciando aplicação Django/Wagtail ====="
 
+# Cache compartilhado pelos workers do Gunicorn (cache de página e invalidações)
+export CACHE_DIR="${CACHE_DIR:-/home/cache/portal-analise}"
+mkdir -p "$CACHE_DIR"
+
 # Instalar/atualizar dependências
 echo "Instalando dependências..."
 pip install -r requirements.txt --quiet
@@ -11,12 +15,24 @@ pip install -r requirements.txt --quiet
 echo "Executando migrações do banco de dados..."
 python manage.py migrate --noinput
 
+# Gerar as fontes auto-hospedadas (só baixa as que faltam)
+echo "Gerando fontes..."
+python manage.py build_fonts
+
 # Coletar arquivos estáticos
 echo "Coletando arquivos estáticos..."
 python manage.py collectstatic --noinput
 
+# Expira "Em Alta" e agenda a varredura recorrente (tarefa sweep_trending)
+echo "Agendando a varredura de \"Em Alta\"..."
+python manage.py expire_trending
+
 echo "===== Inicialização concluída ====="
 
+# Worker das tarefas em segundo plano (fila no banco, ver TASKS em core/settings.py)
+echo "Iniciando worker de tarefas..."
+python manage.py db_worker &
+
 # Iniciar Gunicorn
 echo "Iniciando Gunicorn..."
 gunicorn core.wsgi --bind=0.0.0.0:8000 --timeout 600 --workers 4 --log-file -
@@ -113,8 +113,8 @@ function initLazyLoading() {
 }
 
 // Article Card Hover Effects Enhancement
-function enhanceArticleCards() {
-    const cards = document.querySelectorAll('.article-card');
+function enhanceArticleCards(root = document) {
+    const cards = root.querySelectorAll('.article-card');
     
     cards.forEach(card => {
         card.addEventListener('mouseenter', function() {
@@ -127,6 +127,116 @@ function enhanceArticleCards() {
     });
 }
 
+// "Carregar mais" / rolagem infinita nas listagens de artigos
+function initLoadMoreArticles() {
+    const buttons = document.querySelectorAll('.load-more-articles');
+
+    buttons.forEach((button) => {
+        const target = document.querySelector(button.dataset.target);
+        if (!target) {
+            return;
+        }
+
+        let loading = false;
+        let observer = null;
+
+        const finish = () => {
+            if (observer) {
+                observer.disconnect();
+            }
+            const wrapper = button.closest('.load-more-wrapper');
+            (wrapper || button).remove();
+        };
+
+        const loadNextPage = async () => {
+            const cursor = button.dataset.cursor;
+            if (loading || !cursor) {
+                return;
+            }
+
+            loading = true;
+            button.disabled = true;
+
+            try {
+                const url = new URL(button.dataset.url, window.location.origin);
+                url.searchParams.set('cursor', cursor);
+                const response = await fetch(url, {
+                    headers: { 'X-Requested-With': 'XMLHttpRequest' },
+                    credentials: 'same-origin'
+                });
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}`);
+                }
+
+                const template = document.createElement('template');
+                template.innerHTML = (await response.text()).trim();
+                enhanceArticleCards(template.content);
+                target.appendChild(template.content);
+
+                const nextCursor = response.headers.get('X-Next-Cursor') || '';
+                if (nextCursor) {
+                    button.dataset.cursor = nextCursor;
+                } else {
+                    finish();
+                }
+            } catch (error) {
+                console.error('Não foi possível carregar mais artigos.', error);
+                showToast('Não foi possível carregar mais artigos.', 'error');
+            } finally {
+                loading = false;
+                button.disabled = false;
+            }
+        };
+
+        button.addEventListener('click', loadNextPage);
+
+        if ('IntersectionObserver' in window) {
+            observer = new IntersectionObserver((entries) => {
+                if (entries.some((entry) => entry.isIntersecting)) {
+                    loadNextPage();
+                }
+            }, { rootMargin: '400px 0px' });
+            observer.observe(button);
+        }
+    });
+}
+
+// Parte pessoal dos artigos: o HTML da página é o mesmo para todos os leitores
+// (cacheável); conta, botão de saída e corpo para assinantes vêm do fragmento do leitor
+async function initArticleReader() {
+    const article = document.querySelector('[data-reader-url]');
+    if (!article) {
+        return;
+    }
+
+    try {
+        const response = await fetch(article.dataset.readerUrl, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            credentials: 'same-origin'
+        });
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+
+        const reader = await response.json();
+        Object.entries(reader.slots || {}).forEach(([name, html]) => {
+            document.querySelectorAll(`[data-reader-slot="${name}"]`).forEach((slot) => {
+                slot.innerHTML = html;
+            });
+        });
+        if (reader.authenticated) {
+            document.querySelectorAll('[data-anonymous-only]').forEach((element) => element.remove());
+        }
+        if (reader.slots && reader.slots['article-body']) {
+            estimateReadingTime();
+            enhanceStaticVideoPlayers();
+            adjustArticleVideoEmbeds();
+        }
+    } catch (error) {
+        console.error('Não foi possível carregar os dados do leitor.', error);
+    }
+}
+
 // Newsletter Form Handler
 function initNewsletterForm() {
     const newsletterForm = document.querySelector('.footer-newsletter form');
@@ -350,6 +460,81 @@ function withAutoplay(url) {
     return `${url}${separator}${autoplayParams}`;
 }
 
+// Plyr (CSS + JS, ~100 KB) só é baixado quando algum player vai ser usado
+const PLYR_CDN_URL = 'https://cdn.jsdelivr.net/npm/plyr@3.7.8/dist/';
+let plyrPromise = null;
+
+function loadPlyr() {
+    if (typeof Plyr !== 'undefined') {
+        return Promise.resolve(true);
+    }
+    if (!plyrPromise) {
+        plyrPromise = new Promise((resolve) => {
+            const stylesheet = document.createElement('link');
+            stylesheet.rel = 'stylesheet';
+            stylesheet.href = `${PLYR_CDN_URL}plyr.css`;
+            document.head.appendChild(stylesheet);
+
+            const script = document.createElement('script');
+            script.src = `${PLYR_CDN_URL}plyr.polyfilled.min.js`;
+            script.async = true;
+            script.onload = () => resolve(typeof Plyr !== 'undefined');
+            script.onerror = () => resolve(false);
+            document.head.appendChild(script);
+        });
+    }
+    return plyrPromise;
+}
+
+// Vídeos do corpo dos artigos: pôster + play (video_facade); o iframe da plataforma só entra no clique
+function initVideoFacades() {
+    const preconnected = new Set();
+
+    const preconnect = (facade) => {
+        let origin;
+        try {
+            origin = new URL(facade.dataset.embedUrl).origin;
+        } catch (error) {
+            return;
+        }
+        if (preconnected.has(origin)) {
+            return;
+        }
+        preconnected.add(origin);
+        const link = document.createElement('link');
+        link.rel = 'preconnect';
+        link.href = origin;
+        document.head.appendChild(link);
+    };
+
+    const activate = (facade) => {
+        const iframe = document.createElement('iframe');
+        iframe.src = withAutoplay(facade.dataset.embedUrl);
+        iframe.title = 'Player de vídeo';
+        iframe.allow = 'accelerometer; autoplay; encrypted-media; fullscreen; gyroscope; picture-in-picture';
+        iframe.allowFullscreen = true;
+        iframe.referrerPolicy = 'strict-origin-when-cross-origin';
+        facade.replaceChildren(iframe);
+        facade.classList.add('video-facade--active');
+        delete facade.dataset.videoFacade;
+        iframe.focus();
+    };
+
+    document.addEventListener('pointerover', (event) => {
+        const facade = event.target.closest && event.target.closest('[data-video-facade]');
+        if (facade) {
+            preconnect(facade);
+        }
+    });
+    document.addEventListener('click', (event) => {
+        const facade = event.target.closest('[data-video-facade]');
+        if (facade && facade.dataset.embedUrl) {
+            event.preventDefault();
+            activate(facade);
+        }
+    });
+}
+
 function extractPlyrConfig(embedUrl) {
     if (!embedUrl) {
         return null;
@@ -449,6 +634,8 @@ function initShortVideoModal() {
     const descriptionEl = modalEl.querySelector('.video-modal-description');
     const modalTitleEl = modalEl.querySelector('.modal-title');
     let plyrInstance = null;
+    // Descarta o carregamento do Plyr de um modal já fechado ou trocado
+    let openCount = 0;
 
     const destroyPlayer = () => {
         if (plyrInstance && typeof plyrInstance.destroy === 'function') {
@@ -535,8 +722,8 @@ function initShortVideoModal() {
         }
     };
 
-    const renderEmbedWithPlyr = (embedUrl, ratio = '9:16') => {
-        const config = extractPlyrConfig(embedUrl);
+    const renderEmbedWithPlyr = (embedUrl, ratio = '9:16', serverConfig = null) => {
+        const config = serverConfig || extractPlyrConfig(embedUrl);
         if (config && typeof Plyr !== 'undefined') {
             modalWrapper.innerHTML = `
                 <div id="short-modal-player"
@@ -579,7 +766,16 @@ function initShortVideoModal() {
         modalWrapper.dataset.activeAspect = aspectRatio;
 
         renderLoader();
+        bootstrap.Modal.getOrCreateInstance(modalEl).show();
+        const openToken = ++openCount;
+        loadPlyr().then(() => {
+            if (openToken === openCount) {
+                renderSource(card, aspectRatio);
+            }
+        });
+    };
 
+    const renderSource = (card, aspectRatio) => {
         const sourceType = card.dataset.source;
         const cdnUrl = card.dataset.videoUrl;
         const platformUrl = card.dataset.platformUrl;
@@ -590,6 +786,10 @@ function initShortVideoModal() {
         const title = card.dataset.title || 'Vídeo';
         const description = card.dataset.description || '';
         const poster = card.dataset.thumbnail || card.querySelector('img')?.src || '';
+        // Provedor e id já reconhecidos no servidor (VideoShort.video_provider / video_id)
+        const serverConfig = card.dataset.provider && card.dataset.videoId
+            ? { provider: card.dataset.provider, id: card.dataset.videoId }
+            : null;
 
         if (modalTitleEl) {
             modalTitleEl.textContent = title;
@@ -615,7 +815,7 @@ function initShortVideoModal() {
             `;
             initializePlyr('#short-modal-player', { ratio: aspectRatio, autoplay: true });
         } else if (platformEmbedUrl) {
-            if (!renderEmbedWithPlyr(platformEmbedUrl, aspectRatio)) {
+            if (!renderEmbedWithPlyr(platformEmbedUrl, aspectRatio, serverConfig)) {
                 const autoplayEmbed = withAutoplay(platformEmbedUrl);
                 modalWrapper.innerHTML = `
                     <iframe src="${autoplayEmbed}" class="video-modal-iframe" allowfullscreen
@@ -654,21 +854,25 @@ function initShortVideoModal() {
         } else {
             modalWrapper.innerHTML = '<p class="p-4 text-center text-muted">Não foi possível carregar o vídeo selecionado.</p>';
         }
-
-        bootstrap.Modal.getOrCreateInstance(modalEl).show();
     };
 
-    document.querySelectorAll('.video-short-card').forEach((card) => {
-        card.addEventListener('click', () => openModal(card));
-        card.addEventListener('keydown', (event) => {
-            if (event.key === 'Enter' || event.key === ' ') {
-                event.preventDefault();
-                openModal(card);
-            }
-        });
+    // Delegado no documento: vale também para os cards de "Carregar mais vídeos"
+    document.addEventListener('click', (event) => {
+        const card = event.target.closest('.video-short-card');
+        if (card) {
+            openModal(card);
+        }
+    });
+    document.addEventListener('keydown', (event) => {
+        const card = event.target.closest && event.target.closest('.video-short-card');
+        if (card && (event.key === 'Enter' || event.key === ' ')) {
+            event.preventDefault();
+            openModal(card);
+        }
     });
 
     modalEl.addEventListener('hidden.bs.modal', () => {
+        openCount += 1;
         renderLoader();
         if (descriptionEl) {
             descriptionEl.textContent = '';
@@ -690,65 +894,80 @@ function initShortVideoModal() {
 }
 
 function enhanceStaticVideoPlayers() {
-    if (typeof Plyr === 'undefined') {
+    const targets = document.querySelectorAll('.hero-video-player, .custom-video-player');
+    if (!targets.length) {
         return;
     }
 
-    const targets = document.querySelectorAll('.hero-video-player, .custom-video-player');
+    // Os <video> já funcionam com os controles nativos; o Plyr só é baixado
+    // quando algum deles se aproxima da área visível
+    if (!('IntersectionObserver' in window)) {
+        loadPlyr().then((loaded) => loaded && targets.forEach(enhanceVideoPlayer));
+        return;
+    }
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                loadPlyr().then((loaded) => loaded && enhanceVideoPlayer(entry.target));
+            }
+        });
+    }, { rootMargin: '200px 0px' });
+    targets.forEach((videoEl) => observer.observe(videoEl));
+}
 
-    targets.forEach((videoEl) => {
-        if (!(videoEl instanceof HTMLVideoElement) || videoEl.dataset.plyrInitialized === 'true') {
-            return;
-        }
+function enhanceVideoPlayer(videoEl) {
+    if (!(videoEl instanceof HTMLVideoElement) || videoEl.dataset.plyrInitialized === 'true') {
+        return;
+    }
 
-        const ratio = getAspectRatioFromElement(videoEl, '16:9');
+    const ratio = getAspectRatioFromElement(videoEl, '16:9');
 
-        try {
-            const instance = new Plyr(videoEl, {
-                controls: [
-                    'play-large',
-                    'play',
-                    'progress',
-                    'current-time',
-                    'mute',
-                    'volume',
-                    'settings',
-                    'pip',
-                    'airplay',
-                    'fullscreen'
-                ],
-                ratio,
-                tooltips: {
-                    controls: true
-                },
-                storage: {
-                    enabled: false
-                },
-                youtube: {
-                    rel: 0,
-                    modestbranding: 1,
-                    playsinline: 1
-                },
-                vimeo: {
-                    byline: false,
-                    portrait: false,
-                    title: false
-                }
-            });
+    try {
+        const instance = new Plyr(videoEl, {
+            controls: [
+                'play-large',
+                'play',
+                'progress',
+                'current-time',
+                'mute',
+                'volume',
+                'settings',
+                'pip',
+                'airplay',
+                'fullscreen'
+            ],
+            ratio,
+            tooltips: {
+                controls: true
+            },
+            storage: {
+                enabled: false
+            },
+            youtube: {
+                rel: 0,
+                modestbranding: 1,
+                playsinline: 1
+            },
+            vimeo: {
+                byline: false,
+                portrait: false,
+                title: false
+            }
+        });
 
-            videoEl.dataset.plyrInitialized = 'true';
+        videoEl.dataset.plyrInitialized = 'true';
 
-            videoEl.addEventListener('ended', () => {
-                try {
-                    instance.stop();
-                } catch (error) {
-                    console.warn('Não foi possível resetar o player após o término do vídeo.', error);
-                }
-            });
-        } catch (error) {
-            console.error('Falha ao aprimorar player de vídeo.', error);
-        }
-    });
+        videoEl.addEventListener('ended', () => {
+            try {
+                instance.stop();
+            } catch (error) {
+                console.warn('Não foi possível resetar o player após o término do vídeo.', error);
+            }
+        });
+    } catch (error) {
+        console.error('Falha ao aprimorar player de vídeo.', error);
+    }
 }
 
 function adjustArticleVideoEmbeds() {
@@ -857,10 +1076,13 @@ document.addEventListener('DOMContentLoaded', function() {
     estimateReadingTime();
     initLazyLoading();
     enhanceArticleCards();
+    initLoadMoreArticles();
+    initArticleReader();
     initNewsletterForm();
     initShareButtons();
     initDarkMode();
     initShortVideoModal();
+    initVideoFacades();
     enhanceStaticVideoPlayers();
     adjustArticleVideoEmbeds();
     deferResources();